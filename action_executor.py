@@ -0,0 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ActionExecutor:
+    """키 입력, 명령 실행 같은 제스처 동작을 작업 스레드 풀에서 비동기로 실행
+
+    max_workers=0 이면 호출한 스레드에서 바로 실행 (리플레이처럼 결정적인 순서가 필요할 때)
+    """
+
+    def __init__(self, max_workers=2, on_error=None):
+        self.on_error = on_error
+        self.pool = None
+        if max_workers > 0:
+            self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gesture-action")
+
+    def submit(self, func, *args):
+        if self.pool is None:
+            try:
+                func(*args)
+            except Exception as e:
+                self._report(e)
+            return
+        future = self.pool.submit(func, *args)
+        future.add_done_callback(self._done)
+
+    def _done(self, future):
+        error = future.exception()
+        if error is not None:
+            self._report(error)
+
+    def _report(self, error):
+        if self.on_error is not None:
+            self.on_error(error)
+        else:
+            print("동작 실행 중 에러:", error)
+
+    def shutdown(self, wait=False):
+        if self.pool is not None:
+            self.pool.shutdown(wait=wait, cancel_futures=True)
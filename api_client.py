@@ -0,0 +1,121 @@
+import os
+import queue
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+SERVER_IP = "123.45.67.89"  # 실제 서버 IP 또는 도메인
+SERVER_PORT = 8080
+# 모든 요청이 같은 주소를 쓰도록 한 곳에서만 정함 (환경 변수로 바꿀 수 있음)
+BASE_URL = os.environ.get("GESTURE_API_URL", f"http://{SERVER_IP}:{SERVER_PORT}/api")
+
+
+class ApiError(Exception):
+    """서버에 연결하지 못했거나 응답을 해석할 수 없음"""
+
+
+class ApiClient:
+    """keep-alive 세션 하나로 API 를 호출하는 클라이언트
+
+    연결 실패는 모든 요청을, 502/503/504 응답은 GET 만 지수 백오프로 재시도함
+    (POST 는 서버에 도착한 뒤 실패했을 수 있으므로 회원가입 중복 등을 막기 위해 재시도하지 않음.
+     urllib3 는 연결 실패 재시도에는 allowed_methods 를 보지 않으므로 POST 도 연결 실패만 재시도됨)
+    """
+
+    def __init__(self, base_url=BASE_URL, timeout=(3.05, 10.0), retries=2, backoff=0.3):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=retries,
+            backoff_factor=backoff,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=4)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method, path, **kwargs):
+        """(상태 코드, JSON 본문, 응답 헤더). 실패 응답도 본문이 JSON 이면 그대로 돌려줌"""
+        kwargs.setdefault("timeout", self.timeout)
+        try:
+            response = self.session.request(method, f"{self.base_url}{path}", **kwargs)
+        except requests.exceptions.RequestException as e:
+            raise ApiError(f"서버 연결 실패: {e}") from e
+        if response.status_code == 304:
+            return response.status_code, None, response.headers
+        try:
+            data = response.json()
+        except ValueError as e:
+            raise ApiError(f"잘못된 서버 응답 ({response.status_code})") from e
+        return response.status_code, data, response.headers
+
+    def login(self, user_id, password):
+        return self.request("POST", "/login", json={"username": user_id, "password": password})[1]
+
+    def register(self, user):
+        return self.request("POST", "/register", json=user)[1]
+
+    def get_settings(self, user_id, etag=None):
+        """(설정 dict 또는 None, ETag). 서버 설정이 etag 와 같으면 설정은 None"""
+        headers = {"If-None-Match": etag} if etag else None
+        status, data, headers = self.request("GET", f"/settings/{user_id}", headers=headers)
+        if status == 304:
+            return None, etag
+        if status != 200:
+            raise ApiError((data or {}).get("message", f"설정 조회 실패 ({status})"))
+        return data["settings"], headers.get("ETag")
+
+    def save_settings(self, user_id, fields):
+        status, data, _ = self.request("POST", f"/settings/{user_id}", json=fields)
+        if status != 200:
+            raise ApiError((data or {}).get("message", f"설정 저장 실패 ({status})"))
+        return data
+
+    def close(self):
+        self.session.close()
+
+
+class TkApiWorker:
+    """API 호출을 백그라운드 스레드에서 실행하고 결과 콜백은 Tk 메인 루프에서 호출
+
+    Tk 위젯은 메인 스레드에서만 건드려야 하므로 결과는 큐에 넣고 after() 로 꺼냄
+    """
+
+    def __init__(self, root, poll_ms=50):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._requests = queue.Queue()
+        self._results = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="api-worker", daemon=True)
+        self._thread.start()
+        self.root.after(self.poll_ms, self._poll)
+
+    def submit(self, fn, *args, on_success=None, on_error=None):
+        self._requests.put((fn, args, on_success, on_error))
+
+    def _run(self):
+        while True:
+            fn, args, on_success, on_error = self._requests.get()
+            try:
+                result = fn(*args)
+            except Exception as e:
+                self._results.put((on_error, e))
+            else:
+                self._results.put((on_success, result))
+
+    def _poll(self):
+        while True:
+            try:
+                callback, value = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if callback is not None:
+                callback(value)
+        self.root.after(self.poll_ms, self._poll)
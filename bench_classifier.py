@@ -0,0 +1,107 @@
+import argparse
+import json
+import time
+import numpy as np
+from gesture_model import CLASSES, GestureModel, load_dataset, rule_labels
+
+
+def rotate(landmarks, angles):
+    """손목(0)을 중심으로 화면 평면에서 프레임마다 angles (라디안) 만큼 회전"""
+    lm = np.array(landmarks, dtype=np.float32)
+    cos = np.cos(angles)[:, None]
+    sin = np.sin(angles)[:, None]
+    x = lm[..., 0] - lm[:, :1, 0]
+    y = lm[..., 1] - lm[:, :1, 1]
+    lm[..., 0] = lm[:, :1, 0] + cos * x - sin * y
+    lm[..., 1] = lm[:, :1, 1] + sin * x + cos * y
+    return lm
+
+
+def time_per_frame(fn, landmarks, repeat):
+    """한 프레임씩 호출했을 때 프레임당 시간 (us)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for lm in landmarks:
+            fn(lm)
+    return (time.perf_counter() - start) / (repeat * len(landmarks)) * 1e6
+
+
+def time_batch(fn, landmarks, repeat):
+    """전체를 한 번에 넘겼을 때 프레임당 시간 (us)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(landmarks)
+    return (time.perf_counter() - start) / (repeat * len(landmarks)) * 1e6
+
+
+def match_rate(predicted, labels, mask):
+    """mask 프레임에서 예측이 라벨과 같은 비율. 해당 프레임이 없으면 None"""
+    return float((predicted[mask] == labels[mask]).mean()) if mask.any() else None
+
+
+def percent(value):
+    return f"{value * 100:.1f}%" if value is not None else "-"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="학습한 포즈 분류 모델과 기존 규칙의 지연 시간 / 라벨 일치 비교 "
+                    "(정확도는 path=라벨 로 직접 라벨을 붙인 녹화에서만 계산)"
+    )
+    parser.add_argument("sessions", nargs="+", help="녹화 파일 (path 또는 path=라벨, gesture_model.py 와 같은 형식)")
+    parser.add_argument("--model", default="gesture_model.npz", help="gesture_model.py 로 학습한 모델")
+    parser.add_argument("--rotate", type=float, default=30.0, help="회전 시험에서 손을 돌릴 최대 각도 (도)")
+    parser.add_argument("--repeat", type=int, default=5, help="지연 시간 측정 반복 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON 으로 저장")
+    args = parser.parse_args()
+
+    model = GestureModel.load(args.model)
+    landmarks, labels, annotated = load_dataset(args.sessions)
+    if len(labels) == 0:
+        parser.error("손이 검출된 프레임이 없습니다")
+
+    rng = np.random.default_rng(args.seed)
+    angles = np.radians(rng.uniform(-args.rotate, args.rotate, len(labels)))
+    rotated = rotate(landmarks, angles)
+    classifiers = {"rules": rule_labels, "model": model.predict}
+
+    # 규칙으로 붙인 라벨은 규칙 자체의 출력이라 정확도가 아님: 직접 라벨 프레임만 정확도, 나머지는 규칙 일치율
+    # (회전 후 일치율은 회전 전 프레임의 규칙 라벨과 비교하므로 규칙 자신에게도 의미가 있음)
+    rule_labelled = ~annotated
+    print(f"{len(labels)} 프레임 (직접 라벨 {int(annotated.sum())}), 회전 시험 ±{args.rotate:g}도")
+    print(f"{'':8}{'프레임당(us)':>14}{'묶음(us)':>12}{'정확도':>10}{'회전 후':>10}{'규칙 일치':>10}{'회전 후':>10}")
+    results = {}
+    for name, fn in classifiers.items():
+        predicted = fn(landmarks)
+        predicted_rotated = fn(rotated)
+        result = {
+            "per_frame_us": time_per_frame(fn, landmarks, args.repeat),
+            "batch_us": time_batch(fn, landmarks, args.repeat),
+            "accuracy": match_rate(predicted, labels, annotated),
+            "rotated_accuracy": match_rate(predicted_rotated, labels, annotated),
+            # 규칙 자신과의 일치율은 항상 100% 라서 모델만 기록
+            "rule_agreement": match_rate(predicted, labels, rule_labelled) if name != "rules" else None,
+            "rotated_rule_agreement": match_rate(predicted_rotated, labels, rule_labelled),
+        }
+        # 클래스별 회전 후 라벨 일치율 (어떤 포즈가 회전에 약한지)
+        result["rotated_by_class"] = {
+            CLASSES[c]: float((predicted_rotated[labels == c] == c).mean()) for c in np.unique(labels)
+        }
+        results[name] = result
+        print(f"{name:8}{result['per_frame_us']:>14.1f}{result['batch_us']:>12.2f}"
+              f"{percent(result['accuracy']):>10}{percent(result['rotated_accuracy']):>10}"
+              f"{percent(result['rule_agreement']):>10}{percent(result['rotated_rule_agreement']):>10}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "frames": int(len(labels)),
+                "annotated_frames": int(annotated.sum()),
+                "rotate_deg": args.rotate,
+                "results": results,
+            }, f, indent=4, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
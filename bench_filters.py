@@ -0,0 +1,73 @@
+import argparse
+import json
+import numpy as np
+from cursor_filter import FILTERS, DEFAULT_SENSITIVITY, make_filter
+from session_record import load_session
+
+
+def session_targets(records, screen_size):
+    """손이 검출된 프레임의 시각과 화면 좌표 목표 위치 (pointer_target 과 같은 계산)"""
+    valid = records["valid"] != 0
+    landmarks = np.asarray(records["landmarks"][valid], dtype=np.float64)
+    t = np.asarray(records["t"][valid], dtype=np.float64)
+    tip = landmarks[:, 8, :2]
+    base = landmarks[:, 5, :2]
+    target = (tip + (tip - base) * 2) * np.asarray(screen_size, dtype=np.float64)
+    return t, np.round(target)
+
+
+def run_filter(cursor_filter, t, target):
+    out = np.empty_like(target)
+    cursor_filter.reset(target[0, 0], target[0, 1])
+    for i in range(len(t)):
+        out[i] = cursor_filter.update(target[i, 0], target[i, 1], t[i])
+    return out
+
+
+def measure(t, target, out, lags=np.arange(-0.1, 0.3, 0.005)):
+    """떨림: 출력 2차 차분의 RMS (px)
+    지연: 출력과 가장 잘 맞는 원본 목표의 시간 이동량 (ms, 음수면 앞서감)
+    """
+    jitter = float(np.sqrt(np.mean(np.sum(np.diff(out, n=2, axis=0) ** 2, axis=1)))) if len(out) > 2 else 0.0
+    errors = []
+    for lag in lags:
+        shifted = np.column_stack([np.interp(t - lag, t, target[:, axis]) for axis in (0, 1)])
+        errors.append(np.sqrt(np.mean(np.sum((out - shifted) ** 2, axis=1))))
+    best = int(np.argmin(errors))
+    rmse = float(np.sqrt(np.mean(np.sum((out - target) ** 2, axis=1))))
+    return {"jitter_px": jitter, "lag_ms": float(lags[best] * 1000.0), "rmse_px": rmse}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화 세션으로 커서 필터별 떨림과 지연 비교")
+    parser.add_argument("sessions", nargs="+", help="main.py --record 로 만든 녹화 파일")
+    parser.add_argument("--sensitivity", type=float, default=DEFAULT_SENSITIVITY, help="감도 (0.1 ~ 0.5)")
+    parser.add_argument("--predict-ms", type=float, default=0.0, help="속도 기반 예측 시간")
+    parser.add_argument("--screen", default="1920x1080", help="화면 해상도 (예: 1920x1080)")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON 으로 저장")
+    args = parser.parse_args()
+
+    screen_size = tuple(int(v) for v in args.screen.split("x"))
+    results = {}
+    for path in args.sessions:
+        t, target = session_targets(load_session(path), screen_size)
+        if len(t) < 3:
+            print(f"{path}: 손이 검출된 프레임이 부족합니다")
+            continue
+
+        raw = measure(t, target, target)
+        print(f"{path} ({len(t)} 프레임) - 원본 떨림 {raw['jitter_px']:.2f}px")
+        results[path] = {"raw": raw}
+        for name in FILTERS:
+            cursor_filter = make_filter(name, args.sensitivity, args.predict_ms / 1000.0)
+            result = measure(t, target, run_filter(cursor_filter, t, target))
+            results[path][name] = result
+            print(f"  {name:9s} 떨림 {result['jitter_px']:7.2f}px  지연 {result['lag_ms']:6.1f}ms  오차 {result['rmse_px']:7.2f}px")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"sensitivity": args.sensitivity, "predict_ms": args.predict_ms, "results": results}, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
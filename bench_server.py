@@ -0,0 +1,347 @@
+import argparse
+import http.client
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import defaultdict
+from urllib.parse import urlsplit
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MIX = "login=2,get=6,get_etag=6,post=2,register=1"
+PROVISION_TOKEN = "bench"
+
+
+def parse_mix(text):
+    """'login=2,get=6' -> [(동작, 비율)]"""
+    mix = []
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"알 수 없는 요청 종류: {name} (사용 가능: {', '.join(OPERATIONS)})")
+        mix.append((name, float(weight or 1)))
+    return mix
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class ServerProcess:
+    """임시 SQLite DB 로 sever.py (개발 서버) 또는 gunicorn 을 띄움"""
+
+    def __init__(self, kind="dev", workers=2, threads=4):
+        self.kind = kind
+        self.workers = workers
+        self.threads = threads
+        self.port = free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.tmpdir = tempfile.mkdtemp(prefix="gesture-bench-")
+        self.process = None
+
+    def start(self, timeout=15.0):
+        env = dict(
+            os.environ,
+            PORT=str(self.port),
+            GESTURE_DB_PATH=os.path.join(self.tmpdir, "bench.db"),
+            PROVISION_TOKEN=PROVISION_TOKEN,
+        )
+        if self.kind == "gunicorn":
+            command = [
+                sys.executable, "-m", "gunicorn", "wsgi:app",
+                "--bind", f"127.0.0.1:{self.port}",
+                "--workers", str(self.workers),
+                "--threads", str(self.threads),
+            ]
+        else:
+            command = [sys.executable, "sever.py"]
+        self.process = subprocess.Popen(
+            command, cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"서버가 시작하지 못했습니다 (종료 코드 {self.process.returncode})")
+            try:
+                conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=1.0)
+                conn.request("GET", "/")
+                conn.getresponse().read()
+                conn.close()
+                return
+            except OSError:
+                time.sleep(0.1)
+        raise RuntimeError("서버 시작 대기 시간 초과")
+
+    def stop(self):
+        if self.process is not None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+
+class Client:
+    """스레드 하나가 쓰는 keep-alive HTTP 연결
+
+    rng 는 스레드마다 따로 두어야 시드를 줬을 때 요청 순서가 재현됨 (전역 random 을 공유하지 않음)
+    """
+
+    def __init__(self, url, users, timeout=10.0, rng=None):
+        parts = urlsplit(url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.timeout = timeout
+        self.users = users
+        self.rng = rng or random.Random()
+        self.etags = {}
+        self.conn = None
+
+    def request(self, method, path, body=None, headers=None):
+        headers = dict(headers or {})
+        payload = None
+        if body is not None:
+            payload = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+        for attempt in range(2):
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            try:
+                self.conn.request(method, path, payload, headers)
+                response = self.conn.getresponse()
+                data = response.read()
+                if response.getheader("Connection", "").lower() == "close":
+                    self.conn.close()
+                    self.conn = None
+                return response, data
+            except (http.client.HTTPException, OSError):
+                # 서버가 keep-alive 연결을 닫았으면 한 번만 다시 연결해서 재시도
+                self.conn.close()
+                self.conn = None
+                if attempt:
+                    raise
+
+    def login(self):
+        user = self.rng.choice(self.users)
+        response, _ = self.request("POST", "/api/login", {"username": user, "password": "bench"})
+        return response.status == 200
+
+    def register(self):
+        user = f"new-{uuid.uuid4().hex[:12]}"
+        response, _ = self.request("POST", "/api/register", {
+            "id": user, "name": "bench", "phone": "", "email": "", "password": "bench",
+        })
+        return response.status == 200
+
+    def get(self):
+        response, _ = self.request("GET", f"/api/settings/{self.rng.choice(self.users)}")
+        return response.status == 200
+
+    def get_etag(self):
+        """이전 응답의 ETag 로 조건부 조회 (변경 없으면 304)"""
+        user = self.rng.choice(self.users)
+        headers = {"If-None-Match": self.etags[user]} if user in self.etags else None
+        response, _ = self.request("GET", f"/api/settings/{user}", headers=headers)
+        etag = response.getheader("ETag")
+        if etag:
+            self.etags[user] = etag
+        return response.status in (200, 304)
+
+    def post(self):
+        user = self.rng.choice(self.users)
+        response, _ = self.request("POST", f"/api/settings/{user}", {"sensitivity": self.rng.randint(10, 50)})
+        return response.status == 200
+
+
+OPERATIONS = ("login", "register", "get", "get_etag", "post")
+
+
+def provision_users(url, count):
+    """측정용 사용자를 미리 만듦. 일괄 등록 API 가 없는 (이전 버전) 서버면 한 명씩 register"""
+    client = Client(url, [])
+    users = [f"bench-{i}" for i in range(count)]
+    response, data = client.request(
+        "POST", "/api/provision",
+        {"users": [{"id": user, "password": "bench"} for user in users]},
+        {"X-Provision-Token": PROVISION_TOKEN},
+    )
+    if response.status == 404:
+        for user in users:
+            response, data = client.request("POST", "/api/register", {
+                "id": user, "name": "bench", "phone": "", "email": "", "password": "bench",
+            })
+            # 같은 주소로 다시 측정하는 경우 이미 만든 사용자는 그대로 사용
+            if response.status != 200 and "이미 존재" not in data.decode("utf-8", "replace"):
+                raise RuntimeError(f"사용자 생성 실패: {response.status} {data[:200]!r}")
+    elif response.status != 200:
+        raise RuntimeError(f"사용자 생성 실패: {response.status} {data[:200]!r}")
+    return users
+
+
+def run_load(url, users, mix, concurrency, duration=None, total=None, seed=0):
+    """동시 연결 concurrency 개로 요청을 보내고 요청 종류별 지연 시간을 모음"""
+    names = [name for name, _ in mix]
+    weights = np.array([weight for _, weight in mix], dtype=np.float64)
+    weights /= weights.sum()
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    lock = threading.Lock()
+    remaining = [total]
+    start = time.perf_counter()
+    deadline = start + duration if duration else None
+
+    def take():
+        if deadline is not None:
+            return time.perf_counter() < deadline
+        with lock:
+            if remaining[0] <= 0:
+                return False
+            remaining[0] -= 1
+            return True
+
+    def worker(index):
+        rng = np.random.default_rng(seed + index)
+        client = Client(url, users, rng=random.Random(seed + index))
+        local = defaultdict(list)
+        local_errors = defaultdict(int)
+        while take():
+            name = names[rng.choice(len(names), p=weights)]
+            t0 = time.perf_counter()
+            try:
+                ok = getattr(client, name)()
+            except (http.client.HTTPException, OSError):
+                ok = False
+            local[name].append(time.perf_counter() - t0)
+            if not ok:
+                local_errors[name] += 1
+        with lock:
+            for name, values in local.items():
+                latencies[name].extend(values)
+            for name, count in local_errors.items():
+                errors[name] += count
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors, time.perf_counter() - start
+
+
+def summarize(latencies, errors, elapsed):
+    def stats(values, error_count):
+        ms = np.asarray(values) * 1000.0
+        return {
+            "count": len(values),
+            "errors": error_count,
+            "rps": len(values) / elapsed,
+            "p50_ms": float(np.percentile(ms, 50)),
+            "p90_ms": float(np.percentile(ms, 90)),
+            "p99_ms": float(np.percentile(ms, 99)),
+            "max_ms": float(ms.max()),
+        }
+
+    result = {name: stats(values, errors.get(name, 0)) for name, values in sorted(latencies.items())}
+    every = [v for values in latencies.values() for v in values]
+    if every:
+        result["total"] = stats(every, sum(errors.values()))
+    return result
+
+
+def print_summary(summary, baseline=None):
+    print(f"{'요청':10s} {'개수':>7s} {'오류':>5s} {'req/s':>9s} {'p50':>8s} {'p90':>8s} {'p99':>8s} {'max':>8s}")
+    for name, s in summary.items():
+        line = (
+            f"{name:10s} {s['count']:7d} {s['errors']:5d} {s['rps']:9.1f} "
+            f"{s['p50_ms']:7.2f}ms {s['p90_ms']:7.2f}ms {s['p99_ms']:7.2f}ms {s['max_ms']:7.2f}ms"
+        )
+        if baseline and name in baseline:
+            base = baseline[name]
+            line += f"  (req/s {s['rps'] / base['rps'] - 1:+.0%}, p99 {s['p99_ms'] - base['p99_ms']:+.2f}ms)"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 서버 부하 테스트 (임시 DB 로 서버를 띄워 측정)")
+    parser.add_argument("--server", default="dev", choices=["dev", "gunicorn"], help="띄울 서버 종류")
+    parser.add_argument(
+        "--url",
+        help="이미 실행 중인 서버 주소 (주면 서버를 띄우지 않음, PROVISION_TOKEN=bench 필요). "
+             "사용자 bench-* 생성과 post / register 요청이 그 서버의 DB 에 그대로 남으므로 --allow-writes 가 필요",
+    )
+    parser.add_argument(
+        "--allow-writes", action="store_true",
+        help="--url 서버의 DB 에 측정용 사용자 / 설정을 쓰는 것을 허용 (임시 DB 로 띄우는 기본 모드에서는 필요 없음)",
+    )
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn 워커 수")
+    parser.add_argument("--threads", type=int, default=4, help="gunicorn 워커당 스레드 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 연결 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument("--requests", type=int, help="총 요청 수 (주면 --duration 대신 사용)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"요청 비율 (기본: {DEFAULT_MIX})")
+    parser.add_argument("--users", type=int, default=200, help="미리 만들어 둘 사용자 수")
+    parser.add_argument("--seed", type=int, default=0, help="요청 순서 난수 시드")
+    parser.add_argument("--out", metavar="PATH", help="결과를 JSON 으로 저장")
+    parser.add_argument("--compare", metavar="PATH", help="이전 결과 JSON 과 비교")
+    args = parser.parse_args()
+
+    if args.url and not args.allow_writes:
+        parser.error("--url 서버에는 측정용 사용자와 설정이 영구히 저장됩니다. 테스트용 서버라면 --allow-writes 를 추가하세요")
+
+    mix = parse_mix(args.mix)
+    server = None
+    url = args.url
+    if url is None:
+        server = ServerProcess(args.server, args.workers, args.threads)
+        server.start()
+        url = server.url
+    try:
+        users = provision_users(url, args.users)
+        duration = None if args.requests else args.duration
+        latencies, errors, elapsed = run_load(url, users, mix, args.concurrency, duration, args.requests, args.seed)
+    finally:
+        if server is not None:
+            server.stop()
+
+    summary = summarize(latencies, errors, elapsed)
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["summary"]
+    print(f"{url} ({args.server if server else 'external'}), 동시 연결 {args.concurrency}, {elapsed:.1f}s")
+    print_summary(summary, baseline)
+
+    if args.out:
+        result = {
+            "created_at": time.time(),
+            "config": {
+                "server": args.server if server else "external",
+                "workers": args.workers,
+                "threads": args.threads,
+                "concurrency": args.concurrency,
+                "duration": args.duration,
+                "requests": args.requests,
+                "mix": args.mix,
+                "users": args.users,
+                "seed": args.seed,
+            },
+            "elapsed": elapsed,
+            "summary": summary,
+        }
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import time
+
+_PROCESS_START = time.perf_counter()
+
+import argparse
+import json
+import os
+import shlex
+import subprocess
+import sys
+import numpy as np
+
+
+def camera_source(value):
+    """숫자면 카메라 번호, 아니면 동영상 파일 경로"""
+    return int(value) if value.isdigit() else value
+
+
+def measure_child(camera):
+    """새 프로세스 안에서 시작 단계별 소요 시간을 측정 (초)"""
+    timings = {}
+    mark = time.perf_counter()
+
+    def lap(name):
+        nonlocal mark
+        now = time.perf_counter()
+        timings[name] = now - mark
+        mark = now
+
+    import cv2
+    lap("import_cv2")
+    import mediapipe as mp
+    lap("import_mediapipe")
+    import gesture_control  # noqa: F401  (나머지 프로젝트 모듈)
+    lap("import_app")
+
+    cap = cv2.VideoCapture(camera)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    ret, frame = cap.read()
+    if not ret:
+        raise RuntimeError(f"카메라에서 프레임을 읽을 수 없습니다: {camera}")
+    lap("camera_open")
+
+    hands = mp.solutions.hands.Hands(
+        max_num_hands=1,
+        min_detection_confidence=0.7,
+        min_tracking_confidence=0.5
+    )
+    lap("model_load")
+
+    rgb = cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB)
+    hands.process(rgb)
+    lap("first_inference")
+    hands.process(rgb)
+    lap("steady_inference")
+
+    cap.release()
+    hands.close()
+    timings["total"] = time.perf_counter() - _PROCESS_START
+    return timings
+
+
+def run_child(camera):
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", "--camera", str(camera)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    wall = time.perf_counter() - start
+    timings = json.loads(output.strip().splitlines()[-1])
+    # 인터프리터 기동 시간 = 프로세스 전체 시간 - 스크립트 안에서 잰 시간
+    timings["interpreter"] = wall - timings["total"]
+    timings["wall"] = wall
+    return timings
+
+
+def run_main(timeout, main_args=()):
+    """main.py 를 실행해서 READY 가 나올 때까지 걸린 시간 (창은 띄우지 않음)"""
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "main.py", "--prewarm", *main_args],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        for line in process.stdout:
+            if line.startswith("READY"):
+                return time.perf_counter() - start
+            if line.startswith("FAILED") or time.perf_counter() - start > timeout:
+                raise RuntimeError(line.strip() or "시간 초과")
+        raise RuntimeError("main.py 가 READY 전에 종료되었습니다")
+    finally:
+        process.stdin.close()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간 측정 (import / 카메라 / 모델 / 첫 추론)")
+    parser.add_argument("--runs", type=int, default=5, help="새 프로세스로 반복할 횟수")
+    parser.add_argument("--camera", default="0", help="카메라 번호 또는 동영상 파일 경로")
+    parser.add_argument("--main", action="store_true", help="main.py --prewarm 이 READY 를 출력할 때까지의 시간도 측정")
+    parser.add_argument("--main-args", default="", help="--main 측정 때 main.py 에 넘길 인자 (예: \"--injection recording\")")
+    parser.add_argument("--timeout", type=float, default=60.0, help="--main 측정 제한 시간 (초)")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON 으로 저장")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_child(camera_source(args.camera))))
+        return
+
+    runs = [run_child(args.camera) for _ in range(args.runs)]
+    summary = {name: float(np.median([run[name] for run in runs])) for name in runs[0]}
+    print(f"시작 단계별 소요 시간 (중앙값, {args.runs}회)")
+    for name, seconds in summary.items():
+        print(f"  {name:17s} {seconds * 1000:8.1f}ms")
+
+    result = {"camera": args.camera, "runs": runs, "median": summary}
+    if args.main:
+        ready = [run_main(args.timeout, shlex.split(args.main_args)) for _ in range(args.runs)]
+        result["main_ready"] = ready
+        print(f"  {'main.py READY':17s} {float(np.median(ready)) * 1000:8.1f}ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
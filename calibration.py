@@ -0,0 +1,117 @@
+import json
+import os
+import threading
+import time
+import numpy as np
+from pose_classifier import hand_scale
+
+# 1: 손 크기만 저장, 2: 손 크기에서의 거리 기준값(thresholds)도 저장
+PROFILE_VERSION = 2
+DEFAULT_PROFILE_PATH = "calibration.json"
+DEFAULT_USER = "local"
+
+
+def measure_profile(samples, scale_thresholds=None):
+    """캘리브레이션 동안 모은 손바닥 프레임들로 손 크기 프로필을 만듦 (중앙값이라 튀는 프레임에 강함)
+
+    scale_thresholds (손 크기 대비 비율) 를 주면 측정한 손 크기에서의 거리 기준값을 thresholds 로 같이 저장
+    """
+    lm = np.asarray(samples, dtype=np.float32)
+    palm = lm[:, 5, :2] - lm[:, 17, :2]
+    scale = float(np.median(hand_scale(lm)))
+    return {
+        "version": PROFILE_VERSION,
+        "hand_scale": scale,
+        "thresholds": {name: fraction * scale for name, fraction in (scale_thresholds or {}).items()},
+        "palm_width": float(np.median(np.hypot(palm[:, 0], palm[:, 1]))),
+        "samples": len(lm),
+        "created_at": time.time(),
+    }
+
+
+def is_valid(profile):
+    return (
+        isinstance(profile, dict)
+        and profile.get("version") in (1, PROFILE_VERSION)
+        and float(profile.get("hand_scale") or 0) > 0
+    )
+
+
+class CalibrationStore:
+    """사용자별 캘리브레이션 프로필을 로컬 파일과 서버 설정 API 에 저장
+
+    읽을 때는 로컬 파일을 먼저 보고, 없으면 서버에서 받아 로컬에 캐시함
+    서버 저장은 백그라운드 스레드에서 처리해서 시작을 막지 않음
+    """
+
+    def __init__(self, user_id=None, api_url=None, path=DEFAULT_PROFILE_PATH, timeout=3.0, on_error=None):
+        self.user_id = user_id
+        self.api = None
+        if api_url:
+            from api_client import ApiClient
+            self.api = ApiClient(api_url, timeout=timeout)
+        self.path = path
+        self.on_error = on_error
+
+    @property
+    def key(self):
+        return self.user_id or DEFAULT_USER
+
+    def load(self):
+        profile = self._read_local().get(self.key)
+        if is_valid(profile):
+            return profile
+        profile = self._fetch()
+        if is_valid(profile):
+            self._write_local(profile)
+            return profile
+        return None
+
+    def save(self, profile):
+        self._write_local(profile)
+        if self.user_id and self.api is not None:
+            threading.Thread(target=self._upload, args=(profile,), name="calibration-upload", daemon=True).start()
+
+    def _read_local(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self._error(e)
+            return {}
+
+    def _write_local(self, profile):
+        profiles = self._read_local()
+        profiles[self.key] = profile
+        # 쓰는 도중 종료돼도 기존 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(profiles, f, indent=4)
+        os.replace(tmp_path, self.path)
+
+    def _fetch(self):
+        if not (self.user_id and self.api is not None):
+            return None
+        from api_client import ApiError
+        try:
+            settings, _ = self.api.get_settings(self.user_id)
+            calibration = settings.get("calibration")
+            return json.loads(calibration) if calibration else None
+        except (ApiError, ValueError) as e:
+            self._error(e)
+            return None
+
+    def _upload(self, profile):
+        from api_client import ApiError
+        try:
+            self.api.save_settings(self.user_id, {"calibration": json.dumps(profile)})
+        except ApiError as e:
+            self._error(e)
+
+    def _error(self, e):
+        if self.on_error is not None:
+            self.on_error(e)
+        else:
+            print("캘리브레이션 프로필 처리 중 에러:", e)
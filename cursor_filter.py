@@ -0,0 +1,168 @@
+import math
+
+# UI 감도 슬라이더 범위 (get_sensitivity 기준 0.1 ~ 0.5, 기본 0.2)
+DEFAULT_SENSITIVITY = 0.2
+
+
+def pointer_target(landmarks):
+    """검지 방향으로 연장한 지점을 화면 정규화 좌표 (x, y) 로 반환"""
+    tip_x, tip_y = landmarks[8][0], landmarks[8][1]
+    base_x, base_y = landmarks[5][0], landmarks[5][1]
+    return tip_x + (tip_x - base_x) * 2, tip_y + (tip_y - base_y) * 2
+
+
+class LerpFilter:
+    """기존 방식: 이전 위치에서 목표 위치로 감도 비율만큼 이동"""
+
+    name = "lerp"
+
+    def __init__(self, sensitivity=DEFAULT_SENSITIVITY, horizon=0.0):
+        self.horizon = horizon
+        self.set_sensitivity(sensitivity)
+        self.x = self.y = None
+
+    def set_sensitivity(self, sensitivity):
+        self.sensitivity = sensitivity
+
+    def reset(self, x, y, t=None):
+        self.x, self.y = x, y
+
+    def update(self, x, y, t):
+        if self.x is None:
+            self.reset(x, y, t)
+        else:
+            self.x += (x - self.x) * self.sensitivity
+            self.y += (y - self.y) * self.sensitivity
+        return self.x, self.y
+
+
+class _LowPass:
+    def __init__(self):
+        self.value = None
+
+    def apply(self, value, alpha):
+        self.value = value if self.value is None else self.value + alpha * (value - self.value)
+        return self.value
+
+
+class OneEuroFilter:
+    """One Euro 필터: 느릴 때는 강하게, 빠를 때는 약하게 평활화 (Casiez et al. 2012)"""
+
+    name = "one_euro"
+
+    def __init__(self, sensitivity=DEFAULT_SENSITIVITY, horizon=0.0, d_cutoff=1.0):
+        self.horizon = horizon
+        self.d_cutoff = d_cutoff
+        self.set_sensitivity(sensitivity)
+        self.t = None
+
+    def set_sensitivity(self, sensitivity):
+        # 감도가 높을수록 정지 시 차단 주파수와 속도 반응이 커짐
+        self.sensitivity = sensitivity
+        self.min_cutoff = 4.0 * sensitivity
+        self.beta = 0.02 * sensitivity
+
+    def reset(self, x, y, t=None):
+        self.t = t
+        self.pos = [_LowPass(), _LowPass()]
+        self.vel = [_LowPass(), _LowPass()]
+        self.pos[0].apply(x, 1.0)
+        self.pos[1].apply(y, 1.0)
+        self.vel[0].apply(0.0, 1.0)
+        self.vel[1].apply(0.0, 1.0)
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def update(self, x, y, t):
+        if self.t is None:
+            self.reset(x, y, t)
+            return x, y
+        dt = t - self.t
+        if dt <= 0:
+            return self._output()
+        self.t = t
+
+        for axis, value in enumerate((x, y)):
+            speed = (value - self.pos[axis].value) / dt
+            speed = self.vel[axis].apply(speed, self._alpha(self.d_cutoff, dt))
+            cutoff = self.min_cutoff + self.beta * abs(speed)
+            self.pos[axis].apply(value, self._alpha(cutoff, dt))
+        return self._output()
+
+    def _output(self):
+        # 파이프라인 지연만큼 앞으로 예측
+        return (
+            self.pos[0].value + self.vel[0].value * self.horizon,
+            self.pos[1].value + self.vel[1].value * self.horizon,
+        )
+
+
+class _Kalman1D:
+    """등속 모델 칼만 필터 한 축 (상태: 위치, 속도)"""
+
+    def __init__(self, value):
+        self.p, self.v = value, 0.0
+        self.P = [[100.0, 0.0], [0.0, 1e4]]
+
+    def update(self, z, dt, q, r):
+        # 예측
+        p = self.p + self.v * dt
+        v = self.v
+        (a, b), (c, d) = self.P
+        a, b, c, d = (
+            a + dt * (b + c) + dt * dt * d + q * dt ** 3 / 3,
+            b + dt * d + q * dt ** 2 / 2,
+            c + dt * d + q * dt ** 2 / 2,
+            d + q * dt,
+        )
+        # 보정
+        s = a + r
+        k0, k1 = a / s, c / s
+        innovation = z - p
+        self.p = p + k0 * innovation
+        self.v = v + k1 * innovation
+        self.P = [[(1 - k0) * a, (1 - k0) * b], [c - k1 * a, d - k1 * b]]
+
+
+class KalmanFilter:
+    """등속 칼만 필터 + 속도 기반 단기 예측"""
+
+    name = "kalman"
+
+    def __init__(self, sensitivity=DEFAULT_SENSITIVITY, horizon=0.0, noise=25.0):
+        self.horizon = horizon
+        self.noise = noise  # 측정 잡음 분산 (px^2)
+        self.set_sensitivity(sensitivity)
+        self.t = None
+
+    def set_sensitivity(self, sensitivity):
+        # 감도가 높을수록 가속을 더 허용 (과정 잡음 증가) -> 더 빠르게 따라감
+        self.sensitivity = sensitivity
+        self.q = 2e4 * (sensitivity / DEFAULT_SENSITIVITY) ** 3
+
+    def reset(self, x, y, t=None):
+        self.t = t
+        self.axes = [_Kalman1D(x), _Kalman1D(y)]
+
+    def update(self, x, y, t):
+        if self.t is None:
+            self.reset(x, y, t)
+            return x, y
+        dt = t - self.t
+        if dt > 0:
+            self.t = t
+            self.axes[0].update(x, dt, self.q, self.noise)
+            self.axes[1].update(y, dt, self.q, self.noise)
+        return tuple(axis.p + axis.v * self.horizon for axis in self.axes)
+
+
+FILTERS = {cls.name: cls for cls in (LerpFilter, OneEuroFilter, KalmanFilter)}
+
+
+def make_filter(name, sensitivity=DEFAULT_SENSITIVITY, horizon=0.0):
+    if name not in FILTERS:
+        raise ValueError(f"알 수 없는 커서 필터: {name} (사용 가능: {', '.join(FILTERS)})")
+    return FILTERS[name](sensitivity=sensitivity, horizon=horizon)
@@ -0,0 +1,168 @@
+import glob
+import os
+import time
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+class FrameSource:
+    """BGR 프레임 공급원 공통 인터페이스
+
+    cv2.VideoCapture 와 같은 read / isOpened / set / release 를 제공해서 기존 캡처 코드에 그대로 쓸 수 있음
+    fps 를 주면 그 속도에 맞춰 프레임을 내보내고, max_frames 를 주면 그만큼만 읽음
+    """
+
+    name = "base"
+
+    def __init__(self, fps=None, max_frames=None):
+        self.fps = fps
+        self.max_frames = max_frames
+        self.frames = 0
+        self._next_time = None
+
+    def read(self, image=None):
+        if self.max_frames is not None and self.frames >= self.max_frames:
+            return False, None
+        if self.fps:
+            now = time.perf_counter()
+            if self._next_time is not None and self._next_time > now:
+                time.sleep(self._next_time - now)
+            self._next_time = max(now, self._next_time or now) + 1.0 / self.fps
+        ret, frame = self._read(image)
+        if ret:
+            self.frames += 1
+        return ret, frame
+
+    def _read(self, image):
+        raise NotImplementedError
+
+    def isOpened(self):
+        return True
+
+    def set(self, prop, value):
+        return False
+
+    def release(self):
+        pass
+
+
+class CameraSource(FrameSource):
+    """웹캠 (드라이버 큐에 오래된 프레임이 쌓이지 않도록 버퍼 최소화)"""
+
+    name = "camera"
+
+    def __init__(self, index=0, **kwargs):
+        super().__init__(**kwargs)
+        self.cap = cv2.VideoCapture(index)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    def _read(self, image):
+        return self.cap.read(image) if image is not None else self.cap.read()
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def set(self, prop, value):
+        return self.cap.set(prop, value)
+
+    def release(self):
+        self.cap.release()
+
+
+class VideoSource(CameraSource):
+    """녹화된 동영상 파일. loop 이면 끝에서 처음으로 되감음"""
+
+    name = "video"
+
+    def __init__(self, path, loop=False, **kwargs):
+        FrameSource.__init__(self, **kwargs)
+        self.path = path
+        self.loop = loop
+        self.cap = cv2.VideoCapture(path)
+
+    def _read(self, image):
+        ret, frame = super()._read(image)
+        if not ret and self.loop and self.frames > 0:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = super()._read(image)
+        return ret, frame
+
+
+class ImageDirSource(FrameSource):
+    """폴더의 이미지들을 파일 이름 순서대로"""
+
+    name = "images"
+
+    def __init__(self, directory, loop=False, **kwargs):
+        super().__init__(**kwargs)
+        self.loop = loop
+        self.paths = sorted(
+            p for p in glob.glob(os.path.join(directory, "*")) if p.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        self._index = 0
+
+    def _read(self, image):
+        if self._index >= len(self.paths):
+            if not self.loop or not self.paths:
+                return False, None
+            self._index = 0
+        frame = cv2.imread(self.paths[self._index])
+        self._index += 1
+        return frame is not None, frame
+
+    def isOpened(self):
+        return bool(self.paths)
+
+
+class SyntheticSource(FrameSource):
+    """카메라 없이 파이프라인 처리량을 재기 위한 합성 프레임 (움직이는 원 + 잡음)
+
+    손이 없으므로 mediapipe 는 매 프레임 전체 검출을 수행함 (최악의 추론 비용)
+    """
+
+    name = "synthetic"
+
+    def __init__(self, width=640, height=480, seed=0, **kwargs):
+        super().__init__(**kwargs)
+        self.width = width
+        self.height = height
+        rng = np.random.default_rng(seed)
+        self._noise = rng.integers(0, 32, (height, width, 3), dtype=np.uint8)
+
+    def _read(self, image):
+        if image is None or image.shape != (self.height, self.width, 3):
+            image = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        np.copyto(image, self._noise)
+        t = self.frames / 30.0
+        center = (
+            int(self.width * (0.5 + 0.3 * np.cos(t))),
+            int(self.height * (0.5 + 0.3 * np.sin(t))),
+        )
+        cv2.circle(image, center, self.height // 8, (80, 160, 220), -1)
+        return True, image
+
+
+def open_source(spec, fps=None, max_frames=None, loop=False):
+    """문자열 설정으로 프레임 공급원을 만듦
+
+    숫자 / "camera:N" : 카메라, 폴더 : 이미지 폴더, "synthetic" 또는 "synthetic:640x480" : 합성 프레임,
+    그 외 : 동영상 파일 (이미 만든 FrameSource 는 그대로 반환)
+    """
+    if isinstance(spec, FrameSource):
+        return spec
+    kwargs = {"fps": fps, "max_frames": max_frames}
+    if isinstance(spec, int):
+        return CameraSource(spec, **kwargs)
+    if spec.isdigit():
+        return CameraSource(int(spec), **kwargs)
+    if spec.startswith("camera:"):
+        return CameraSource(int(spec.split(":", 1)[1]), **kwargs)
+    if spec == "synthetic" or spec.startswith("synthetic:"):
+        size = spec.split(":", 1)[1] if ":" in spec else "640x480"
+        width, height = (int(v) for v in size.split("x"))
+        return SyntheticSource(width, height, **kwargs)
+    if os.path.isdir(spec):
+        return ImageDirSource(spec, loop=loop, **kwargs)
+    return VideoSource(spec, loop=loop, **kwargs)
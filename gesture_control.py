@@ -1,149 +1,347 @@
 import cv2
 import mediapipe as mp
-import pyautogui
 import math
-import numpy as np
 import time
+import threading
 import subprocess
-from PyQt6.QtGui import QImage, QPixmap
-from PyQt6.QtCore import Qt
+from pipeline import LatestSlot, Stage
+from action_executor import ActionExecutor
+from metrics import PipelineMetrics
+from roi_inference import HandInference
+from injection import AsyncInjector, make_backend
+from cursor_filter import LerpFilter, make_filter, pointer_target
+from pose_classifier import classify_poses, to_array, to_proto, GUN, OPEN_PALM, V, FIST, PINKY_ONLY
+from gesture_rules import GestureRules
+from calibration import measure_profile
+from frame_source import CameraSource
+from landmark_history import MotionDetector
+from preprocess import Preprocessor, release
 
 class GestureControl:
-    def __init__(self, ui):
+    def __init__(self, ui, actuator=None, launcher=None, clock=None, live=True, gesture_rules=None, source=None):
         self.ui = ui
-        self.cap = cv2.VideoCapture(0)
-        print("카메라를 열 수 없습니다.")
-        self.screen_w, self.screen_h = pyautogui.size()
+        # 입력 주입 백엔드 (기본: 전용 스레드에서 주입하고 이동은 최신 위치만 반영)
+        if actuator is None:
+            actuator = AsyncInjector(make_backend(), on_error=lambda e: self.ui.update_log(f"입력 주입 실패: {e}"))
+        self.actuator = actuator
+        self.launcher = launcher or (lambda command: subprocess.Popen(command, shell=True))
+        self.clock = clock or time.time
+        # 명령 실행은 작업 스레드에서 처리
+        self.executor = ActionExecutor(on_error=lambda e: self.ui.update_log(f"동작 실행 실패: {e}"))
+        # 제스처 조건 / 유지 시간 / 쿨다운 / 동작은 gestures.json 에서 읽어 컴파일
+        self.gesture_rules = gesture_rules or GestureRules.load()
+        # 최근 랜드마크 기록으로 스와이프 / 플릭 같은 움직임 제스처를 판정 (규칙의 flags 로 전달)
+        self.motion = MotionDetector(self.gesture_rules.motion) if self.gesture_rules.uses_motion else None
+        self.recorder = None
+        self.metrics = PipelineMetrics()
+        # 설정하면 캡처 / 추론을 별도 프로세스에서 실행 (parallel_inference.ParallelInference)
+        self.parallel = None
+        # 설정하면 저장된 캘리브레이션 프로필을 읽고, 새로 측정한 프로필을 저장 (calibration.CalibrationStore)
+        self.calibration_store = None
+        self.recalibrate = False
+        # 헤드리스 벤치마크 등에서 손바닥 캘리브레이션 대기를 건너뜀
+        self.skip_calibration = False
+        # True 이면 캡처가 추론을 기다려서 프레임을 버리지 않음 (동영상 / 벤치마크용)
+        self.lossless = False
+        # 설정하면 손이 한동안 안 보일 때 캡처 / 추론 / 화면 갱신을 줄임 (idle_monitor.IdleMonitor)
+        self.idle = None
+        # 캡처 프레임을 미리 만든 버퍼에 읽고 반전 / RGB 변환을 한 번만 함 (추론과 미리보기가 같은 버퍼 사용)
+        self.preprocess = Preprocessor()
 
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
         self.mp_draw = mp.solutions.drawing_utils
+        # 프레임이 RGB 라서 mediapipe 기본 색(BGR 빨강)을 RGB 빨강으로 바꿔서 그림
+        self.landmark_style = self.mp_draw.DrawingSpec(color=(255, 0, 0))
+        if live:
+            # 기본은 웹캠. 동영상 / 이미지 폴더 / 합성 프레임은 frame_source.open_source 로 만들어 넘김
+            self.cap = source if source is not None else CameraSource(0)
+            if not self.cap.isOpened():
+                print("카메라를 열 수 없습니다.")
+            self.hands = self.mp_hands.Hands(
+                max_num_hands=1,
+                min_detection_confidence=0.7,
+                min_tracking_confidence=0.5
+            )
+            # 기본값은 전체 화면 추론 (main.py 에서 ROI / 시간 예산 설정 가능)
+            self.inference = HandInference(self.hands)
+        else:
+            self.cap = None
+            self.hands = None
+        self.screen_w, self.screen_h = self.actuator.size()
 
         self.mode = None
-        self.activation_start = None
-        self.switch_start = None
         self.thumb_hold_start = None
         self.last_click_time = 0
         self.dragging = False
-        self.prev_x, self.prev_y = pyautogui.position()
-
-    def lerp(self, a, b, t):
-        return a + (b - a) * t
+        self.prev_x, self.prev_y = self.actuator.position()
+        # 커서 평활화 필터 (UI 에서 종류 선택, 감도 슬라이더가 필터 파라미터로 연결됨)
+        self.predict_horizon = 0.0
+        self.cursor_filter = LerpFilter()
+        self.cursor_filter.reset(self.prev_x, self.prev_y)
+
+        # 파이프라인 단계 사이를 잇는 최신값 슬롯 (오래된 프레임은 버리고 버퍼는 풀에 반환)
+        self.stop_event = threading.Event()
+        self.frame_slot = LatestSlot(on_drop=release)    # 캡처 -> 추론
+        self.action_slot = LatestSlot()                  # 추론 -> 동작
+        self.render_slot = LatestSlot(on_drop=release)   # 추론 -> 화면
 
     def calibrate(self):
+        if self.skip_calibration:
+            return
+        if self.calibration_store is not None and not self.recalibrate:
+            profile = self.calibration_store.load()
+            if profile is not None:
+                self.apply_calibration(profile)
+                self.ui.update_log(f"저장된 캘리브레이션 사용 (손 크기 {profile['hand_scale']:.3f})")
+                return
+
         self.ui.update_log("손바닥을 펼쳐 캘리브레이션 중...")
         calibration_start = None
-
-        while True:
-            ret, frame = self.cap.read()
-            if not ret:
+        samples = []
+
+        while not self.stop_event.is_set():
+            detection = self.read_detection()
+            if detection is None:
+                if self.parallel is None and not self.cap.isOpened():
+                    self.ui.update_log("카메라를 열 수 없습니다.")
+                    return
+                # 프레임을 못 읽었을 때 바로 다시 읽으면 CPU 를 계속 점유함
+                time.sleep(0.01)
                 continue
-            frame = cv2.flip(frame, 1)
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(rgb)
-
-            if results.multi_hand_landmarks:
-                hand_landmarks = results.multi_hand_landmarks[0]
-                lm = hand_landmarks.landmark
+            frame, landmarks = detection
 
-                open_palm = all(
-                    lm[i].y < lm[i-2].y for i in [8, 12, 16, 20]
-                )
+            if landmarks is not None:
+                open_palm = classify_poses(landmarks)[OPEN_PALM]
 
                 if open_palm:
+                    samples.append(landmarks)
                     if calibration_start is None:
                         calibration_start = time.time()
                     elif time.time() - calibration_start >= 2.0:
-                        self.ui.update_log("캘리브레이션 완료")
+                        profile = measure_profile(samples, self.gesture_rules.scale_thresholds)
+                        self.apply_calibration(profile)
+                        if self.calibration_store is not None:
+                            self.calibration_store.save(profile)
+                        self.ui.update_log(f"캘리브레이션 완료 (손 크기 {profile['hand_scale']:.3f})")
+                        frame.release()
                         return
                 else:
                     calibration_start = None
+                    samples = []
 
-            # 캘리브레이션 화면도 UI에 띄움
+            # 캘리브레이션 화면도 UI에 띄움 (버퍼는 미리보기가 반환)
             self.update_camera_frame(frame)
             if cv2.waitKey(1) & 0xFF == 27:
                 break
 
+    def apply_calibration(self, profile):
+        """프로필의 기준값을 손 크기 대비 비율로 써서 거리 판정 기준값이 현재 손 크기를 따라가게 함"""
+        self.gesture_rules.set_calibration(profile)
+
+    def read_detection(self):
+        """캘리브레이션용으로 프레임 버퍼 하나와 손 랜드마크(없으면 None)를 읽음. 프레임을 못 읽으면 None
+
+        받은 버퍼는 호출한 쪽이 release() 하거나 미리보기로 넘겨야 함
+        """
+        if self.parallel is not None:
+            item = self.parallel.get(timeout=1.0)
+            if item is None:
+                return None
+            captured_at, frame, landmarks, elapsed = item
+            return frame, landmarks
+
+        ret, frame = self.preprocess.read(self.cap)
+        if not ret:
+            return None
+        results = self.hands.process(frame.image)
+        if not results.multi_hand_landmarks:
+            return frame, None
+        return frame, to_array(results.multi_hand_landmarks[0])
+
+    def warm_up(self):
+        """카메라 첫 프레임으로 추론을 한 번 실행해서 초기화 비용을 시작 단계에서 미리 치름"""
+        if self.parallel is not None:
+            self.parallel.start()
+            return
+        if self.cap.isOpened():
+            detection = self.read_detection()
+            if detection is not None:
+                detection[0].release()
+
     def run(self):
+        if self.parallel is not None and self.parallel.ring is None:
+            self.parallel.start()
         self.calibrate()
         self.ui.update_log("제스처 모드 대기 중...")
 
-        while self.cap.isOpened():
-            ret, frame = self.cap.read()
-            if not ret:
-                break
-            frame = cv2.flip(frame, 1)
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(rgb)
-
-            if results.multi_hand_landmarks:
-                hand_landmarks = results.multi_hand_landmarks[0]
-                landmarks = [(l.x, l.y, l.z) for l in hand_landmarks.landmark]
-
-                now = time.time()
-
-                if self.is_gun_pose(landmarks):
-                    if self.activation_start is None:
-                        self.activation_start = now
-                    elif now - self.activation_start >= 2.0:
-                        if self.mode != "mouse":
-                            self.mode = "mouse"
-                            self.ui.update_log("마우스 이동 모드로 전환")
-                            self.ui.update_mode("마우스 이동 모드")
-                        self.activation_start = None
-                elif self.is_open_palm(landmarks):
-                    if self.switch_start is None:
-                        self.switch_start = now
-                    elif now - self.switch_start >= 2.0:
-                        if self.mode != "gesture":
-                            self.mode = "gesture"
-                            self.ui.update_log("일반 제스처 모드로 전환")
-                            self.ui.update_mode("일반 제스처 모드")
-                        self.switch_start = None
-                else:
-                    self.activation_start = None
-                    self.switch_start = None
-
-                if self.mode == "mouse":
-                    self.handle_mouse_mode(landmarks)
-                elif self.mode == "gesture":
-                    self.handle_gesture_mode(landmarks)
-
-                self.mp_draw.draw_landmarks(frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
-
-            # 🔥 여기서 매 프레임마다 UI에 업데이트
-            self.update_camera_frame(frame)
-
-            if cv2.waitKey(1) & 0xFF == 27:
-                break
-
-        self.cap.release()
+        # 캡처 / 추론 / 동작 / 화면 갱신을 각각 별도 스레드로 실행
+        if self.parallel is not None:
+            # 캡처와 추론은 별도 프로세스에서 돌고, 여기서는 결과만 받음
+            producers = [Stage("inference", self.parallel_stage, stop_event=self.stop_event)]
+        else:
+            producers = [
+                Stage("capture", self.capture_stage, stop_event=self.stop_event),
+                Stage("inference", self.inference_stage, self.frame_slot, self.stop_event),
+            ]
+        stages = producers + [
+            Stage("actuation", self.actuation_stage, self.action_slot, self.stop_event),
+            Stage("render", self.render_stage, self.render_slot, self.stop_event),
+        ]
+        for stage in stages:
+            stage.start()
+
+        self.stop_event.wait()
+        for slot in (self.frame_slot, self.action_slot, self.render_slot):
+            slot.close()
+        for stage in stages:
+            stage.join()
+
+        if self.cap is not None:
+            self.cap.release()
+        if self.parallel is not None:
+            self.parallel.stop()
+        self.executor.shutdown()
+        self.actuator.close()
+        if self.recorder is not None:
+            self.recorder.close()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def capture_stage(self):
+        if self.lossless:
+            self.frame_slot.wait_taken()
+        idle = self.idle is not None and self.idle.idle
+        if idle and self.stop_event.wait(self.idle.interval):
+            return False
+        if not self.cap.isOpened():
+            return False
+        start = time.perf_counter()
+        ret, raw = self.preprocess.grab(self.cap)
+        if not ret:
+            return False
+        captured_at = time.perf_counter()
+        self.metrics.record("capture", captured_at - start)
+        if idle:
+            # 절전 중에는 작게 줄인 프레임 차이로 움직임이 있을 때만 변환 / 추론을 재개
+            if not self.idle.moved(raw):
+                return
+            self.idle.wake()
+            self.metrics.set_power_state("active")
+            self.ui.update_log("움직임 감지: 손 추적 재개", power="active")
+        frame = self.preprocess.convert(raw)
+        self.metrics.record("convert", time.perf_counter() - captured_at)
+        self.frame_slot.put((captured_at, frame))
+
+    def inference_stage(self, item):
+        captured_at, frame = item
+        start = time.perf_counter()
+        # 건너뛴 프레임은 마지막 추론 결과를 그대로 받음 (절전 판정 / 녹화에서 손을 놓친 것으로 보지 않도록)
+        hand_landmarks, landmarks = self.inference.process(frame.image)
+        skipped = self.inference.skipped
+        inferred = time.perf_counter()
+        if not skipped:
+            self.metrics.record("inference", inferred - start)
+        self.metrics.frame_done(inferred)
+        if self.idle is not None and self.idle.update(landmarks is not None):
+            self.metrics.set_power_state("idle")
+            self.ui.update_log(f"{self.idle.idle_after:g}초 동안 손이 없어 절전 모드로 전환", power="idle")
+        self.publish_detection(captured_at, frame, landmarks, hand_landmarks, skipped=skipped)
+
+    def parallel_stage(self):
+        item = self.parallel.get(timeout=0.1)
+        if item is None:
+            # 캡처 프로세스가 끝났으면 파이프라인도 종료
+            return self.parallel.alive()
+        captured_at, frame, landmarks, elapsed = item
+        self.metrics.record("inference", elapsed)
+        self.metrics.frame_done()
+        self.publish_detection(captured_at, frame, landmarks)
+
+    def publish_detection(self, captured_at, frame, landmarks, hand_landmarks=None, skipped=False):
+        """추론 결과를 동작 / 화면 단계와 녹화 파일로 넘김
+
+        skipped 이면 이전 프레임 결과라서 동작 단계로는 넘기지 않음 (같은 손 모양으로 제스처가 두 번 처리되지 않도록)
+        """
+        if landmarks is not None and not skipped:
+            self.action_slot.put((captured_at, landmarks))
+
+        if self.recorder is not None:
+            self.recorder.write(captured_at, landmarks)
+
+        self.render_slot.put((frame, hand_landmarks, landmarks))
+
+    def actuation_stage(self, item):
+        captured_at, landmarks = item
+        self.process_landmarks(landmarks)
+        # 캡처부터 동작 처리까지의 전체 지연
+        self.metrics.record("latency", time.perf_counter() - captured_at)
+
+    def process_landmarks(self, landmarks):
+        """한 프레임의 랜드마크로 모드 전환과 모드별 동작을 처리"""
+        now = self.clock()
+        start = time.perf_counter()
+        flags = self.motion.update(now, landmarks) if self.motion is not None else None
+        # 모든 제스처 규칙의 조건과 유지 / 쿨다운 타이머를 한 번에 평가
+        fired = self.gesture_rules.evaluate(landmarks, now, self.mode, flags)
+        classified = time.perf_counter()
+        self.metrics.record("classify", classified - start)
+
+        for rule in fired:
+            if rule.action["type"] == "mode":
+                self.switch_mode(rule)
+
+        if self.mode == "mouse":
+            self.handle_mouse_mode(landmarks)
+        elif self.mode == "gesture":
+            self.handle_gesture_mode(fired)
+        self.metrics.record("actuate", time.perf_counter() - classified)
+
+    def switch_mode(self, rule):
+        mode = rule.action["mode"]
+        if self.mode != mode:
+            self.mode = mode
+            if rule.log:
+                self.ui.update_log(rule.log, gesture=rule.name)
+            self.ui.update_mode(rule.action.get("label", mode))
+
+    def render_stage(self, item):
+        frame, hand_landmarks, landmarks = item
+        start = time.perf_counter()
+        if hand_landmarks is None and landmarks is not None:
+            hand_landmarks = to_proto(landmarks)
+        if hand_landmarks is not None:
+            self.mp_draw.draw_landmarks(frame.image, hand_landmarks, self.mp_hands.HAND_CONNECTIONS, self.landmark_style)
+
+        # 🔥 최신 프레임만 UI에 업데이트
+        self.update_camera_frame(frame)
+        self.metrics.record("render", time.perf_counter() - start)
+
+        if cv2.waitKey(1) & 0xFF == 27:
+            self.stop()
 
     def update_camera_frame(self, frame):
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_frame.shape
-        bytes_per_line = ch * w
-        convert_to_Qt_format = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-        p = convert_to_Qt_format.scaled(640, 480, aspectRatioMode=Qt.AspectRatioMode.KeepAspectRatio)
-        self.ui.camera_label.setPixmap(QPixmap.fromImage(p))
+        # 실제 그리기는 GUI 스레드의 presenter 가 화면 주사율에 맞춰 처리 (다 쓰면 버퍼를 반환)
+        self.ui.preview.submit(frame.image, frame)
 
-    def handle_mouse_mode(self, landmarks):
-        tip2d, base2d = landmarks[8][:2], landmarks[5][:2]
-        dx, dy = tip2d[0]-base2d[0], tip2d[1]-base2d[1]
-        target_x = tip2d[0] + dx * 2
-        target_y = tip2d[1] + dy * 2
+    def update_cursor_filter(self):
+        """UI 에서 고른 필터 종류와 감도를 커서 필터에 반영"""
+        name = self.ui.get_cursor_filter()
+        sensitivity = self.ui.get_sensitivity()
+        if name != self.cursor_filter.name:
+            self.cursor_filter = make_filter(name, sensitivity, self.predict_horizon)
+            self.cursor_filter.reset(self.prev_x, self.prev_y)
+        elif sensitivity != self.cursor_filter.sensitivity:
+            self.cursor_filter.set_sensitivity(sensitivity)
 
+    def handle_mouse_mode(self, landmarks):
+        target_x, target_y = pointer_target(landmarks)
         screen_x = int(target_x * self.screen_w)
         screen_y = int(target_y * self.screen_h)
 
-        sensitivity = self.ui.get_sensitivity()
-        smooth_x = self.lerp(self.prev_x, screen_x, sensitivity)
-        smooth_y = self.lerp(self.prev_y, screen_y, sensitivity)
-        pyautogui.moveTo(smooth_x, smooth_y)
+        self.update_cursor_filter()
+        smooth_x, smooth_y = self.cursor_filter.update(screen_x, screen_y, self.clock())
+        self.actuator.move_to(smooth_x, smooth_y)
         self.prev_x, self.prev_y = smooth_x, smooth_y
 
         thumb_tip = landmarks[4]
@@ -152,76 +350,66 @@ class GestureControl:
             (thumb_tip[0] - index_base[0]) ** 2 + (thumb_tip[1] - index_base[1]) ** 2
         )
 
-        click_threshold = 0.035
-        now = time.time()
+        mouse = self.gesture_rules.mouse
+        click_threshold = self.gesture_rules.click_threshold(landmarks)
+        now = self.clock()
 
         if thumb_index_distance < click_threshold:
             if self.thumb_hold_start is None:
                 self.thumb_hold_start = now
-            elif not self.dragging and (now - self.thumb_hold_start) >= 2.0:
-                pyautogui.mouseDown(button='left')
+            elif not self.dragging and (now - self.thumb_hold_start) >= mouse["drag_hold"]:
+                self.actuator.mouse_down(button='left')
                 self.dragging = True
-                self.ui.update_log("드래그 시작")
+                self.ui.update_log("드래그 시작", gesture="drag_start")
         else:
             if self.dragging:
-                pyautogui.mouseUp(button='left')
+                self.actuator.mouse_up(button='left')
                 self.dragging = False
-                self.ui.update_log("드래그 종료")
+                self.ui.update_log("드래그 종료", gesture="drag_end")
             elif self.thumb_hold_start is not None:
-                if (now - self.thumb_hold_start) < 2.0 and (now - self.last_click_time) > 1.0:
-                    pyautogui.click(button='left')
+                if (now - self.thumb_hold_start) < mouse["drag_hold"] and (now - self.last_click_time) > mouse["click_debounce"]:
+                    self.actuator.click(button='left')
                     self.last_click_time = now
-                    self.ui.update_log("클릭 완료")
+                    self.ui.update_log("클릭 완료", gesture="click")
             self.thumb_hold_start = None
 
-    def handle_gesture_mode(self, landmarks):
-        if self.is_fist(landmarks):
-            pyautogui.press("volumeup")
-            self.ui.update_log("볼륨업 실행")
-            time.sleep(0.5)
-        elif self.is_pinky_only(landmarks):
-            pyautogui.press("volumedown")
-            self.ui.update_log("볼륨다운 실행")
-            time.sleep(0.5)
-        elif self.is_v_pose(landmarks):
-            vgesture_command = self.ui.vgesture_command_line.text()
-            if vgesture_command:
-                self.ui.update_log(f"V자 감지: {vgesture_command} 실행")
-                subprocess.Popen(vgesture_command, shell=True)
-                time.sleep(2)
+    def handle_gesture_mode(self, fired):
+        """이번 프레임에 조건과 시간 조건을 만족한 제스처 규칙의 동작 실행"""
+        for rule in fired:
+            action = rule.action
+            kind = action["type"]
+            if kind == "key":
+                self.actuator.press(action["key"])
+            elif kind == "click":
+                self.actuator.click(button=action.get("button", "left"))
+            elif kind == "command":
+                command = action.get("command") or self.setting_value(action.get("setting"))
+                if not command:
+                    continue
+                self.executor.submit(self.launcher, command)
+                if rule.log:
+                    self.ui.update_log(rule.log.format(command=command), gesture=rule.name, command=command)
+                continue
+            else:
+                continue
+            if rule.log:
+                self.ui.update_log(rule.log, gesture=rule.name)
+
+    def setting_value(self, name):
+        """규칙에서 참조하는 설정값 (예: vgesture_command). 위젯이 아니라 설정 저장소 스냅샷에서 읽음"""
+        return self.ui.get_setting(name) if name else ""
 
     def is_gun_pose(self, landmarks):
-        idx, mid, thm = landmarks[8], landmarks[12], landmarks[4]
-        idx_base, mid_base, thm_base = landmarks[6], landmarks[10], landmarks[3]
-        ring, pinky = landmarks[16], landmarks[20]
-
-        return (
-            idx[1] < idx_base[1] and
-            mid[1] < mid_base[1] and
-            thm[1] < thm_base[1] and
-            abs(idx[0] - mid[0]) < 0.03 and
-            ring[1] > landmarks[14][1] and
-            pinky[1] > landmarks[18][1]
-        )
+        return bool(classify_poses(landmarks)[GUN])
 
     def is_open_palm(self, landmarks):
-        return all(landmarks[i][1] < landmarks[i-2][1] for i in [8, 12, 16, 20])
+        return bool(classify_poses(landmarks)[OPEN_PALM])
 
     def is_v_pose(self, landmarks):
-        idx, mid, thm = landmarks[8], landmarks[12], landmarks[4]
-        idx_base = landmarks[5]
-        return (
-            abs(idx[0] - mid[0]) > 0.05 and
-            math.hypot(thm[0] - idx_base[0], thm[1] - idx_base[1]) < 0.04
-        )
+        return bool(classify_poses(landmarks)[V])
 
     def is_fist(self, landmarks):
-        return all(landmarks[tip][1] > landmarks[tip-2][1] for tip in [8, 12, 16, 20])
+        return bool(classify_poses(landmarks)[FIST])
 
     def is_pinky_only(self, landmarks):
-        return (
-            landmarks[8][1] > landmarks[6][1] and
-            landmarks[12][1] > landmarks[10][1] and
-            landmarks[16][1] > landmarks[14][1] and
-            landmarks[20][1] < landmarks[18][1]
-        )
+        return bool(classify_poses(landmarks)[PINKY_ONLY])
@@ -0,0 +1,210 @@
+import argparse
+import json
+import numpy as np
+from pose_classifier import POSES, NUM_LANDMARKS, classify_poses, hand_scale
+from session_record import load_session
+
+# 학습 / 예측 클래스: 내장 포즈 + 해당 없음
+NONE = "none"
+CLASSES = POSES + (NONE,)
+NUM_FEATURES = (NUM_LANDMARKS - 1) * 3
+
+
+def landmark_features(landmarks):
+    """손 위치 / 크기 / 회전에 영향받지 않는 특징 벡터. (21, 3) -> (60,), (N, 21, 3) -> (N, 60)
+
+    손목(0) 기준 상대 좌표를 손 크기(0 -> 9 거리)로 나누고, 손목 -> 중지 뿌리 방향이 화면 위쪽이 되도록 회전
+    """
+    lm = np.asarray(landmarks, dtype=np.float32)
+    rel = lm[..., 1:, :] - lm[..., :1, :]
+    scale = np.maximum(hand_scale(lm), 1e-6)[..., None, None]
+    rel = rel / scale
+
+    # 손목 -> 중지 뿌리 단위 벡터 u 를 (0, -1) 로 보내는 회전 [[-uy, ux], [-ux, -uy]]
+    ux = rel[..., 8:9, 0]
+    uy = rel[..., 8:9, 1]
+    x = rel[..., 0]
+    y = rel[..., 1]
+    rotated = np.stack([-uy * x + ux * y, -ux * x - uy * y, rel[..., 2]], axis=-1)
+    return rotated.reshape(lm.shape[:-2] + (NUM_FEATURES,))
+
+
+def rule_labels(landmarks):
+    """기존 규칙(classify_poses)으로 만든 라벨 (처음 맞은 포즈, 없으면 none)"""
+    poses = classify_poses(landmarks)
+    return np.where(poses.any(axis=-1), poses.argmax(axis=-1), len(POSES))
+
+
+class GestureModel:
+    """랜드마크 특징 -> 은닉층 하나짜리 MLP -> 포즈 확률
+
+    예측은 행렬 곱 두 번이라 묶음(N 프레임)도 한 번에 처리함
+    """
+
+    def __init__(self, mean, std, w1, b1, w2, b2, classes=CLASSES, threshold=0.6):
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.std = np.asarray(std, dtype=np.float32)
+        self.w1 = np.asarray(w1, dtype=np.float32)
+        self.b1 = np.asarray(b1, dtype=np.float32)
+        self.w2 = np.asarray(w2, dtype=np.float32)
+        self.b2 = np.asarray(b2, dtype=np.float32)
+        self.classes = tuple(classes)
+        self.threshold = threshold
+        # 내장 포즈 순서(POSES)에 맞춘 열 번호. 모델에 없는 포즈는 항상 거짓
+        self._pose_columns = np.array([self.classes.index(p) if p in self.classes else -1 for p in POSES])
+
+    @classmethod
+    def load(cls, path, threshold=0.6):
+        data = np.load(path)
+        return cls(
+            data["mean"], data["std"], data["w1"], data["b1"], data["w2"], data["b2"],
+            classes=[str(c) for c in data["classes"]], threshold=threshold,
+        )
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            np.savez(
+                f, mean=self.mean, std=self.std, w1=self.w1, b1=self.b1, w2=self.w2, b2=self.b2,
+                classes=np.array(self.classes),
+            )
+
+    def logits(self, features):
+        hidden = np.maximum((features - self.mean) / self.std @ self.w1 + self.b1, 0.0)
+        return hidden @ self.w2 + self.b2
+
+    def predict_proba(self, landmarks):
+        """(21, 3) -> (C,), (N, 21, 3) -> (N, C) 클래스 확률"""
+        z = self.logits(landmark_features(landmarks))
+        z = np.exp(z - z.max(axis=-1, keepdims=True))
+        return z / z.sum(axis=-1, keepdims=True)
+
+    def predict(self, landmarks):
+        """가장 확률이 높은 클래스 번호. 확률이 threshold 보다 낮으면 none"""
+        proba = self.predict_proba(landmarks)
+        best = proba.argmax(axis=-1)
+        confident = np.take_along_axis(proba, best[..., None], axis=-1)[..., 0] >= self.threshold
+        none = self.classes.index(NONE) if NONE in self.classes else -1
+        return np.where(confident, best, none)
+
+    def poses(self, landmarks):
+        """classify_poses 와 같은 모양의 bool 배열 (규칙 엔진에서 그대로 대신 사용)"""
+        best = self.predict(landmarks)
+        return (best[..., None] == self._pose_columns) & (self._pose_columns >= 0)
+
+
+def train(features, labels, classes=CLASSES, hidden=32, epochs=400, lr=0.01, weight_decay=1e-4, seed=0):
+    """전체 묶음 Adam 으로 softmax 교차 엔트로피 학습"""
+    rng = np.random.default_rng(seed)
+    x = np.asarray(features, dtype=np.float32)
+    y = np.asarray(labels, dtype=np.intp)
+    mean = x.mean(axis=0)
+    std = x.std(axis=0) + 1e-6
+    x = (x - mean) / std
+    onehot = np.eye(len(classes), dtype=np.float32)[y]
+
+    # 클래스 빈도가 크게 달라서 (대부분 none) 적은 클래스에 가중치를 줌
+    counts = np.bincount(y, minlength=len(classes)).astype(np.float32)
+    weights = (len(y) / (len(classes) * np.maximum(counts, 1.0)))[y][:, None]
+
+    params = [
+        rng.normal(0, np.sqrt(2.0 / x.shape[1]), (x.shape[1], hidden)).astype(np.float32),
+        np.zeros(hidden, dtype=np.float32),
+        rng.normal(0, np.sqrt(1.0 / hidden), (hidden, len(classes))).astype(np.float32),
+        np.zeros(len(classes), dtype=np.float32),
+    ]
+    m = [np.zeros_like(p) for p in params]
+    v = [np.zeros_like(p) for p in params]
+    beta1, beta2 = 0.9, 0.999
+    for step in range(1, epochs + 1):
+        w1, b1, w2, b2 = params
+        pre = x @ w1 + b1
+        h = np.maximum(pre, 0.0)
+        z = h @ w2 + b2
+        z = np.exp(z - z.max(axis=1, keepdims=True))
+        p = z / z.sum(axis=1, keepdims=True)
+
+        dz = (p - onehot) * weights / len(y)
+        dh = (dz @ w2.T) * (pre > 0)
+        grads = [x.T @ dh + weight_decay * w1, dh.sum(axis=0), h.T @ dz + weight_decay * w2, dz.sum(axis=0)]
+        for i, g in enumerate(grads):
+            m[i] = beta1 * m[i] + (1 - beta1) * g
+            v[i] = beta2 * v[i] + (1 - beta2) * g * g
+            params[i] -= lr * (m[i] / (1 - beta1 ** step)) / (np.sqrt(v[i] / (1 - beta2 ** step)) + 1e-8)
+    return GestureModel(mean, std, *params, classes=classes)
+
+
+def load_dataset(specs):
+    """녹화 파일 목록을 (랜드마크, 라벨, 직접 라벨 여부) 로
+
+    "path" 는 기존 규칙으로 라벨을 붙이고, "path=fist" 처럼 쓰면 손이 검출된 모든 프레임을 그 포즈로 봄
+    규칙으로 붙인 라벨은 규칙 자체의 결과라서 정확도가 아니라 규칙과의 일치율로만 볼 수 있음 (annotated 가 False)
+    """
+    landmarks, labels, annotated = [], [], []
+    for spec in specs:
+        path, _, label = spec.partition("=")
+        records = load_session(path)
+        lm = np.asarray(records["landmarks"][records["valid"] != 0], dtype=np.float32)
+        if label:
+            if label not in CLASSES:
+                raise ValueError(f"알 수 없는 라벨: {label} (가능: {', '.join(CLASSES)})")
+            y = np.full(len(lm), CLASSES.index(label), dtype=np.intp)
+        else:
+            y = rule_labels(lm)
+        landmarks.append(lm)
+        labels.append(y)
+        annotated.append(np.full(len(lm), bool(label)))
+    if not landmarks:
+        return np.zeros((0, NUM_LANDMARKS, 3), dtype=np.float32), np.zeros(0, dtype=np.intp), np.zeros(0, dtype=bool)
+    return np.concatenate(landmarks), np.concatenate(labels), np.concatenate(annotated)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화 세션으로 랜드마크 포즈 분류 모델 학습")
+    parser.add_argument(
+        "sessions", nargs="+",
+        help="녹화 파일 (path=라벨 은 직접 라벨, path 만 쓰면 기존 규칙으로 라벨링해서 정확도 대신 규칙 일치율만 보고)",
+    )
+    parser.add_argument("--out", default="gesture_model.npz", help="저장할 모델 파일")
+    parser.add_argument("--hidden", type=int, default=32, help="은닉층 크기")
+    parser.add_argument("--epochs", type=int, default=400, help="학습 반복 횟수")
+    parser.add_argument("--lr", type=float, default=0.01, help="학습률")
+    parser.add_argument("--holdout", type=float, default=0.2, help="검증용으로 떼어 둘 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="학습 결과를 JSON 으로 저장")
+    args = parser.parse_args()
+
+    landmarks, labels, annotated = load_dataset(args.sessions)
+    if len(labels) == 0:
+        parser.error("손이 검출된 프레임이 없습니다")
+
+    rng = np.random.default_rng(args.seed)
+    order = rng.permutation(len(labels))
+    split = int(len(order) * (1.0 - args.holdout))
+    train_idx, test_idx = order[:split], order[split:]
+
+    features = landmark_features(landmarks)
+    model = train(features[train_idx], labels[train_idx], hidden=args.hidden, epochs=args.epochs, lr=args.lr, seed=args.seed)
+    model.save(args.out)
+
+    counts = {CLASSES[i]: int(n) for i, n in enumerate(np.bincount(labels, minlength=len(CLASSES))) if n}
+    result = {"frames": int(len(labels)), "classes": counts}
+    print(f"{len(labels)} 프레임:", ", ".join(f"{name}={n}" for name, n in counts.items()))
+    for name, idx in (("train", train_idx), ("test", test_idx)):
+        if len(idx) == 0:
+            continue
+        correct = model.predict(landmarks[idx]) == labels[idx]
+        # 직접 라벨을 붙인 프레임만 정확도, 규칙으로 라벨을 붙인 프레임은 규칙과의 일치율
+        for metric, text, mask in (("accuracy", "정확도", annotated[idx]), ("rule_agreement", "규칙 일치율", ~annotated[idx])):
+            if mask.any():
+                value = float(correct[mask].mean())
+                result[f"{name}_{metric}"] = value
+                print(f"{name} {text}: {value * 100:.1f}% ({int(mask.sum())} 프레임)")
+    print(f"모델 저장: {args.out}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+import json
+import os
+import numpy as np
+from landmark_history import DEFAULT_MOTION, MOTION_FLAGS
+from pose_classifier import POSES, DEFAULT_SCALE_THRESHOLDS, classify_poses, hand_scale, scale_thresholds
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gestures.json")
+
+# 기본 판정 종류: 이름 -> (비교 축 0=x 1=y, 절대값 여부, 2D 거리 여부, 부호)
+# 모든 판정은 "부호 * 값 < 부호 * 기준값" 한 가지 형태로 컴파일됨
+#   above a b    : y[a] < y[b]          (화면 좌표라 위쪽이 작음)
+#   x_gap_lt a b t : |x[a] - x[b]| < t
+#   dist_gt a b t  : 2D 거리(a, b) > t
+# 기준값 t 는 손 크기(hand_scale) 대비 비율. 캘리브레이션 전에는 DEFAULT_HAND_SCALE 을 곱한 절대값으로 씀
+PREDICATES = {
+    "above": (1, False, False, 1.0),
+    "below": (1, False, False, -1.0),
+    "left_of": (0, False, False, 1.0),
+    "right_of": (0, False, False, -1.0),
+    "x_gap_lt": (0, True, False, 1.0),
+    "x_gap_gt": (0, True, False, -1.0),
+    "y_gap_lt": (1, True, False, 1.0),
+    "y_gap_gt": (1, True, False, -1.0),
+    "dist_lt": (0, False, True, 1.0),
+    "dist_gt": (0, False, True, -1.0),
+}
+
+# click_threshold 는 캘리브레이션 전에 쓰는 절대값 (정규화 좌표)
+DEFAULT_MOUSE = {"click_threshold": 0.035, "drag_hold": 2.0, "click_debounce": 1.0}
+# 캘리브레이션 후 거리 기준값 = 비율 * 현재 손 크기 (gestures.json 의 "thresholds")
+DEFAULT_THRESHOLDS = {**DEFAULT_SCALE_THRESHOLDS, "click": 0.23}
+# 보통 거리에서의 손 크기. 캘리브레이션 전 기본 판정 기준값 = 비율 * 이 값
+DEFAULT_HAND_SCALE = 0.15
+
+
+class GestureRule:
+    """설정 파일의 제스처 규칙 하나 (조건, 유지 시간, 쿨다운, 동작)"""
+
+    def __init__(self, spec):
+        self.name = spec["name"]
+        self.group = spec.get("group", "default")
+        self.modes = spec.get("modes")
+        self.hold = float(spec.get("hold", 0.0))
+        self.cooldown = float(spec.get("cooldown", 0.0))
+        self.action = spec["action"]
+        self.log = spec.get("log")
+        when = spec["when"]
+        self.when = [when] if isinstance(when, str) else list(when)
+        if not self.when:
+            raise ValueError(f"제스처 규칙 '{self.name}' 에 조건(when)이 없습니다")
+
+    def __repr__(self):
+        return f"GestureRule({self.name!r})"
+
+
+class GestureRules:
+    """제스처 규칙을 하나의 판정 표와 시간 상태 배열로 컴파일해서 프레임마다 한 번에 평가
+
+    열(column) 순서: [설정 파일의 기본 판정들] + [내장 포즈 (pose_classifier)] + [외부 플래그]
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.mouse = {**DEFAULT_MOUSE, **config.get("mouse", {})}
+        self.motion = {**DEFAULT_MOTION, **config.get("motion", {})}
+        self.scale_thresholds = {**DEFAULT_THRESHOLDS, **config.get("thresholds", {})}
+        self.rules = [GestureRule(spec) for spec in config.get("rules", [])]
+        self.flag_names = list(config.get("flags", []))
+        # 움직임 플래그를 쓰는 규칙이 있을 때만 랜드마크 기록 / 판정을 함
+        self.uses_motion = any(name in MOTION_FLAGS for name in self.flag_names)
+        self._compile(config.get("poses", {}))
+        # 캘리브레이션 후에는 거리 기준값을 손 크기 대비 비율 * 현재 손 크기로 계산 (전에는 절대 기준값)
+        self.set_calibration(None)
+        # 학습한 포즈 분류 모델 (gesture_model.GestureModel). 있으면 내장 포즈 열을 규칙 대신 모델로 계산
+        self.pose_model = None
+        self.reset()
+
+    @classmethod
+    def load(cls, path=DEFAULT_RULES_PATH):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _compile(self, poses):
+        predicates = []      # 중복 없는 기본 판정 목록 (kind, a, b, t)
+        index = {}
+
+        def predicate_column(term):
+            kind, a, b = term[0], int(term[1]), int(term[2])
+            threshold = float(term[3]) if len(term) > 3 else 0.0
+            if kind not in PREDICATES:
+                raise ValueError(f"알 수 없는 판정 종류: {kind}")
+            key = (kind, a, b, threshold)
+            if key not in index:
+                index[key] = len(predicates)
+                predicates.append(key)
+            return index[key]
+
+        # 이름 있는 포즈는 기본 판정 열 목록으로 펼침
+        pose_columns = {name: [predicate_column(term) for term in terms] for name, terms in poses.items()}
+
+        rule_columns = []
+        for rule in self.rules:
+            columns = []
+            for term in rule.when:
+                if isinstance(term, str):
+                    columns.append(term)
+                else:
+                    columns.append(predicate_column(term))
+            rule_columns.append(columns)
+
+        num_predicates = len(predicates)
+        builtin_offset = num_predicates
+        flag_offset = builtin_offset + len(POSES)
+        num_columns = flag_offset + len(self.flag_names)
+
+        table = np.zeros((len(self.rules), num_columns), dtype=np.int32)
+        self.uses_builtin_poses = False
+        for r, (rule, columns) in enumerate(zip(self.rules, rule_columns)):
+            for column in columns:
+                if isinstance(column, int):
+                    table[r, column] = 1
+                elif column in pose_columns:
+                    table[r, pose_columns[column]] = 1
+                elif column in POSES:
+                    table[r, builtin_offset + POSES.index(column)] = 1
+                    self.uses_builtin_poses = True
+                elif column in self.flag_names:
+                    table[r, flag_offset + self.flag_names.index(column)] = 1
+                else:
+                    raise ValueError(f"제스처 규칙 '{rule.name}' 의 조건 '{column}' 이 포즈나 flags 에 없습니다")
+
+        self.table = table
+        self.term_counts = table.sum(axis=1)
+        self.num_predicates = num_predicates
+
+        # 기본 판정 표 (열마다 랜드마크 쌍, 비교 축, 절대값/거리 여부, 부호, 기준값)
+        kinds = [PREDICATES[p[0]] for p in predicates]
+        self.index_a = np.array([p[1] for p in predicates], dtype=np.intp)
+        self.index_b = np.array([p[2] for p in predicates], dtype=np.intp)
+        self.axis = np.array([k[0] for k in kinds], dtype=np.intp)
+        self.is_abs = np.array([k[1] for k in kinds], dtype=bool)
+        self.is_dist = np.array([k[2] for k in kinds], dtype=bool)
+        self.sign = np.array([k[3] for k in kinds], dtype=np.float32)
+        self.thresholds = np.array([k[3] * p[3] for k, p in zip(kinds, predicates)], dtype=np.float32)
+
+        # 같은 그룹에서 앞선 규칙 (elif 처럼 그룹마다 먼저 맞은 규칙 하나만 동작)
+        groups = [rule.group for rule in self.rules]
+        n = len(self.rules)
+        self.earlier = np.array(
+            [[1 if j < i and groups[j] == groups[i] else 0 for j in range(n)] for i in range(n)],
+            dtype=np.int32,
+        ).reshape(n, n)
+
+        self.holds = np.array([rule.hold for rule in self.rules], dtype=np.float64)
+        self.cooldowns = np.array([rule.cooldown for rule in self.rules], dtype=np.float64)
+        self._mode_masks = {}
+
+    def reset(self):
+        n = len(self.rules)
+        self.hold_start = np.full(n, np.nan)
+        self.last_fired = np.full(n, -np.inf)
+
+    def _mode_mask(self, mode):
+        mask = self._mode_masks.get(mode)
+        if mask is None:
+            mask = np.array([rule.modes is None or mode in rule.modes for rule in self.rules], dtype=bool)
+            self._mode_masks[mode] = mask
+        return mask
+
+    def set_calibration(self, profile):
+        """캘리브레이션 프로필 적용. None 이면 캘리브레이션 전 절대 기준값으로 되돌림
+
+        프로필의 thresholds (캘리브레이션 때 손 크기에서의 기준값) 를 손 크기 대비 비율로 바꿔서,
+        이후에는 프레임마다 현재 손 크기를 곱해서 씀. thresholds 가 없는 예전 프로필은 설정 파일의 비율 사용
+        """
+        fractions = dict(self.scale_thresholds)
+        if profile is not None:
+            scale = float(profile["hand_scale"])
+            for name, value in (profile.get("thresholds") or {}).items():
+                if name in fractions:
+                    fractions[name] = float(value) / scale
+        self.calibrated = profile is not None
+        self.fractions = fractions
+        self.pose_thresholds = scale_thresholds(fractions)
+
+    def set_pose_model(self, model):
+        """내장 포즈 판정을 학습한 모델로 교체 (None 이면 pose_classifier 규칙 사용)"""
+        self.pose_model = model
+
+    def threshold_scale(self, landmarks):
+        """거리 기준값 비율에 곱할 현재 손 크기. 캘리브레이션 전에는 None (절대 기준값 사용)"""
+        if not self.calibrated:
+            return None
+        return hand_scale(landmarks)
+
+    def click_threshold(self, landmarks):
+        """마우스 모드 클릭 판정 거리 (엄지 끝 - 검지 뿌리)"""
+        if not self.calibrated:
+            return self.mouse["click_threshold"]
+        return self.fractions["click"] * float(hand_scale(landmarks))
+
+    def predicate_terms(self, landmarks, scale=None):
+        """모든 기본 판정을 한 번에 계산. (21, 3) -> (P,), (N, 21, 3) -> (N, P)
+
+        scale 은 현재 손 크기 (threshold_scale). 없으면 DEFAULT_HAND_SCALE 기준 절대값
+        """
+        lm = np.asarray(landmarks, dtype=np.float32)
+        delta = lm[..., self.index_a, :2] - lm[..., self.index_b, :2]
+        columns = np.arange(self.num_predicates)
+        value = np.where(self.is_dist, np.hypot(delta[..., 0], delta[..., 1]), delta[..., columns, self.axis])
+        value = np.where(self.is_abs, np.abs(value), value) * self.sign
+        scale = DEFAULT_HAND_SCALE if scale is None else np.expand_dims(scale, -1)
+        return value < self.thresholds * scale
+
+    def match(self, landmarks, flags=None):
+        """규칙별 조건 충족 여부 (시간 조건 제외). 묶음 입력도 가능"""
+        lm = np.asarray(landmarks, dtype=np.float32)
+        batch_shape = lm.shape[:-2]
+        scale = self.threshold_scale(lm)
+        parts = []
+        if self.num_predicates:
+            parts.append(self.predicate_terms(lm, scale))
+        if self.uses_builtin_poses and self.pose_model is not None:
+            parts.append(self.pose_model.poses(lm))
+        elif self.uses_builtin_poses:
+            parts.append(classify_poses(lm, scale, self.pose_thresholds))
+        else:
+            parts.append(np.zeros(batch_shape + (len(POSES),), dtype=bool))
+        if self.flag_names:
+            flags = flags or {}
+            values = np.array([bool(flags.get(name, False)) for name in self.flag_names])
+            parts.append(np.broadcast_to(values, batch_shape + values.shape))
+        terms = np.concatenate(parts, axis=-1).astype(np.int32)
+        return terms @ self.table.T == self.term_counts
+
+    def evaluate(self, landmarks, now, mode, flags=None):
+        """한 프레임을 평가해서 이번 프레임에 동작해야 하는 규칙 목록을 반환"""
+        eligible = self.match(landmarks, flags) & self._mode_mask(mode)
+        winners = eligible & (self.earlier @ eligible.astype(np.int32) == 0)
+
+        # 유지 타이머: 조건이 끊긴 규칙은 초기화, 새로 시작한 규칙은 지금부터 측정
+        self.hold_start[~winners] = np.nan
+        self.hold_start[winners & np.isnan(self.hold_start)] = now
+        fired = winners & (now - self.hold_start >= self.holds) & (now - self.last_fired >= self.cooldowns)
+        if not fired.any():
+            return []
+
+        self.hold_start[fired] = np.nan
+        self.last_fired[fired] = now
+        return [self.rules[i] for i in np.flatnonzero(fired)]
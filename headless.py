@@ -0,0 +1,163 @@
+import argparse
+import json
+import time
+from gesture_control import GestureControl
+from gesture_rules import GestureRules, DEFAULT_RULES_PATH
+from frame_source import open_source
+from idle_monitor import IdleMonitor
+from injection import RecordingBackend
+from log_model import LogModel
+from parallel_inference import ParallelInference
+from replay import ReplayUI
+from roi_inference import HandInference
+
+
+class NullPreview:
+    """화면 없이 미리보기 프레임 수만 셈"""
+
+    def __init__(self):
+        self.frames = 0
+
+    def submit(self, frame, owner=None):
+        self.frames += 1
+        if owner is not None:
+            owner.release()
+
+
+class HeadlessUI(ReplayUI):
+    """Qt 없이 전체 파이프라인을 돌리기 위한 UI 대역 (로그는 LogModel 링 버퍼에 보관)"""
+
+    def __init__(self, vgesture_command="", sensitivity=0.2, verbose=False, cursor_filter="lerp", log_model=None):
+        super().__init__(vgesture_command, sensitivity, verbose, cursor_filter)
+        self.preview = NullPreview()
+        self.log_model = log_model or LogModel()
+        self.metrics = None
+
+    def update_log(self, text, **fields):
+        super().update_log(text, **fields)
+        self.log_model.append(text, mode=self.mode_text, **fields)
+
+
+class DetectionCounter:
+    """녹화기 자리에 꽂아서 프레임 수와 손이 검출된 프레임 수를 셈"""
+
+    def __init__(self):
+        self.frames = 0
+        self.detected = 0
+
+    def write(self, t, landmarks=None):
+        self.frames += 1
+        if landmarks is not None:
+            self.detected += 1
+
+    def close(self):
+        pass
+
+
+def run_headless(source, gesture_rules=None, workers=0, roi=False, roi_size=256, budget_ms=None, calibrate=False, lossless=True, idle=None, ui=None, source_options=None):
+    """프레임 공급원이 끝날 때까지 파이프라인 전체(추론 포함)를 실행하고 결과 요약을 반환
+
+    source_options 는 open_source 옵션 (fps, max_frames, loop). workers > 0 이면 캡처 프로세스에서 공급원을 만듦
+    입력 주입은 RecordingBackend 라서 실제 마우스 / 키보드는 움직이지 않음
+    lossless 이면 캡처가 추론을 기다리므로 모든 프레임이 추론됨 (끄면 실시간처럼 밀린 프레임을 버림)
+    """
+    ui = ui or HeadlessUI()
+    actuator = RecordingBackend()
+    if workers > 0:
+        gesture_control = GestureControl(ui, actuator=actuator, launcher=actuator.launch, live=False, gesture_rules=gesture_rules)
+        gesture_control.parallel = ParallelInference(
+            camera=source, workers=workers, lossless=lossless, source_options=source_options
+        )
+    else:
+        gesture_control = GestureControl(
+            ui, actuator=actuator, launcher=actuator.launch, gesture_rules=gesture_rules,
+            source=open_source(source, **(source_options or {})),
+        )
+        gesture_control.inference = HandInference(gesture_control.hands, roi=roi, roi_size=roi_size, budget_ms=budget_ms)
+    gesture_control.skip_calibration = not calibrate
+    gesture_control.lossless = lossless
+    gesture_control.idle = idle
+    counter = DetectionCounter()
+    gesture_control.recorder = counter
+    ui.metrics = gesture_control.metrics
+    if gesture_control.parallel is not None:
+        # 프로세스 생성 / 모델 로딩은 측정에서 빼고, 추론 프로세스가 모두 준비된 뒤부터 잼
+        gesture_control.parallel.start()
+
+    start = time.perf_counter()
+    gesture_control.run()
+    elapsed = time.perf_counter() - start
+
+    actions = {}
+    for call in actuator.calls:
+        actions[call[0]] = actions.get(call[0], 0) + 1
+    return {
+        "frames": counter.frames,
+        "detected": counter.detected,
+        "elapsed": elapsed,
+        "fps": counter.frames / elapsed if elapsed > 0 else 0.0,
+        "rendered": ui.preview.frames,
+        "final_mode": gesture_control.mode,
+        "actions": actions,
+        "stages": gesture_control.metrics.snapshot()["stages"],
+        "power": gesture_control.metrics.power(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="화면 / 웹캠 없이 전체 파이프라인 실행 및 처리량 측정")
+    parser.add_argument("source", help="동영상 파일, 이미지 폴더, synthetic[:WxH] 또는 카메라 번호")
+    parser.add_argument("--frames", type=int, help="최대 프레임 수 (synthetic 은 필수)")
+    parser.add_argument("--fps", type=float, help="이 속도로 프레임 공급 (기본: 최대 속도)")
+    parser.add_argument("--loop", action="store_true", help="동영상 / 이미지 폴더를 반복 (--frames 와 같이 사용)")
+    parser.add_argument("--workers", type=int, default=0, help="0 보다 크면 캡처 / 추론을 별도 프로세스로 실행")
+    parser.add_argument("--roi", action="store_true", help="이전 프레임 손 영역만 잘라서 추론")
+    parser.add_argument("--roi-size", type=int, default=256, help="ROI 추론 입력 크기 (픽셀)")
+    parser.add_argument("--inference-budget-ms", type=float, help="프레임당 추론 시간 예산")
+    parser.add_argument("--gestures", default=DEFAULT_RULES_PATH, metavar="PATH", help="제스처 규칙 설정 파일")
+    parser.add_argument("--drop-frames", action="store_true", help="실시간처럼 추론이 밀리면 프레임을 버림 (--fps 와 같이 사용)")
+    parser.add_argument("--idle-after", type=float, help="손이 이 시간(초) 동안 안 보이면 절전 모드 (기본: 끔)")
+    parser.add_argument("--idle-fps", type=float, default=4.0, help="절전 모드 캡처 속도")
+    parser.add_argument("--calibrate", action="store_true", help="손바닥 캘리브레이션을 기다림 (기본: 건너뜀)")
+    parser.add_argument("--verbose", action="store_true", help="제스처 로그 출력")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON 으로 저장 (릴리스 간 비교용)")
+    args = parser.parse_args()
+
+    if args.source.startswith("synthetic") and args.frames is None:
+        parser.error("synthetic 입력은 --frames 가 필요합니다")
+
+    ui = HeadlessUI(verbose=args.verbose)
+    result = run_headless(
+        args.source,
+        source_options={"fps": args.fps, "max_frames": args.frames, "loop": args.loop},
+        gesture_rules=GestureRules.load(args.gestures),
+        workers=args.workers,
+        roi=args.roi,
+        roi_size=args.roi_size,
+        budget_ms=args.inference_budget_ms,
+        calibrate=args.calibrate,
+        lossless=not args.drop_frames,
+        idle=IdleMonitor(args.idle_after, args.idle_fps) if args.idle_after else None,
+        ui=ui,
+    )
+    ui.log_model.close()
+
+    print(f"{args.source}: {result['frames']} 프레임 (손 검출 {result['detected']}), "
+          f"{result['elapsed']:.2f}s, {result['fps']:.1f} FPS")
+    print(f"최종 모드: {result['final_mode']}")
+    print("동작:", ", ".join(f"{name}={count}" for name, count in sorted(result["actions"].items())) or "없음")
+    for stage, values in result["stages"].items():
+        print(f"  {stage}: p50 {values['p50_ms']:.2f}ms / p99 {values['p99_ms']:.2f}ms")
+    power = result["power"]
+    if power["idle"]["wall_s"] > 0:
+        print(f"CPU 사용률: 추적 {power['active']['cpu_pct']:.0f}% / 절전 {power['idle']['cpu_pct']:.0f}% "
+              f"(절전 {power['idle']['wall_s']:.1f}s, 아낀 CPU 시간 {power['saved_cpu_s']:.1f}s)")
+
+    if args.json:
+        result["config"] = {k: v for k, v in vars(args).items() if k not in ("json", "verbose")}
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
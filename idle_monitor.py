@@ -0,0 +1,52 @@
+import time
+import cv2
+
+
+class IdleMonitor:
+    """손이 idle_after 초 동안 안 보이면 절전 상태로 전환하고, 작게 줄인 프레임 차이로 깨어날 때를 판단
+
+    절전 중에는 캡처를 idle_fps 로 줄이고 mediapipe 추론과 화면 갱신은 하지 않음
+    움직임 판정은 size 크기 흑백 이미지의 평균 밝기 차이라서 프레임당 수십 us 수준
+    """
+
+    def __init__(self, idle_after=5.0, idle_fps=4.0, threshold=3.0, size=(32, 24), clock=None):
+        self.idle_after = idle_after
+        self.idle_fps = idle_fps
+        self.threshold = threshold
+        self.size = size
+        self.clock = clock or time.perf_counter
+        self.idle = False
+        self.last_hand = self.clock()
+        self.wakeups = 0
+        self._prev = None
+
+    @property
+    def interval(self):
+        """절전 중 캡처 간격 (초)"""
+        return 1.0 / self.idle_fps if self.idle_fps > 0 else 0.0
+
+    def update(self, detected):
+        """추론 결과 반영. 이번 호출로 절전 상태에 들어가면 True"""
+        now = self.clock()
+        if detected:
+            self.last_hand = now
+            return False
+        if not self.idle and now - self.last_hand >= self.idle_after:
+            self.idle = True
+            self._prev = None
+            return True
+        return False
+
+    def moved(self, frame):
+        """직전 절전 프레임과 비교해서 움직임이 있으면 True (첫 프레임은 기준으로만 저장)"""
+        small = cv2.cvtColor(cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+        prev, self._prev = self._prev, small
+        if prev is None:
+            return False
+        return float(cv2.absdiff(small, prev).mean()) >= self.threshold
+
+    def wake(self):
+        """전체 추적으로 복귀. 다시 idle_after 초 동안 손을 기다림"""
+        self.idle = False
+        self.last_hand = self.clock()
+        self.wakeups += 1
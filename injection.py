@@ -0,0 +1,270 @@
+import os
+import sys
+import threading
+from collections import deque
+
+
+class InjectionBackend:
+    """포인터 / 키 입력 주입 백엔드 공통 인터페이스"""
+
+    name = "base"
+
+    def size(self):
+        raise NotImplementedError
+
+    def position(self):
+        raise NotImplementedError
+
+    def move_to(self, x, y):
+        raise NotImplementedError
+
+    def mouse_down(self, button="left"):
+        raise NotImplementedError
+
+    def mouse_up(self, button="left"):
+        raise NotImplementedError
+
+    def click(self, button="left"):
+        self.mouse_down(button)
+        self.mouse_up(button)
+
+    def press(self, key):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class PyAutoGUIBackend(InjectionBackend):
+    """pyautogui 백엔드 (호출마다 0.1초 쉬는 PAUSE 는 끔)"""
+
+    name = "pyautogui"
+
+    def __init__(self):
+        import pyautogui
+        pyautogui.PAUSE = 0
+        self.pyautogui = pyautogui
+
+    def size(self):
+        return self.pyautogui.size()
+
+    def position(self):
+        return self.pyautogui.position()
+
+    def move_to(self, x, y):
+        self.pyautogui.moveTo(x, y)
+
+    def mouse_down(self, button="left"):
+        self.pyautogui.mouseDown(button=button)
+
+    def mouse_up(self, button="left"):
+        self.pyautogui.mouseUp(button=button)
+
+    def click(self, button="left"):
+        self.pyautogui.click(button=button)
+
+    def press(self, key):
+        self.pyautogui.press(key)
+
+
+class XTestBackend(InjectionBackend):
+    """X 서버 XTest 확장으로 직접 입력하는 저지연 백엔드 (Linux, python-xlib 필요)"""
+
+    name = "xtest"
+    BUTTONS = {"left": 1, "middle": 2, "right": 3}
+    # pyautogui 키 이름 -> X keysym 이름
+    KEYSYMS = {
+        "volumeup": "XF86_AudioRaiseVolume",
+        "volumedown": "XF86_AudioLowerVolume",
+        "volumemute": "XF86_AudioMute",
+        "playpause": "XF86_AudioPlay",
+        "nexttrack": "XF86_AudioNext",
+        "prevtrack": "XF86_AudioPrev",
+        "enter": "Return",
+        "esc": "Escape",
+        "left": "Left",
+        "right": "Right",
+        "up": "Up",
+        "down": "Down",
+        "space": "space",
+    }
+
+    def __init__(self):
+        from Xlib import X, XK, display
+        from Xlib.ext import xtest
+        XK.load_keysym_group("xf86")
+        self.X = X
+        self.XK = XK
+        self.xtest = xtest
+        self.display = display.Display()
+        self.screen = self.display.screen()
+        self._keycodes = {}
+
+    def size(self):
+        return self.screen.width_in_pixels, self.screen.height_in_pixels
+
+    def position(self):
+        pointer = self.screen.root.query_pointer()
+        return pointer.root_x, pointer.root_y
+
+    def move_to(self, x, y):
+        self.xtest.fake_input(self.display, self.X.MotionNotify, x=int(x), y=int(y))
+        self.display.flush()
+
+    def mouse_down(self, button="left"):
+        self.xtest.fake_input(self.display, self.X.ButtonPress, self.BUTTONS[button])
+        self.display.flush()
+
+    def mouse_up(self, button="left"):
+        self.xtest.fake_input(self.display, self.X.ButtonRelease, self.BUTTONS[button])
+        self.display.flush()
+
+    def press(self, key):
+        keycode = self._keycode(key)
+        self.xtest.fake_input(self.display, self.X.KeyPress, keycode)
+        self.xtest.fake_input(self.display, self.X.KeyRelease, keycode)
+        self.display.flush()
+
+    def _keycode(self, key):
+        if key not in self._keycodes:
+            keysym = self.XK.string_to_keysym(self.KEYSYMS.get(key, key))
+            keycode = self.display.keysym_to_keycode(keysym)
+            if not keycode:
+                raise ValueError(f"지원하지 않는 키입니다: {key}")
+            self._keycodes[key] = keycode
+        return self._keycodes[key]
+
+    def close(self):
+        self.display.close()
+
+
+class RecordingBackend(InjectionBackend):
+    """실제로 입력하지 않고 호출 내용만 메모리에 기록 (리플레이 / 테스트용)"""
+
+    name = "recording"
+
+    def __init__(self, screen_size=(1920, 1080)):
+        self.screen_size = screen_size
+        self.x, self.y = screen_size[0] // 2, screen_size[1] // 2
+        self.calls = []
+
+    def size(self):
+        return self.screen_size
+
+    def position(self):
+        return self.x, self.y
+
+    def move_to(self, x, y):
+        self.x, self.y = x, y
+        self.calls.append(("move_to", x, y))
+
+    def mouse_down(self, button="left"):
+        self.calls.append(("mouse_down", button))
+
+    def mouse_up(self, button="left"):
+        self.calls.append(("mouse_up", button))
+
+    def click(self, button="left"):
+        self.calls.append(("click", button))
+
+    def press(self, key):
+        self.calls.append(("press", key))
+
+    def launch(self, command):
+        self.calls.append(("launch", command))
+
+
+class AsyncInjector(InjectionBackend):
+    """백엔드 호출을 전용 스레드에서 실행해서 호출한 쪽이 막히지 않게 함
+
+    연속으로 쌓인 이동 요청은 마지막 목표 위치 하나로 합쳐서 주입하고,
+    클릭 / 키 입력은 순서를 유지함
+    """
+
+    def __init__(self, backend, on_error=None):
+        self.backend = backend
+        self.name = backend.name
+        self.on_error = on_error
+        self.coalesced = 0
+        self._cond = threading.Condition()
+        self._queue = deque()
+        self._closed = False
+        self._position = None
+        self._screen_size = backend.size()
+        self._thread = threading.Thread(target=self._run, name="input-injector", daemon=True)
+        self._thread.start()
+
+    def size(self):
+        return self._screen_size
+
+    def position(self):
+        with self._cond:
+            if self._position is not None:
+                return self._position
+        return self.backend.position()
+
+    def move_to(self, x, y):
+        with self._cond:
+            self._position = (x, y)
+            if self._queue and self._queue[-1][0] == "move_to":
+                self._queue[-1] = ("move_to", (x, y))
+                self.coalesced += 1
+            else:
+                self._queue.append(("move_to", (x, y)))
+            self._cond.notify()
+
+    def mouse_down(self, button="left"):
+        self._enqueue("mouse_down", button)
+
+    def mouse_up(self, button="left"):
+        self._enqueue("mouse_up", button)
+
+    def click(self, button="left"):
+        self._enqueue("click", button)
+
+    def press(self, key):
+        self._enqueue("press", key)
+
+    def _enqueue(self, name, *args):
+        with self._cond:
+            self._queue.append((name, args))
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                name, args = self._queue.popleft()
+            try:
+                getattr(self.backend, name)(*args)
+            except Exception as e:
+                if self.on_error is not None:
+                    self.on_error(e)
+                else:
+                    print("입력 주입 중 에러:", e)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=1.0)
+        self.backend.close()
+
+
+BACKENDS = {cls.name: cls for cls in (PyAutoGUIBackend, XTestBackend, RecordingBackend)}
+
+
+def make_backend(name="auto"):
+    """auto 는 Linux X 세션에서 python-xlib 이 있으면 xtest, 아니면 pyautogui"""
+    if name == "auto":
+        if sys.platform.startswith("linux") and os.environ.get("DISPLAY"):
+            try:
+                return XTestBackend()
+            except Exception:
+                pass
+        return PyAutoGUIBackend()
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 입력 백엔드: {name} (사용 가능: auto, {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
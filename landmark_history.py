@@ -0,0 +1,190 @@
+import math
+import numpy as np
+from pose_classifier import NUM_LANDMARKS, classify_poses
+
+# 움직임 제스처 기본값 (gestures.json 의 "motion" 에서 바꿀 수 있음). 거리는 손 크기(0 -> 9 거리) 배수
+DEFAULT_MOTION = {
+    "window": 12,              # 기록할 최근 프레임 수
+    "max_gap": 0.25,           # 이보다 오래 손이 안 보이면 기록을 비움 (초)
+    "swipe_distance": 2.0,     # 스와이프로 볼 최소 가로 이동 거리
+    "swipe_max_duration": 0.5, # 스와이프 최대 시간 (초)
+    "swipe_straightness": 0.8, # 직선 이동 거리 / 실제 이동 경로 (1 이면 완전한 직선)
+    "flick_speed": 8.0,        # 플릭으로 볼 검지 끝의 손바닥 대비 속도 (손 크기 / 초)
+    "flick_max_palm": 0.5,     # 플릭하는 동안 손바닥이 움직여도 되는 거리
+    "flick_distance": 0.6,     # 창 안에서 검지 끝이 손바닥 대비 움직인 최소 거리
+    "flick_straightness": 0.7, # 검지 끝 직선 이동 거리 / 실제 이동 경로
+    "flick_extension": 1.2,    # 검지를 편 것으로 볼 (손목 -> 끝) / (손목 -> 둘째 마디) 거리 비
+}
+MOTION_FLAGS = ("swipe_left", "swipe_right", "flick")
+
+PALM = 9        # 손 전체 움직임 기준점 (중지 뿌리)
+INDEX_PIP = 6
+INDEX_TIP = 8
+
+
+class LandmarkHistory:
+    """최근 랜드마크를 고정 크기 링 버퍼에 보관하면서 이동량 / 경로 길이 / 속도를 누적 갱신
+
+    프레임이 들어올 때 새 구간을 더하고 밀려난 구간을 빼므로 창 크기와 관계없이 프레임당 O(1)
+    """
+
+    def __init__(self, size=DEFAULT_MOTION["window"], max_gap=DEFAULT_MOTION["max_gap"],
+                 extension=DEFAULT_MOTION["flick_extension"]):
+        self.size = size
+        self.max_gap = max_gap
+        self.extension = extension
+        self.times = np.zeros(size, dtype=np.float64)
+        self.landmarks = np.zeros((size, NUM_LANDMARKS, 3), dtype=np.float32)
+        # 손바닥 위치와 직전 프레임과의 이동 거리 (누적 경로 길이에서 빼기 위해 보관)
+        self.palm = np.zeros((size, 2), dtype=np.float64)
+        self.steps = np.zeros(size, dtype=np.float64)
+        self.scales = np.zeros(size, dtype=np.float64)
+        # 손바닥 기준 검지 끝 위치와 이동 거리, 검지를 편 프레임인지
+        self.tip = np.zeros((size, 2), dtype=np.float64)
+        self.tip_steps = np.zeros(size, dtype=np.float64)
+        self.extended = np.zeros(size, dtype=bool)
+        self.clear()
+
+    def clear(self):
+        self.count = 0
+        self.head = -1          # 가장 최근 프레임 위치
+        self.path_length = 0.0  # 창 안의 손바닥 이동 경로 길이 (첫 프레임의 구간은 제외)
+        self.tip_path_length = 0.0
+        self.bent = 0           # 창 안에서 검지를 굽힌 프레임 수
+        self.scale_sum = 0.0
+        self.velocity = (0.0, 0.0)
+        self.tip_speed = 0.0    # 검지 끝의 손바닥 대비 속도 (정규화 좌표 / 초)
+
+    def __len__(self):
+        return self.count
+
+    def push(self, t, landmarks):
+        lm = np.asarray(landmarks, dtype=np.float32)
+        if self.count and t - self.times[self.head] > self.max_gap:
+            self.clear()
+
+        palm_x, palm_y = float(lm[PALM, 0]), float(lm[PALM, 1])
+        scale = math.hypot(float(lm[0, 0] - lm[PALM, 0]), float(lm[0, 1] - lm[PALM, 1]))
+        tip_x, tip_y = float(lm[INDEX_TIP, 0]) - palm_x, float(lm[INDEX_TIP, 1]) - palm_y
+        reach = math.hypot(float(lm[INDEX_TIP, 0] - lm[0, 0]), float(lm[INDEX_TIP, 1] - lm[0, 1]))
+        pip = math.hypot(float(lm[INDEX_PIP, 0] - lm[0, 0]), float(lm[INDEX_PIP, 1] - lm[0, 1]))
+        extended = reach > pip * self.extension
+        step = 0.0
+        tip_step = 0.0
+        if self.count:
+            prev = self.head
+            dt = t - self.times[prev]
+            dx = palm_x - self.palm[prev, 0]
+            dy = palm_y - self.palm[prev, 1]
+            step = math.hypot(dx, dy)
+            tip_step = math.hypot(tip_x - self.tip[prev, 0], tip_y - self.tip[prev, 1])
+            if dt > 0:
+                self.velocity = (dx / dt, dy / dt)
+                self.tip_speed = tip_step / dt
+
+        self.head = (self.head + 1) % self.size
+        if self.count == self.size:
+            # 가장 오래된 프레임이 밀려나면 그 프레임 "다음" 구간이 창의 첫 구간이 되므로 경로에서 뺌
+            oldest = self.head
+            self.scale_sum -= self.scales[oldest]
+            self.bent -= not self.extended[oldest]
+            self.path_length -= self.steps[(oldest + 1) % self.size]
+            self.tip_path_length -= self.tip_steps[(oldest + 1) % self.size]
+        else:
+            self.count += 1
+
+        i = self.head
+        self.times[i] = t
+        self.landmarks[i] = lm
+        self.palm[i] = (palm_x, palm_y)
+        self.steps[i] = step
+        self.scales[i] = scale
+        self.tip[i] = (tip_x, tip_y)
+        self.tip_steps[i] = tip_step
+        self.extended[i] = extended
+        self.path_length += step
+        self.tip_path_length += tip_step
+        self.bent += not extended
+        self.scale_sum += scale
+
+    @property
+    def oldest(self):
+        return (self.head - self.count + 1) % self.size
+
+    def duration(self):
+        return self.times[self.head] - self.times[self.oldest] if self.count else 0.0
+
+    def displacement(self):
+        """창의 처음부터 지금까지 손바닥 이동 (dx, dy)"""
+        if not self.count:
+            return 0.0, 0.0
+        delta = self.palm[self.head] - self.palm[self.oldest]
+        return float(delta[0]), float(delta[1])
+
+    def tip_displacement(self):
+        """창의 처음부터 지금까지 손바닥 기준 검지 끝 이동 (dx, dy)"""
+        if not self.count:
+            return 0.0, 0.0
+        delta = self.tip[self.head] - self.tip[self.oldest]
+        return float(delta[0]), float(delta[1])
+
+    def mean_scale(self):
+        return self.scale_sum / self.count if self.count else 0.0
+
+
+class MotionDetector:
+    """LandmarkHistory 위에서 스와이프 / 플릭을 판정해서 규칙 엔진용 플래그 dict 로 반환
+
+    플릭은 창 전체에서 검지를 편 채로 검지 끝이 한 방향으로 빠르게 움직인 경우만 인정
+    (손가락을 접는 동작과 구분하려고, 손 모양이 바뀐 프레임에서는 판정하지 않음)
+    """
+
+    def __init__(self, config=None):
+        self.config = {**DEFAULT_MOTION, **(config or {})}
+        self.history = LandmarkHistory(int(self.config["window"]), self.config["max_gap"], self.config["flick_extension"])
+        self._pose = None
+
+    def reset(self):
+        self.history.clear()
+        self._pose = None
+
+    def update(self, t, landmarks):
+        history = self.history
+        history.push(t, landmarks)
+        pose = classify_poses(history.landmarks[history.head]).tobytes()
+        pose_changed = self._pose is not None and pose != self._pose
+        self._pose = pose
+        flags = dict.fromkeys(MOTION_FLAGS, False)
+        scale = history.mean_scale()
+        if history.count < 3 or scale <= 0:
+            return flags
+
+        config = self.config
+        dx, dy = history.displacement()
+        distance = math.hypot(dx, dy) / scale
+        straight = math.hypot(dx, dy) / history.path_length if history.path_length > 0 else 0.0
+        if (abs(dx) / scale >= config["swipe_distance"]
+                and abs(dy) < abs(dx) * 0.5
+                and straight >= config["swipe_straightness"]
+                and history.duration() <= config["swipe_max_duration"]):
+            flags["swipe_right" if dx > 0 else "swipe_left"] = True
+        elif (not pose_changed
+                and history.bent == 0
+                and history.tip_speed / scale >= config["flick_speed"]
+                and distance <= config["flick_max_palm"]
+                and self._flick_direction(scale)):
+            flags["flick"] = True
+
+        if flags["swipe_left"] or flags["swipe_right"] or flags["flick"]:
+            # 같은 움직임이 다음 프레임에서 또 잡히지 않도록 새로 시작
+            history.clear()
+        return flags
+
+    def _flick_direction(self, scale):
+        """검지 끝이 창 안에서 충분히, 거의 직선으로 움직였는지"""
+        history = self.history
+        if history.tip_path_length <= 0:
+            return False
+        tip_distance = math.hypot(*history.tip_displacement())
+        return (tip_distance / scale >= self.config["flick_distance"]
+                and tip_distance / history.tip_path_length >= self.config["flick_straightness"])
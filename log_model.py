@@ -0,0 +1,97 @@
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+DEFAULT_CAPACITY = 2000
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """로그 한 건을 JSON 한 줄로 (시각, 단계, 메시지, 모드, 제스처 등)"""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)),
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class LogModel:
+    """크기가 고정된 링 버퍼 로그
+
+    append() 는 어느 스레드에서나 호출할 수 있고 잠깐 잠금만 잡음
+    UI 는 take_pending() 으로 쌓인 항목을 주기적으로 한 번에 가져가서 그림
+    path 를 주면 파일 기록은 QueueHandler -> 전용 스레드의 RotatingFileHandler 로 넘겨서 호출한 쪽을 막지 않음
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, path=None, max_bytes=5 * 1024 * 1024, backup_count=3):
+        self.capacity = capacity
+        self.entries = deque(maxlen=capacity)
+        self.dropped = 0
+        self._pending = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._logger = None
+        self._listener = None
+        self._handler = None
+        if path:
+            self._open_file(path, max_bytes, backup_count)
+
+    def _open_file(self, path, max_bytes, backup_count):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+        handler.setFormatter(JsonLinesFormatter())
+        self._handler = handler
+        log_queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(log_queue, handler)
+        self._listener.start()
+
+        self._logger = logging.getLogger(f"gesture_control.events.{id(self)}")
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        self._logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    def append(self, text, level=logging.INFO, **fields):
+        entry = (time.time(), text, fields)
+        with self._lock:
+            self.entries.append(entry)
+            if len(self._pending) == self.capacity:
+                # 화면에 그리기 전에 밀려난 항목 (어차피 화면 버퍼에서도 잘렸을 것)
+                self.dropped += 1
+            self._pending.append(entry)
+        logger = self._logger
+        if logger is not None:
+            logger.log(level, text, extra={"fields": {k: v for k, v in fields.items() if v is not None}})
+
+    def take_pending(self):
+        """마지막 호출 이후 새로 들어온 항목 목록"""
+        with self._lock:
+            items = list(self._pending)
+            self._pending.clear()
+        return items
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self._pending.clear()
+
+    def close(self):
+        """남은 파일 기록을 마치고 파일을 닫음"""
+        if self._listener is None:
+            return
+        self._logger.handlers.clear()
+        self._logger = None
+        self._listener.stop()
+        self._listener = None
+        self._handler.close()
@@ -1,38 +1,34 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import hashlib
-import requests
 import subprocess
+import threading
 import sys
 import os
+from api_client import ApiClient, TkApiWorker, BASE_URL
 
 def hash_password(password):
     return hashlib.sha256(password.encode()).hexdigest()
 
 # --- 로그인 요청 ---
+# 요청은 api_worker 스레드에서 보내고 결과만 Tk 루프에서 처리 (서버가 느려도 창이 멈추지 않음)
+api = ApiClient(BASE_URL)
 
-SERVER_IP = "123.45.67.89"  # 실제 서버 IP 또는 도메인
-SERVER_PORT = 8080
-BASE_URL = f"http://{SERVER_IP}:{SERVER_PORT}/api"
+def show_server_error(e):
+    messagebox.showerror("서버 오류", str(e))
 
 def login():
     user_id = entry_login_id.get()
     user_pw = entry_login_pw.get()
     hashed_pw = hash_password(user_pw)
 
-    try:
-        response = requests.post(f"{BASE_URL}/login", json={
-            "username": user_id,
-            "password": hashed_pw
-        })
-
-        result = response.json()
+    def on_result(result):
         if result.get("status") == "success":
-            launch_main_program()
+            launch_main_program(result.get("user_id", user_id))
         else:
             messagebox.showerror("로그인 실패", "아이디 또는 비밀번호가 틀렸습니다.")
-    except requests.exceptions.RequestException as e:
-        messagebox.showerror("서버 오류", f"서버 연결 실패: {e}")
+
+    api_worker.submit(api.login, user_id, hashed_pw, on_success=on_result, on_error=show_server_error)
 
 # --- 회원가입 요청 ---
 def submit_registration():
@@ -50,25 +46,58 @@ def submit_registration():
         messagebox.showerror("비밀번호 오류", "비밀번호가 일치하지 않습니다.")
         return
 
-    try:
-        response = requests.post("http://localhost:5000/api/register", json={
-            "id": user_id,
-            "name": name,
-            "phone": phone,
-            "email": email,
-            "password": hash_password(password)
-        })
-        result = response.json()
+    def on_result(result):
         if result.get("status") == "success":
             messagebox.showinfo("회원가입 완료", "회원가입 성공!\n로그인 화면으로 이동합니다.")
             show_login_screen()
         else:
             messagebox.showerror("회원가입 실패", result.get("message", "알 수 없는 오류"))
-    except requests.exceptions.RequestException as e:
-        messagebox.showerror("서버 오류", f"서버 연결 실패: {e}")
+
+    api_worker.submit(api.register, {
+        "id": user_id,
+        "name": name,
+        "phone": phone,
+        "email": email,
+        "password": hash_password(password)
+    }, on_success=on_result, on_error=show_server_error)
+
+# --- 메인 프로그램 미리 실행 ---
+# GESTURE_PREWARM=1 이면 로그인 화면이 떠 있는 동안 main.py 를 --prewarm 으로 띄워서 카메라 / 모델 초기화를 끝내 둠
+# 로그인 전에 카메라를 켜게 되므로 기본은 끔 (로그인에 성공한 뒤에 실행)
+PREWARM = os.environ.get("GESTURE_PREWARM", "") not in ("", "0")
+main_process = None
+main_ready = threading.Event()
+
+def start_main_process(*args):
+    global main_process
+    main_ready.clear()
+    main_process = subprocess.Popen(
+        [sys.executable, "main.py", "--api-url", BASE_URL, *args],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+    )
+    threading.Thread(target=watch_main_output, args=(main_process,), daemon=True).start()
+
+def watch_main_output(process):
+    # main.py 는 초기화가 끝나면 "READY ..." 한 줄을 출력함. 나머지 출력은 그대로 전달
+    for line in process.stdout:
+        if line.startswith("READY") and process is main_process:
+            main_ready.set()
+        print(line, end="")
+
+def prewarm_main_program():
+    if not PREWARM:
+        return
+    try:
+        start_main_process("--prewarm")
+    except OSError as e:
+        print("메인 프로그램 미리 실행 실패:", e)
 
 # --- 프로그램 실행 ---
-def launch_main_program():
+def launch_main_program(user_id):
     root.withdraw()
     loading = tk.Toplevel(root)
     loading.title("로딩 중...")
@@ -78,10 +107,25 @@ def launch_main_program():
     progress = ttk.Progressbar(loading, mode='indeterminate')
     progress.pack(pady=10, padx=20, fill="x")
     progress.start(10)
-    def open_main():
-        loading.destroy()
-        subprocess.Popen([sys.executable, "main.py"], cwd=os.path.dirname(__file__))
-    loading.after(3000, open_main)
+
+    # 사용자별 캘리브레이션 프로필을 쓰도록 로그인한 ID 를 넘김
+    try:
+        main_process.stdin.write(f"START {user_id}\n")
+        main_process.stdin.flush()
+    except (AttributeError, OSError, ValueError):
+        # 미리 띄운 프로세스가 없거나 종료됐으면 바로 실행
+        start_main_process("--user", user_id)
+
+    def wait_ready():
+        if main_ready.is_set():
+            loading.destroy()
+        elif main_process.poll() is not None:
+            loading.destroy()
+            root.deiconify()
+            messagebox.showerror("실행 오류", "메인 프로그램이 종료되었습니다.")
+        else:
+            loading.after(100, wait_ready)
+    wait_ready()
 
 # --- 화면 구성 ---
 def show_login_screen():
@@ -136,6 +180,12 @@ def clear_screen():
         widget.destroy()
 
 def on_closing():
+    # 로그인하지 않고 닫으면 미리 띄운 메인 프로그램은 표준 입력이 닫힌 것을 보고 종료함
+    if main_process is not None:
+        try:
+            main_process.stdin.close()
+        except OSError:
+            pass
     root.destroy()
     sys.exit()
 
@@ -152,8 +202,10 @@ def fade_in(window):
 
 # --- 실행 ---
 root = tk.Tk()
+api_worker = TkApiWorker(root)
 setup_window("로그인", 500, 600)
 root.protocol("WM_DELETE_WINDOW", on_closing)
 fade_in(root)
 show_login_screen()
+prewarm_main_program()
 root.mainloop()
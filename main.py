@@ -1,27 +1,68 @@
 import sys
-import threading
+import argparse
 from PyQt6.QtWidgets import QApplication
 from ui import GestureControlUI
-from gesture_control import GestureControl
+from injection import BACKENDS
+from gesture_rules import DEFAULT_RULES_PATH
+from log_model import LogModel, DEFAULT_CAPACITY
+# gesture_control / mediapipe 등 무거운 모듈은 창을 띄운 뒤 PipelineStartup 에서 import
+from startup import PipelineStartup, LauncherCommands
 
-def start_gesture_recognition(gesture_control):
-    """제스처 인식을 별도 스레드로 실행"""
-    gesture_control.run()
+def parse_args():
+    parser = argparse.ArgumentParser(description="PC Gesture Control")
+    parser.add_argument("--user", help="로그인한 사용자 ID (캘리브레이션 프로필을 사용자별로 저장)")
+    parser.add_argument("--api-url", help="설정 API 주소 (예: http://host:8080/api). 주면 캘리브레이션 프로필을 서버에도 저장")
+    parser.add_argument("--prewarm", action="store_true", help="창을 띄우지 않고 초기화만 해 둔 뒤 표준 입력의 'START <user_id>' 를 기다림")
+    parser.add_argument("--recalibrate", action="store_true", help="저장된 캘리브레이션 프로필을 무시하고 다시 측정")
+    parser.add_argument("--record", metavar="PATH", help="프레임별 손 랜드마크를 녹화할 파일 경로")
+    parser.add_argument("--workers", type=int, default=0, help="0 보다 크면 캡처 / 추론을 별도 프로세스로 실행 (추론 프로세스 수)")
+    parser.add_argument("--camera", default="0", help="카메라 번호, 동영상 파일, 이미지 폴더 또는 synthetic[:WxH]")
+    parser.add_argument("--roi", action="store_true", help="이전 프레임 손 영역만 잘라서 추론")
+    parser.add_argument("--roi-size", type=int, default=256, help="ROI 추론 입력 크기 (픽셀)")
+    parser.add_argument("--inference-budget-ms", type=float, help="프레임당 추론 시간 예산. 넘으면 해상도를 낮추거나 프레임을 건너뜀")
+    parser.add_argument("--injection", default="auto", choices=["auto"] + sorted(BACKENDS), help="마우스 / 키 입력 주입 방식")
+    parser.add_argument("--idle-after", type=float, default=5.0, help="손이 이 시간(초) 동안 안 보이면 절전 모드 (0 이면 끔, --workers 와는 같이 안 됨)")
+    parser.add_argument("--idle-fps", type=float, default=4.0, help="절전 모드 캡처 속도 (움직임이 감지되면 추적 재개)")
+    parser.add_argument("--predict-ms", type=float, default=0.0, help="커서 필터의 속도 기반 예측 시간 (파이프라인 지연 보정)")
+    parser.add_argument("--gestures", default=DEFAULT_RULES_PATH, metavar="PATH", help="제스처 규칙 설정 파일")
+    parser.add_argument("--pose-model", metavar="PATH", help="gesture_model.py 로 학습한 포즈 분류 모델 (기본: 규칙 기반 판정)")
+    parser.add_argument("--log-file", default="gesture_log.jsonl", metavar="PATH", help="이벤트 로그 JSONL 파일 (크기가 차면 회전, 빈 값이면 기록 안 함)")
+    parser.add_argument("--log-capacity", type=int, default=DEFAULT_CAPACITY, help="화면에 유지할 로그 줄 수")
+    parser.add_argument("--metrics-out", metavar="PATH", help="성능 지표를 주기적으로 기록할 파일 (.jsonl 또는 .csv)")
+    parser.add_argument("--metrics-interval", type=float, default=5.0, help="성능 지표 기록 주기 (초)")
+    # 나머지 인자는 Qt 에 그대로 넘김
+    return parser.parse_known_args()
 
 def main():
-    app = QApplication(sys.argv)
-    window = GestureControlUI()
+    args, qt_args = parse_args()
+    app = QApplication(sys.argv[:1] + qt_args)
+    window = GestureControlUI(LogModel(args.log_capacity, args.log_file or None))
 
-    gesture_control = GestureControl(window)
-    gesture_thread = threading.Thread(
-        target=start_gesture_recognition, 
-        args=(gesture_control,), 
-        daemon=True
-    )
-    gesture_thread.start()
+    def login(user_id):
+        # 서버 설정은 백그라운드에서 받아서 반영 (창은 로컬 설정으로 바로 뜸)
+        if user_id and args.api_url:
+            window.settings.attach_remote(user_id, args.api_url)
 
-    window.show()
-    sys.exit(app.exec())
+    startup = PipelineStartup(args, window, prewarm=args.prewarm)
+    if args.prewarm:
+        # 로그인 전에 미리 띄워진 프로세스: 런처가 START 를 보내면 창을 보여주고 인식 시작
+        commands = LauncherCommands(app)
+        commands.started.connect(lambda user_id: (login(user_id), startup.begin(user_id), window.show()))
+        commands.closed.connect(app.quit)
+        commands.listen()
+    else:
+        login(args.user)
+        window.show()
+    startup.start()
+    exit_code = app.exec()
+
+    # 창이 닫히면 파이프라인을 멈추고 녹화 파일을 마무리
+    startup.stop()
+    startup.join(timeout=2.0)
+    startup.close()
+    window.settings.close()
+    window.log_model.close()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,151 @@
+import csv
+import json
+import os
+import platform
+import threading
+import time
+from collections import deque
+import numpy as np
+
+# 파이프라인 단계 (latency 는 캡처부터 동작 처리까지의 전체 지연)
+STAGES = ("capture", "convert", "inference", "classify", "actuate", "render", "latency")
+PERCENTILES = (50, 90, 99)
+# 전원 상태 (idle 은 손이 없어 캡처 / 추론을 줄인 절전 상태)
+POWER_STATES = ("active", "idle")
+
+
+class PipelineMetrics:
+    """단계별 처리 시간을 최근 구간 단위로 모아서 FPS 와 백분위 지연을 계산
+
+    시간은 모두 time.perf_counter() 기준 (단조 증가)
+    """
+
+    def __init__(self, window=600, fps_window=2.0):
+        self._lock = threading.Lock()
+        self.samples = {stage: deque(maxlen=window) for stage in STAGES}
+        self.counts = dict.fromkeys(STAGES, 0)
+        self.fps_window = fps_window
+        self.frame_times = deque()
+        # 상태별 누적 경과 시간 / 프로세스 CPU 시간 (초)
+        self.power_state = "active"
+        self._power = {state: [0.0, 0.0] for state in POWER_STATES}
+        self._power_since = (time.perf_counter(), time.process_time())
+
+    def record(self, stage, seconds):
+        with self._lock:
+            self.samples[stage].append(seconds)
+            self.counts[stage] += 1
+
+    def frame_done(self, t=None):
+        """추론까지 끝난 프레임 하나를 FPS 계산에 반영"""
+        t = time.perf_counter() if t is None else t
+        with self._lock:
+            self.frame_times.append(t)
+            while self.frame_times and t - self.frame_times[0] > self.fps_window:
+                self.frame_times.popleft()
+
+    def fps(self, now=None):
+        now = time.perf_counter() if now is None else now
+        with self._lock:
+            # 파이프라인이 멈췄을 때 오래된 FPS 가 남지 않도록 현재 시각 기준으로 정리
+            while self.frame_times and now - self.frame_times[0] > self.fps_window:
+                self.frame_times.popleft()
+            if len(self.frame_times) < 2:
+                return 0.0
+            span = self.frame_times[-1] - self.frame_times[0]
+            return (len(self.frame_times) - 1) / span if span > 0 else 0.0
+
+    def set_power_state(self, state):
+        """지금까지의 시간을 이전 상태에 반영하고 상태를 바꿈"""
+        with self._lock:
+            self._accumulate_power()
+            self.power_state = state
+
+    def _accumulate_power(self):
+        wall, cpu = time.perf_counter(), time.process_time()
+        since_wall, since_cpu = self._power_since
+        totals = self._power[self.power_state]
+        totals[0] += wall - since_wall
+        totals[1] += cpu - since_cpu
+        self._power_since = (wall, cpu)
+
+    def power(self):
+        """상태별 경과 / CPU 시간과 CPU 사용률(%), 절전으로 아낀 CPU 시간 추정값
+
+        saved_cpu_s = 절전 시간 * (추적 중 CPU 사용률 - 절전 중 CPU 사용률)
+        """
+        with self._lock:
+            self._accumulate_power()
+            totals = {state: list(values) for state, values in self._power.items()}
+            state = self.power_state
+        result = {"state": state}
+        for name, (wall, cpu) in totals.items():
+            result[name] = {"wall_s": wall, "cpu_s": cpu, "cpu_pct": cpu / wall * 100.0 if wall > 0 else 0.0}
+        active, idle = result["active"], result["idle"]
+        saved = idle["wall_s"] * (active["cpu_pct"] - idle["cpu_pct"]) / 100.0 if active["wall_s"] > 0 else 0.0
+        result["saved_cpu_s"] = max(saved, 0.0)
+        return result
+
+    def snapshot(self):
+        """현재 FPS 와 단계별 p50/p90/p99 (ms) 를 dict 로 반환"""
+        fps = self.fps()
+        with self._lock:
+            samples = {stage: np.array(values) for stage, values in self.samples.items()}
+            counts = dict(self.counts)
+
+        stages = {}
+        for stage, values in samples.items():
+            if len(values) == 0:
+                continue
+            p = np.percentile(values, PERCENTILES) * 1000.0
+            stages[stage] = {"count": counts[stage], "mean_ms": float(values.mean() * 1000.0)}
+            stages[stage].update({f"p{q}_ms": float(v) for q, v in zip(PERCENTILES, p)})
+        return {"time": time.time(), "fps": fps, "stages": stages, "power": self.power()}
+
+    def status_text(self):
+        snap = self.snapshot()
+        if snap["power"]["state"] == "idle":
+            return f"절전 중 (CPU 절약 {snap['power']['saved_cpu_s']:.0f}s)"
+        latency = snap["stages"].get("latency")
+        if latency is None:
+            return f"FPS: {snap['fps']:.1f}"
+        return f"FPS: {snap['fps']:.1f} | 지연 p50 {latency['p50_ms']:.1f}ms / p99 {latency['p99_ms']:.1f}ms"
+
+
+class MetricsExporter(threading.Thread):
+    """일정 주기로 지표를 JSONL 또는 CSV(.csv 확장자) 파일에 추가 기록"""
+
+    def __init__(self, metrics, path, interval=5.0):
+        super().__init__(name="metrics-exporter", daemon=True)
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self.stop_event = threading.Event()
+        self.host = {"host": platform.node(), "platform": platform.platform(), "python": platform.python_version()}
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            self.export()
+
+    def stop(self):
+        self.stop_event.set()
+        self.export()
+
+    def export(self):
+        snap = self.metrics.snapshot()
+        if self.path.endswith(".csv"):
+            self._write_csv(snap)
+        else:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({**self.host, **snap}, ensure_ascii=False) + "\n")
+
+    def _write_csv(self, snap):
+        # 단계별 한 줄씩 기록
+        fields = ["time", "host", "platform", "python", "fps", "stage", "count", "mean_ms"] + [f"p{q}_ms" for q in PERCENTILES]
+        new_file = not os.path.exists(self.path)
+        with open(self.path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            if new_file:
+                writer.writeheader()
+            for stage, values in snap["stages"].items():
+                writer.writerow({"time": snap["time"], "fps": snap["fps"], "stage": stage, **self.host, **values})
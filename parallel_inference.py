@@ -0,0 +1,262 @@
+import multiprocessing
+import queue
+import time
+from multiprocessing import shared_memory
+import cv2
+import numpy as np
+from pose_classifier import NUM_LANDMARKS, to_array
+from frame_source import open_source
+from preprocess import BufferPool
+
+
+class SharedRing:
+    """공유 메모리 한 블록 위의 프레임 / 랜드마크 슬롯 묶음
+
+    프로세스 사이에는 슬롯 번호만 주고받고, 프레임 자체는 복사하거나 pickle 하지 않음
+    """
+
+    def __init__(self, slots, shape, name=None):
+        self.slots = slots
+        self.shape = tuple(shape)
+        frame_bytes = slots * int(np.prod(self.shape))
+        landmark_bytes = slots * NUM_LANDMARKS * 3 * 4
+
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=frame_bytes + landmark_bytes)
+        else:
+            # spawn 으로 만든 자식 프로세스는 부모의 resource_tracker 를 같이 쓰므로
+            # 여기서 등록을 해제하면 안 됨 (해제는 블록을 만든 쪽이 unlink 할 때)
+            self.shm = shared_memory.SharedMemory(name=name)
+
+        self.frames = np.ndarray((slots,) + self.shape, dtype=np.uint8, buffer=self.shm.buf)
+        self.landmarks = np.ndarray((slots, NUM_LANDMARKS, 3), dtype=np.float32, buffer=self.shm.buf, offset=frame_bytes)
+
+    def spec(self):
+        return self.slots, self.shape, self.shm.name
+
+    def close(self):
+        # numpy 뷰가 남아 있으면 공유 메모리를 닫을 수 없음
+        self.frames = None
+        self.landmarks = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _next_slot(free_slots, stop_event, lossless):
+    """빈 슬롯 번호. 없으면 None (lossless 이면 빈 슬롯이 생기거나 종료할 때까지 기다림)"""
+    if not lossless:
+        try:
+            return free_slots.get_nowait()
+        except queue.Empty:
+            return None
+    while not stop_event.is_set():
+        try:
+            return free_slots.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return None
+
+
+def _capture_main(camera, conn, free_slots, tasks, stop_event, lossless=False, source_options=None):
+    """캡처 프로세스: 카메라 프레임을 RGB 로 바꾸고 빈 슬롯에 좌우 반전해서 쓴 뒤 슬롯 번호를 작업 큐에 넣음
+
+    부모가 추론 프로세스 준비를 마치고 링 버퍼 정보를 보내면 (크기 확인에 쓴 첫 프레임부터) 캡처를 시작함
+    """
+    cap = open_source(camera, **(source_options or {}))
+    ret, raw = cap.read()
+    if not ret:
+        conn.send(None)
+        return
+    conn.send(raw.shape)
+    ring = SharedRing(*conn.recv())
+    rgb = np.empty(raw.shape, dtype=np.uint8)
+
+    seq = 0
+    first = True
+    try:
+        while not stop_event.is_set():
+            if not first:
+                ret, raw = cap.read(raw)
+                if not ret:
+                    break
+            first = False
+            captured_at = time.perf_counter()
+            slot = _next_slot(free_slots, stop_event, lossless)
+            if slot is None:
+                # 모든 슬롯이 추론 중이면 이 프레임은 버림 (최신 프레임 우선)
+                continue
+            # 변환은 슬롯을 받은 프레임만 (추론 프로세스는 슬롯을 그대로 mediapipe 에 넘김)
+            cv2.cvtColor(raw, cv2.COLOR_BGR2RGB, dst=rgb)
+            cv2.flip(rgb, 1, dst=ring.frames[slot])
+            tasks.put((seq, slot, captured_at))
+            seq += 1
+    finally:
+        # 끝 표시: 추론 프로세스들이 남은 작업을 마치고 차례로 종료함
+        tasks.put(None)
+        cap.release()
+        ring.close()
+
+
+def _inference_main(spec, tasks, results, ready):
+    """추론 프로세스: 슬롯의 프레임으로 손 랜드마크를 구해서 같은 슬롯에 기록"""
+    import mediapipe as mp
+    ring = SharedRing(*spec)
+    hands = mp.solutions.hands.Hands(
+        max_num_hands=1,
+        min_detection_confidence=0.7,
+        min_tracking_confidence=0.5
+    )
+    # 첫 추론의 그래프 초기화 비용을 첫 프레임이 오기 전에 치름
+    hands.process(np.zeros(ring.shape, dtype=np.uint8))
+    ready.put(True)
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                # 다른 추론 프로세스도 끝나도록 끝 표시를 다시 넣음
+                tasks.put(None)
+                results.put(None)
+                break
+            seq, slot, captured_at = task
+            start = time.perf_counter()
+            detected = hands.process(ring.frames[slot]).multi_hand_landmarks
+            if detected:
+                ring.landmarks[slot] = to_array(detected[0])
+            results.put((seq, slot, captured_at, bool(detected), time.perf_counter() - start))
+    finally:
+        hands.close()
+        ring.close()
+
+
+class ParallelInference:
+    """캡처 1개 + 추론 여러 개 프로세스를 공유 메모리 링 버퍼로 연결
+
+    카메라가 여러 대면 카메라마다 인스턴스를 하나씩 만들면 됨
+    lossless 이면 캡처가 빈 슬롯을 기다리고 결과도 순서대로 모아서 넘기므로 모든 프레임이 추론됨 (동영상 벤치마크용)
+    """
+
+    def __init__(self, camera=0, workers=2, slots=None, lossless=False, source_options=None):
+        # 공급원은 캡처 프로세스 안에서 만들므로 open_source 의 문자열 설정과 옵션(fps, max_frames, loop)으로 받음
+        self.camera = camera
+        self.source_options = source_options
+        self.num_workers = workers
+        self.lossless = lossless
+        # 추론 중인 슬롯 + 대기 슬롯 + 메인 프로세스가 읽는 슬롯
+        self.num_slots = slots or workers + 2
+        self.ring = None
+        self.pool = None
+        self.last_seq = -1
+        self.dropped = 0
+        self.finished = 0
+        self._pending = {}  # lossless 에서 순서보다 먼저 도착한 결과 (seq -> 결과)
+
+    def start(self, timeout=10.0, ready_timeout=60.0):
+        """캡처 / 추론 프로세스를 띄우고 모든 추론 프로세스가 모델 초기화를 마칠 때까지 기다림
+
+        캡처는 그 뒤에 시작하므로 반환 직후부터가 실제 처리 시간 (프로세스 생성 / 모델 로딩 제외)
+        """
+        # Qt 와 스레드가 있는 프로세스에서 fork 는 위험하므로 spawn 사용
+        ctx = multiprocessing.get_context("spawn")
+        self.stop_event = ctx.Event()
+        self.free_slots = ctx.Queue()
+        self.tasks = ctx.Queue()
+        self.results = ctx.Queue()
+        parent_conn, child_conn = ctx.Pipe()
+
+        self.capture = ctx.Process(
+            target=_capture_main,
+            args=(self.camera, child_conn, self.free_slots, self.tasks, self.stop_event, self.lossless, self.source_options),
+            name="gesture-capture",
+            daemon=True,
+        )
+        self.capture.start()
+        if not parent_conn.poll(timeout):
+            self.stop()
+            raise RuntimeError("카메라 프로세스가 응답하지 않습니다.")
+        shape = parent_conn.recv()
+        if shape is None:
+            self.stop()
+            raise RuntimeError("카메라를 열 수 없습니다.")
+
+        self.ring = SharedRing(self.num_slots, shape)
+        # 슬롯은 곧 다음 프레임에 쓰이므로 메인 프로세스 쪽 재사용 버퍼로 옮겨서 넘김
+        self.pool = BufferPool(shape)
+        for slot in range(self.num_slots):
+            self.free_slots.put(slot)
+
+        ready = ctx.Queue()
+        self.workers = [
+            ctx.Process(
+                target=_inference_main,
+                args=(self.ring.spec(), self.tasks, self.results, ready),
+                name=f"gesture-inference-{i}",
+                daemon=True,
+            )
+            for i in range(self.num_workers)
+        ]
+        for worker in self.workers:
+            worker.start()
+        deadline = time.perf_counter() + ready_timeout
+        for _ in self.workers:
+            try:
+                ready.get(timeout=max(deadline - time.perf_counter(), 0.0))
+            except queue.Empty:
+                self.stop()
+                raise RuntimeError("추론 프로세스가 준비되지 않았습니다.") from None
+        # 추론 준비가 끝난 뒤에 링 버퍼 정보를 보내서 캡처를 시작시킴
+        parent_conn.send(self.ring.spec())
+
+    def alive(self):
+        """모든 추론 프로세스가 끝 표시를 보내기 전까지는 (또는 모아 둔 결과가 남아 있으면) 결과가 더 올 수 있음"""
+        return self.finished < self.num_workers or bool(self._pending)
+
+    def get(self, timeout=0.1):
+        """다음 결과 (captured_at, RGB 프레임 버퍼, 랜드마크 또는 None, 추론 시간)
+
+        여러 추론 프로세스의 결과가 순서가 뒤바뀌어 도착하면 이미 지난 프레임은 버림
+        (lossless 이면 버리지 않고 앞 프레임 결과가 올 때까지 모아 두었다가 순서대로 넘김)
+        """
+        deadline = time.perf_counter() + timeout
+        while True:
+            result = self._pending.pop(self.last_seq + 1, None)
+            if result is None and self._pending and self.finished >= self.num_workers:
+                # 추론 프로세스가 모두 끝났으면 모아 둔 결과를 남김없이 넘김
+                result = self._pending.pop(min(self._pending))
+            if result is None:
+                remaining = deadline - time.perf_counter()
+                try:
+                    result = self.results.get(timeout=max(remaining, 0.0))
+                except queue.Empty:
+                    return None
+                if result is None:
+                    self.finished += 1
+                    if not self.alive():
+                        return None
+                    continue
+            seq, slot, captured_at, detected, elapsed = result
+            if self.lossless and seq > self.last_seq + 1:
+                self._pending[seq] = result
+                continue
+            if seq <= self.last_seq:
+                self.dropped += 1
+                self.free_slots.put(slot)
+                continue
+            self.last_seq = seq
+            frame = self.pool.wrap(self.ring.frames[slot])
+            landmarks = self.ring.landmarks[slot].copy() if detected else None
+            self.free_slots.put(slot)
+            return captured_at, frame, landmarks, elapsed
+
+    def stop(self):
+        self.stop_event.set()
+        for _ in getattr(self, "workers", []):
+            self.tasks.put(None)
+        for process in [self.capture] + getattr(self, "workers", []):
+            process.join(timeout=2.0)
+            if process.is_alive():
+                process.terminate()
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
@@ -0,0 +1,79 @@
+import threading
+
+
+class LatestSlot:
+    """가장 최신 값 하나만 보관하는 슬롯 (새 값이 들어오면 이전 값은 버림)"""
+
+    def __init__(self, on_drop=None):
+        self._cond = threading.Condition()
+        # 새 값에 밀려 버려진 값으로 호출 (빌린 프레임 버퍼 반환 등)
+        self.on_drop = on_drop
+        self._item = None
+        self._has_item = False
+        self._closed = False
+        self.dropped = 0
+
+    def put(self, item):
+        with self._cond:
+            dropped = self._item if self._has_item else None
+            if self._has_item:
+                self.dropped += 1
+            self._item = item
+            self._has_item = True
+            self._cond.notify_all()
+        if dropped is not None and self.on_drop is not None:
+            self.on_drop(dropped)
+
+    def get(self, timeout=None):
+        """새 값이 들어올 때까지 기다렸다가 꺼냄. 닫혔거나 시간 초과면 None"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._has_item or self._closed, timeout):
+                return None
+            if not self._has_item:
+                return None
+            item = self._item
+            self._item = None
+            self._has_item = False
+            self._cond.notify_all()
+            return item
+
+    def wait_taken(self, timeout=None):
+        """들어 있는 값을 누가 꺼내 갈 때까지 기다림 (값을 버리지 않아야 하는 오프라인 처리용)"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._has_item or self._closed, timeout)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(self):
+        return self._closed
+
+
+class Stage(threading.Thread):
+    """입력 슬롯에서 값을 꺼내 처리하는 파이프라인 단계 스레드"""
+
+    def __init__(self, name, work, source=None, stop_event=None):
+        super().__init__(name=name, daemon=True)
+        self.work = work
+        self.source = source
+        self.stop_event = stop_event or threading.Event()
+
+    def run(self):
+        try:
+            while not self.stop_event.is_set():
+                if self.source is None:
+                    # 입력이 없는 단계(캡처)는 work 가 False 를 돌려주면 종료
+                    if self.work() is False:
+                        break
+                    continue
+                item = self.source.get(timeout=0.1)
+                if item is None:
+                    if self.source.closed:
+                        break
+                    continue
+                self.work(item)
+        finally:
+            self.stop_event.set()
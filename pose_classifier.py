@@ -0,0 +1,95 @@
+import numpy as np
+
+# classify_poses 결과의 마지막 축 순서
+POSES = ("gun", "open_palm", "v", "fist", "pinky_only")
+GUN, OPEN_PALM, V, FIST, PINKY_ONLY = range(len(POSES))
+
+NUM_LANDMARKS = 21
+
+# 세로 비교 쌍: 검지/중지/약지/새끼 끝마디 vs 둘째 마디, 엄지 끝 vs 엄지 IP
+_UPPER = np.array([8, 12, 16, 20, 4])
+_LOWER = np.array([6, 10, 14, 18, 3])
+
+# 판정 기본값 = (값 < 기준값)
+#   0-4: 손가락 펴짐 (끝마디가 위), 5-9: 손가락 접힘 (끝마디가 아래)
+#   10: 검지-중지 간격 < 0.03, 11: 검지-중지 간격 > 0.05, 12: 엄지 끝-검지 뿌리 거리 < 0.04
+# 절대 기준값(정규화 좌표)은 캘리브레이션 전에만 씀
+_THRESHOLDS = np.array([0.0] * 10 + [0.03, -0.05, 0.04], dtype=np.float32)
+
+# 캘리브레이션 후 거리 기준값 = 손 크기(hand_scale) 대비 비율 * 현재 손 크기 (gestures.json 의 "thresholds" 에서 바꿀 수 있음)
+DEFAULT_SCALE_THRESHOLDS = {"fingers_close": 0.2, "fingers_spread": 0.33, "thumb_on_index": 0.27}
+(INDEX_UP, MIDDLE_UP, RING_UP, PINKY_UP, THUMB_UP,
+ INDEX_DOWN, MIDDLE_DOWN, RING_DOWN, PINKY_DOWN, THUMB_DOWN,
+ FINGERS_CLOSE, FINGERS_SPREAD, THUMB_ON_INDEX) = range(len(_THRESHOLDS))
+
+# 포즈별로 모두 참이어야 하는 기본 판정 목록
+_POSE_TERMS = {
+    GUN: [INDEX_UP, MIDDLE_UP, THUMB_UP, FINGERS_CLOSE, RING_DOWN, PINKY_DOWN],
+    OPEN_PALM: [INDEX_UP, MIDDLE_UP, RING_UP, PINKY_UP],
+    V: [FINGERS_SPREAD, THUMB_ON_INDEX],
+    FIST: [INDEX_DOWN, MIDDLE_DOWN, RING_DOWN, PINKY_DOWN],
+    PINKY_ONLY: [INDEX_DOWN, MIDDLE_DOWN, RING_DOWN, PINKY_UP],
+}
+_POSE_TABLE = np.zeros((len(_THRESHOLDS), len(POSES)), dtype=np.int32)
+for _pose, _terms in _POSE_TERMS.items():
+    _POSE_TABLE[_terms, _pose] = 1
+_POSE_TERM_COUNT = _POSE_TABLE.sum(axis=0)
+
+
+def to_array(hand_landmarks):
+    """mediapipe 손 랜드마크를 (21, 3) float32 배열로 변환"""
+    values = (v for l in hand_landmarks.landmark for v in (l.x, l.y, l.z))
+    return np.fromiter(values, dtype=np.float32, count=NUM_LANDMARKS * 3).reshape(NUM_LANDMARKS, 3)
+
+
+def to_proto(landmarks):
+    """(21, 3) 배열을 그리기용 mediapipe NormalizedLandmarkList 로 변환"""
+    from mediapipe.framework.formats import landmark_pb2
+    proto = landmark_pb2.NormalizedLandmarkList()
+    for x, y, z in landmarks.tolist():
+        proto.landmark.add(x=x, y=y, z=z)
+    return proto
+
+
+def scale_thresholds(fractions):
+    """손 크기 대비 비율 dict -> classify_poses 의 thresholds 배열"""
+    fractions = {**DEFAULT_SCALE_THRESHOLDS, **fractions}
+    return np.array(
+        [0.0] * 10 + [fractions["fingers_close"], -fractions["fingers_spread"], fractions["thumb_on_index"]],
+        dtype=np.float32,
+    )
+
+
+_SCALE_THRESHOLDS = scale_thresholds({})
+
+
+def hand_scale(landmarks):
+    """손 크기 기준값: 손목(0) - 중지 뿌리(9) 2D 거리. (21, 3) -> 스칼라, (N, 21, 3) -> (N,)"""
+    lm = np.asarray(landmarks, dtype=np.float32)
+    delta = lm[..., 0, :2] - lm[..., 9, :2]
+    return np.hypot(delta[..., 0], delta[..., 1])
+
+
+def classify_poses(landmarks, scale=None, thresholds=None):
+    """모든 포즈 판정을 한 번에 계산
+
+    (21, 3) 한 프레임이면 (5,), (N, 21, 3) 묶음이면 (N, 5) bool 배열을 반환
+    scale (현재 손 크기) 을 주면 거리 기준값 = thresholds (scale_thresholds 결과, 기본 DEFAULT_SCALE_THRESHOLDS) * scale
+    주지 않으면 절대 기준값(0.03, 0.05, 0.04)
+    """
+    lm = np.asarray(landmarks, dtype=np.float32)
+    x = lm[..., 0]
+    y = lm[..., 1]
+
+    dy = y[..., _UPPER] - y[..., _LOWER]
+    gap = np.abs(x[..., 8:9] - x[..., 12:13])
+    thumb_index_base = np.hypot(x[..., 4:5] - x[..., 5:6], y[..., 4:5] - y[..., 5:6])
+
+    # 기본 판정을 한 번에 비교한 뒤, 포즈 표와 곱해서 모든 항이 참인 포즈만 남김
+    values = np.concatenate([dy, -dy, gap, -gap, thumb_index_base], axis=-1)
+    if scale is None:
+        thresholds = _THRESHOLDS
+    else:
+        thresholds = (_SCALE_THRESHOLDS if thresholds is None else thresholds) * np.expand_dims(scale, -1)
+    terms = (values < thresholds).astype(np.int32)
+    return terms @ _POSE_TABLE == _POSE_TERM_COUNT
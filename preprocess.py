@@ -0,0 +1,112 @@
+import threading
+import cv2
+import numpy as np
+
+
+class FrameBuffer:
+    """버퍼 풀에서 빌린 RGB 프레임 하나
+
+    단계 사이로 넘길 때는 소유권을 그대로 넘기고, 마지막으로 쓰는 쪽(또는 슬롯에서 밀려날 때)이 release() 함
+    여러 곳에서 동시에 써야 하면 retain() 으로 참조를 하나 더 잡음
+    """
+
+    __slots__ = ("image", "_refs", "_pool")
+
+    def __init__(self, image, pool):
+        self.image = image
+        self._refs = 0
+        self._pool = pool
+
+    def retain(self):
+        with self._pool.lock:
+            self._refs += 1
+        return self
+
+    def release(self):
+        pool = self._pool
+        with pool.lock:
+            self._refs -= 1
+            if self._refs > 0:
+                return
+            if self._refs < 0:
+                raise RuntimeError("이미 반환된 프레임 버퍼를 다시 반환했습니다")
+            # 해상도가 바뀌어 버려진 풀이면 풀과 함께 정리됨
+            pool.free.append(self)
+
+
+class BufferPool:
+    """같은 크기의 RGB 버퍼를 재사용하는 풀. 남은 버퍼가 없을 때만 새로 만듦"""
+
+    def __init__(self, shape, size=6):
+        self.shape = tuple(shape)
+        self.lock = threading.Lock()
+        self.free = [FrameBuffer(np.empty(self.shape, dtype=np.uint8), self) for _ in range(size)]
+        self.allocations = size
+
+    def acquire(self):
+        with self.lock:
+            if self.free:
+                buffer = self.free.pop()
+            else:
+                # 화면이나 느린 단계가 버퍼를 오래 잡고 있는 경우 (이후에는 풀에 남아서 재사용됨)
+                buffer = FrameBuffer(np.empty(self.shape, dtype=np.uint8), self)
+                self.allocations += 1
+            buffer._refs = 1
+        return buffer
+
+    def wrap(self, image):
+        """이미 있는 배열을 풀 버퍼에 복사해서 FrameBuffer 로 (다른 프로세스에서 받은 프레임 등)"""
+        buffer = self.acquire()
+        np.copyto(buffer.image, image)
+        return buffer
+
+
+def release(item):
+    """슬롯에서 밀려난 (..., FrameBuffer, ...) 항목의 버퍼를 반환 (LatestSlot on_drop 용)"""
+    for value in item:
+        if isinstance(value, FrameBuffer):
+            value.release()
+
+
+class Preprocessor:
+    """카메라 프레임을 읽어서 좌우 반전한 RGB 로 변환 (추론과 미리보기가 같은 버퍼를 씀)
+
+    읽기 / 변환 / 반전은 모두 미리 만든 버퍼에 dst= 로 기록하고, 해상도가 바뀔 때만 새로 만듦
+    """
+
+    def __init__(self, pool_size=6):
+        self.pool_size = pool_size
+        self.pool = None
+        self._raw = None    # 캡처가 읽어 들일 BGR 버퍼
+        self._rgb = None    # 반전 전 RGB
+        self.reallocations = 0
+
+    def read(self, cap):
+        """(성공 여부, FrameBuffer). 실패하면 (False, None)"""
+        ret, raw = self.grab(cap)
+        if not ret:
+            return False, None
+        return True, self.convert(raw)
+
+    def grab(self, cap):
+        """변환 없이 캡처 버퍼에 BGR 원본만 읽음 (절전 중 움직임 판정처럼 변환이 필요 없을 때)"""
+        ret, raw = cap.read(self._raw) if self._raw is not None else cap.read()
+        if not ret or raw is None:
+            return False, None
+        if self._rgb is None or raw.shape != self._rgb.shape:
+            self._allocate(raw.shape)
+        # 이미지 폴더처럼 버퍼를 못 받는 공급원은 매번 새 배열을 돌려주므로 다음 읽기에 그 배열을 씀
+        self._raw = raw
+        return True, raw
+
+    def convert(self, bgr):
+        """grab() 으로 읽은 BGR 프레임을 좌우 반전한 RGB 풀 버퍼로"""
+        cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        buffer = self.pool.acquire()
+        cv2.flip(self._rgb, 1, dst=buffer.image)
+        return buffer
+
+    def _allocate(self, shape):
+        self._rgb = np.empty(shape, dtype=np.uint8)
+        self.pool = BufferPool(shape, self.pool_size)
+        self.reallocations += 1
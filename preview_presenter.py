@@ -0,0 +1,86 @@
+import threading
+import cv2
+import numpy as np
+from PyQt6.QtCore import QObject, QTimer, Qt
+from PyQt6.QtGui import QGuiApplication, QImage, QPixmap
+
+MAX_PREVIEW_SIZE = (640, 480)
+
+
+class PreviewPresenter(QObject):
+    """카메라 프레임을 GUI 스레드에서 화면 주사율에 맞춰 QLabel 에 표시
+
+    submit() 은 어느 스레드에서나 호출할 수 있고, 표시되기 전에 들어온 새 프레임이 이전 프레임을 대체함
+    프레임은 추론에 쓴 RGB 버퍼를 그대로 받아서 축소만 하고, 다 쓰면 (또는 대체되면) 버퍼를 풀에 반환함
+    """
+
+    def __init__(self, label, parent=None):
+        super().__init__(parent)
+        self.label = label
+        self._lock = threading.Lock()
+        self._frame = None
+        self._owner = None
+        self.dropped = 0
+
+        # 라벨 크기나 원본 해상도가 바뀔 때만 다시 만드는 축소 버퍼
+        self._label_size = None
+        self._source_shape = None
+        self._buffer = None
+        self._image = None
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._present)
+        self.timer.start(self._refresh_interval())
+
+    def _refresh_interval(self):
+        screen = QGuiApplication.primaryScreen()
+        rate = screen.refreshRate() if screen is not None else 0
+        return max(1, int(1000 / (rate or 60.0)))
+
+    def submit(self, frame, owner=None):
+        """owner 는 frame 을 담은 preprocess.FrameBuffer (표시 후 release)"""
+        with self._lock:
+            dropped = self._owner
+            if self._frame is not None:
+                self.dropped += 1
+            self._frame = frame
+            self._owner = owner
+        if dropped is not None:
+            dropped.release()
+
+    def _present(self):
+        with self._lock:
+            frame, owner = self._frame, self._owner
+            self._frame = None
+            self._owner = None
+        if frame is None:
+            return
+        try:
+            self._draw(frame)
+        finally:
+            if owner is not None:
+                owner.release()
+
+    def _draw(self, frame):
+        rect = self.label.contentsRect()
+        label_size = (rect.width(), rect.height())
+        if label_size != self._label_size or frame.shape != self._source_shape:
+            self._allocate(label_size, frame.shape)
+
+        cv2.resize(frame, (self._buffer.shape[1], self._buffer.shape[0]), dst=self._buffer, interpolation=cv2.INTER_AREA)
+        self.label.setPixmap(QPixmap.fromImage(self._image))
+
+    def _allocate(self, label_size, shape):
+        """라벨 크기 안에 비율을 유지해서 들어가는 크기로 버퍼와 QImage 를 새로 만듦"""
+        h, w = shape[:2]
+        box_w = max(1, min(label_size[0], MAX_PREVIEW_SIZE[0]))
+        box_h = max(1, min(label_size[1], MAX_PREVIEW_SIZE[1]))
+        scale = min(box_w / w, box_h / h)
+        target_w, target_h = max(1, int(w * scale)), max(1, int(h * scale))
+
+        self._buffer = np.empty((target_h, target_w, 3), dtype=np.uint8)
+        # QImage 는 버퍼를 복사하지 않고 감싸기만 함 (추론에 쓴 RGB 그대로 표시해서 색 변환도 생략)
+        self._image = QImage(self._buffer.data, target_w, target_h, target_w * 3, QImage.Format.Format_RGB888)
+        self._label_size = label_size
+        self._source_shape = shape
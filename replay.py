@@ -0,0 +1,145 @@
+import argparse
+import time
+from collections import Counter
+import numpy as np
+from action_executor import ActionExecutor
+from gesture_control import GestureControl
+from injection import RecordingBackend
+from gesture_rules import GestureRules, DEFAULT_RULES_PATH
+from cursor_filter import FILTERS
+from pose_classifier import classify_poses, POSES
+from session_record import load_session
+
+
+class ReplayUI:
+    """리플레이용 UI 대역 (로그와 모드 표시만 기록)"""
+
+    def __init__(self, vgesture_command="", sensitivity=0.2, verbose=False, cursor_filter="lerp"):
+        self.settings = {"vgesture_command": vgesture_command}
+        self.sensitivity = sensitivity
+        self.cursor_filter = cursor_filter
+        self.verbose = verbose
+        self.logs = []
+        self.mode_text = None
+
+    def update_log(self, text, **fields):
+        self.logs.append(text)
+        if self.verbose:
+            print(text)
+
+    def update_mode(self, mode_text):
+        self.mode_text = mode_text
+
+    def get_sensitivity(self):
+        return self.sensitivity
+
+    def get_cursor_filter(self):
+        return self.cursor_filter
+
+    def get_setting(self, name):
+        return self.settings.get(name, "")
+
+
+class ReplayDriver:
+    """녹화된 랜드마크를 GestureControl 의 모드 전환/동작 처리에 그대로 흘려보냄
+
+    시간은 녹화된 타임스탬프를 쓰는 가상 시계라서 실행 속도와 관계없이 결과가 같음
+    """
+
+    def __init__(self, records, ui=None, actuator=None, gesture_rules=None):
+        self.records = records
+        self.ui = ui or ReplayUI()
+        self.actuator = actuator or RecordingBackend()
+        self.now = 0.0
+        self.gesture_control = GestureControl(
+            self.ui,
+            actuator=self.actuator,
+            launcher=self.actuator.launch,
+            clock=lambda: self.now,
+            live=False,
+            gesture_rules=gesture_rules,
+        )
+        # 동작 순서가 항상 같도록 리플레이에서는 호출한 스레드에서 바로 실행
+        self.gesture_control.executor = ActionExecutor(max_workers=0)
+
+    def run(self, realtime=False):
+        timestamps = self.records["t"]
+        valid = self.records["valid"]
+        landmarks = self.records["landmarks"]
+        stats = Counter()
+        if len(timestamps) == 0:
+            return stats
+
+        t0 = float(timestamps[0])
+        start = time.perf_counter()
+        for i in range(len(timestamps)):
+            t = float(timestamps[i])
+            if realtime:
+                delay = (t - t0) - (time.perf_counter() - start)
+                if delay > 0:
+                    time.sleep(delay)
+
+            stats["frames"] += 1
+            if not valid[i]:
+                continue
+            stats["hand_frames"] += 1
+
+            self.now = t
+            self.gesture_control.process_landmarks(landmarks[i])
+            stats["processed"] += 1
+
+        stats["elapsed"] = time.perf_counter() - start
+        return stats
+
+
+def classify_session(records):
+    """손이 검출된 모든 프레임을 (N, 21, 3) 묶음으로 한 번에 분류"""
+    landmarks = np.asarray(records["landmarks"][records["valid"] != 0])
+    start = time.perf_counter()
+    poses = classify_poses(landmarks)
+    elapsed = time.perf_counter() - start
+    return poses, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화된 랜드마크 세션 리플레이")
+    parser.add_argument("session", help="main.py --record 로 만든 녹화 파일")
+    parser.add_argument("--realtime", action="store_true", help="녹화 당시 속도로 재생 (기본: 최대 속도)")
+    parser.add_argument("--vgesture-command", default="", help="V자 제스처에 연결할 명령 (실행하지 않고 기록만 함)")
+    parser.add_argument("--sensitivity", type=float, default=0.2, help="마우스 이동 감도 (0.1 ~ 0.5)")
+    parser.add_argument("--cursor-filter", default="lerp", choices=sorted(FILTERS), help="마우스 모드 커서 필터")
+    parser.add_argument("--gestures", default=DEFAULT_RULES_PATH, metavar="PATH", help="제스처 규칙 설정 파일")
+    parser.add_argument("--pose-model", metavar="PATH", help="gesture_model.py 로 학습한 포즈 분류 모델 (기본: 규칙 기반 판정)")
+    parser.add_argument("--verbose", action="store_true", help="제스처 로그 출력")
+    parser.add_argument("--classify-only", action="store_true", help="동작 없이 포즈 분류 처리량만 측정")
+    args = parser.parse_args()
+
+    records = load_session(args.session)
+    if args.classify_only:
+        poses, elapsed = classify_session(records)
+        print(f"분류 프레임: {len(poses)}, 처리 시간: {elapsed:.4f}s ({len(poses) / max(elapsed, 1e-9):.0f} frames/s)")
+        for name, count in zip(POSES, poses.sum(axis=0)):
+            print(f"  {name}: {count}")
+        return
+
+    ui = ReplayUI(args.vgesture_command, args.sensitivity, args.verbose, args.cursor_filter)
+    gesture_rules = GestureRules.load(args.gestures)
+    if args.pose_model:
+        from gesture_model import GestureModel
+        gesture_rules.set_pose_model(GestureModel.load(args.pose_model))
+    driver = ReplayDriver(records, ui=ui, gesture_rules=gesture_rules)
+    stats = driver.run(realtime=args.realtime)
+
+    elapsed = stats.pop("elapsed", 0.0)
+    actions = Counter(call[0] for call in driver.actuator.calls)
+    print(f"프레임: {stats['frames']} (손 검출 {stats['hand_frames']}, 처리 {stats['processed']})")
+    if elapsed > 0:
+        print(f"처리 시간: {elapsed:.3f}s ({stats['processed'] / elapsed:.0f} frames/s)")
+    print(f"최종 모드: {driver.gesture_control.mode}")
+    print("동작:", ", ".join(f"{name}={count}" for name, count in sorted(actions.items())) or "없음")
+    for stage, values in driver.gesture_control.metrics.snapshot()["stages"].items():
+        print(f"  {stage}: p50 {values['p50_ms'] * 1000:.1f}us / p99 {values['p99_ms'] * 1000:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import time
+import cv2
+from pose_classifier import to_array
+
+
+class HandInference:
+    """mediapipe Hands 호출을 감싸서 ROI 크롭, 해상도 축소, 프레임 건너뛰기를 적용
+
+    - roi=True 이면 이전 프레임 손 영역 주변만 정사각형으로 잘라 roi_size 로 줄여서 추론하고,
+      손을 놓치면 같은 프레임을 전체 화면으로 다시 검출
+      (ROI 는 좌표계가 매번 달라서 추적 모드인 hands 와 섞지 않고 static_image_mode 인 roi_hands 로 따로 추론)
+    - budget_ms 를 주면 추론 시간이 예산을 넘을 때 해상도를 낮추고, 그래도 넘으면 프레임을 건너뜀
+    """
+
+    def __init__(self, hands, roi=False, roi_size=256, roi_margin=0.3,
+                 budget_ms=None, min_scale=0.4, adapt_every=15, roi_hands=None):
+        self.hands = hands
+        self.roi = roi
+        self.roi_hands = roi_hands
+        self.roi_size = roi_size
+        self.roi_margin = roi_margin
+        self.budget = budget_ms / 1000.0 if budget_ms else None
+        self.min_scale = min_scale
+        self.adapt_every = adapt_every
+
+        self.bbox = None        # 이전 프레임 손 영역 (x0, y0, x1, y1) 픽셀
+        self.scale = 1.0        # 전체 화면 추론 시 축소 비율
+        self.skip_interval = 0  # 추론 사이에 건너뛸 프레임 수
+        self._skip_left = 0
+        self._ema = None
+        self._since_adapt = 0
+        self.skipped = False
+        self.last = (None, None)    # 마지막으로 추론한 프레임의 결과 (건너뛴 프레임에서 재사용)
+
+    def process(self, rgb):
+        """손 랜드마크(proto, 전체 화면 기준 정규화 좌표)와 (21, 3) 배열을 반환. 없으면 (None, None)
+
+        건너뛴 프레임은 skipped 가 True 가 되고 마지막 추론 결과(self.last)를 그대로 반환
+        """
+        if self._skip_left > 0:
+            self._skip_left -= 1
+            self.skipped = True
+            return self.last
+        self.skipped = False
+        self._skip_left = self.skip_interval
+
+        start = time.perf_counter()
+        hand = None
+        if self.roi and self.bbox is not None:
+            hand = self._process_roi(rgb)
+        if hand is None:
+            hand = self._process_full(rgb)
+        if self.budget is not None:
+            self._adapt(time.perf_counter() - start)
+
+        if hand is None:
+            self.bbox = None
+            self.last = (None, None)
+            return self.last
+
+        landmarks = to_array(hand)
+        if self.roi:
+            self._update_bbox(landmarks, rgb.shape)
+        self.last = (hand, landmarks)
+        return self.last
+
+    def _process_full(self, rgb):
+        image = rgb
+        if self.scale < 1.0:
+            # 정규화 좌표라 축소해도 결과 좌표를 바꿀 필요 없음
+            image = cv2.resize(rgb, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+        results = self.hands.process(image)
+        if not results.multi_hand_landmarks:
+            return None
+        return results.multi_hand_landmarks[0]
+
+    def _roi_model(self):
+        if self.roi_hands is None:
+            import mediapipe as mp
+            self.roi_hands = mp.solutions.hands.Hands(
+                static_image_mode=True,
+                max_num_hands=1,
+                min_detection_confidence=0.7,
+            )
+        return self.roi_hands
+
+    def _process_roi(self, rgb):
+        x0, y0, x1, y1 = self.bbox
+        crop = rgb[y0:y1, x0:x1]
+        crop_h, crop_w = crop.shape[:2]
+        # 화면 가장자리에서 잘린 영역도 비율이 찌그러지지 않도록 검은 여백을 붙여 정사각형으로 만든 뒤 축소
+        side = max(crop_w, crop_h)
+        left, top = (side - crop_w) // 2, (side - crop_h) // 2
+        if side != crop_w or side != crop_h:
+            crop = cv2.copyMakeBorder(
+                crop, top, side - crop_h - top, left, side - crop_w - left, cv2.BORDER_CONSTANT, value=0
+            )
+        size = max(16, int(self.roi_size * self.scale))
+        crop = cv2.resize(crop, (size, size), interpolation=cv2.INTER_AREA)
+        results = self._roi_model().process(crop)
+        if not results.multi_hand_landmarks:
+            return None
+
+        # 정사각형 영역 기준 좌표를 전체 화면 기준 정규화 좌표로 되돌림
+        hand = results.multi_hand_landmarks[0]
+        h, w = rgb.shape[:2]
+        origin_x, origin_y = x0 - left, y0 - top
+        for l in hand.landmark:
+            l.x = (l.x * side + origin_x) / w
+            l.y = (l.y * side + origin_y) / h
+            l.z = l.z * side / w
+        return hand
+
+    def _update_bbox(self, landmarks, shape):
+        """랜드마크를 감싸는 정사각형 영역에 여유를 두고 다음 프레임 ROI 로 사용"""
+        h, w = shape[:2]
+        xs = landmarks[:, 0] * w
+        ys = landmarks[:, 1] * h
+        cx, cy = (xs.min() + xs.max()) / 2, (ys.min() + ys.max()) / 2
+        half = max(xs.max() - xs.min(), ys.max() - ys.min()) * (0.5 + self.roi_margin)
+        x0, x1 = int(max(0, cx - half)), int(min(w, cx + half))
+        y0, y1 = int(max(0, cy - half)), int(min(h, cy + half))
+        self.bbox = (x0, y0, x1, y1) if x1 - x0 >= 16 and y1 - y0 >= 16 else None
+
+    def _adapt(self, elapsed):
+        self._ema = elapsed if self._ema is None else self._ema * 0.9 + elapsed * 0.1
+        self._since_adapt += 1
+        if self._since_adapt < self.adapt_every:
+            return
+        self._since_adapt = 0
+
+        if self._ema > self.budget:
+            # 예산 초과: 먼저 해상도를 낮추고, 최저 해상도면 프레임을 건너뜀
+            if self.scale > self.min_scale:
+                self.scale = max(self.min_scale, self.scale * 0.8)
+            else:
+                self.skip_interval = min(self.skip_interval + 1, 4)
+        elif self._ema < self.budget * 0.6:
+            # 여유가 생기면 역순으로 복구
+            if self.skip_interval > 0:
+                self.skip_interval -= 1
+            elif self.scale < 1.0:
+                self.scale = min(1.0, self.scale / 0.8)
@@ -0,0 +1,66 @@
+import os
+import struct
+import numpy as np
+
+# 녹화 파일 형식
+#   헤더: magic(4s) + version(u16) + 랜드마크 수(u16)
+#   레코드: 타임스탬프(f8) + 손 검출 여부(u1) + 패딩 + 랜드마크 (21, 3) f4
+# 레코드 크기가 고정이라 np.memmap 으로 바로 매핑해서 읽을 수 있음
+MAGIC = b"GCLM"
+VERSION = 1
+NUM_LANDMARKS = 21
+HEADER = struct.Struct("<4sHH")
+
+RECORD_DTYPE = np.dtype([
+    ("t", "<f8"),
+    ("valid", "u1"),
+    ("pad", "u1", (3,)),
+    ("landmarks", "<f4", (NUM_LANDMARKS, 3)),
+])
+
+
+class SessionRecorder:
+    """프레임별 손 랜드마크를 타임스탬프와 함께 바이너리 파일로 기록"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, NUM_LANDMARKS))
+        self.record = np.zeros(1, dtype=RECORD_DTYPE)
+        self.count = 0
+
+    def write(self, t, landmarks=None):
+        rec = self.record[0]
+        rec["t"] = t
+        if landmarks is None:
+            rec["valid"] = 0
+            rec["landmarks"] = 0
+        else:
+            rec["valid"] = 1
+            rec["landmarks"] = landmarks
+        self.file.write(self.record.tobytes())
+        self.count += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+def load_session(path):
+    """녹화 파일을 메모리 매핑해서 레코드 배열로 반환"""
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError(f"녹화 파일 헤더가 없습니다: {path}")
+
+    magic, version, num_landmarks = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"녹화 파일 형식이 아닙니다: {path}")
+    if version != VERSION or num_landmarks != NUM_LANDMARKS:
+        raise ValueError(f"지원하지 않는 녹화 파일 버전입니다: v{version}, 랜드마크 {num_landmarks}개")
+
+    # 기록 도중 끊긴 마지막 레코드는 무시
+    count = (os.path.getsize(path) - HEADER.size) // RECORD_DTYPE.itemsize
+    if count == 0:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
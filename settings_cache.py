@@ -0,0 +1,85 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+class SettingsCache:
+    """user_id -> (응답 본문, ETag) LRU 캐시
+
+    본문은 직렬화까지 끝난 상태로 보관해서 캐시 적중 시 DB 조회와 dict / JSON 생성을 모두 건너뜀
+
+    generation 은 프로세스 전체에서 하나인 변경 번호. 삭제(invalidate / sync)할 때마다 올라감
+    조회 전에 번호를 기억해 두고 put 에 넘기면, 그 사이 저장이 있었을 때 읽은 (오래된) 본문은 캐시에 넣지 않음
+
+    다른 워커 프로세스의 저장은 DB 설정 버전으로 감지하는데, 요청마다 DB 를 읽지 않도록
+    check_interval 초에 한 번만 확인함 (sync_due). 그래서 다른 워커의 저장은 최대 check_interval 초 늦게 보임
+    """
+
+    def __init__(self, maxsize=1024, check_interval=0.5, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.check_interval = check_interval
+        self.clock = clock
+        self._checked_at = None
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        # 마지막으로 확인한 DB 의 설정 버전 (다른 워커 프로세스의 저장 감지용)
+        self.db_version = None
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        with self._lock:
+            entry = self._items.get(user_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(user_id)
+            self.hits += 1
+            return entry
+
+    def put(self, user_id, body, generation=None):
+        """(본문, ETag) 를 반환. generation 이 현재 번호와 다르면 캐시에는 넣지 않음"""
+        entry = (body, hashlib.sha1(body.encode("utf-8")).hexdigest()[:20])
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return entry
+            self._items[user_id] = entry
+            self._items.move_to_end(user_id)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return entry
+
+    def invalidate(self, user_id=None, version=None):
+        """user_id 가 없으면 전체 삭제
+
+        version 은 이 프로세스가 방금 커밋한 DB 설정 버전. 바로 앞 버전까지 본 상태였다면
+        다른 워커의 저장은 없었던 것이므로 다음 sync 에서 전체를 비우지 않도록 기록해 둠
+        """
+        with self._lock:
+            self.generation += 1
+            if version is not None and self.db_version is not None and version == self.db_version + 1:
+                self.db_version = version
+            if user_id is None:
+                self._items.clear()
+            else:
+                self._items.pop(user_id, None)
+
+    def sync_due(self):
+        """DB 설정 버전을 다시 확인할 때가 됐으면 True (동시에 여러 요청이 와도 한 요청만 True 를 받음)"""
+        now = self.clock()
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.check_interval:
+                return False
+            self._checked_at = now
+            return True
+
+    def sync(self, version):
+        """DB 의 설정 버전이 마지막으로 본 값과 다르면 (다른 워커가 저장함) 전체 삭제"""
+        with self._lock:
+            if version == self.db_version:
+                return
+            self.db_version = version
+            self.generation += 1
+            self._items.clear()
@@ -0,0 +1,211 @@
+import json
+import os
+import threading
+import time
+
+DEFAULTS = {
+    "vgesture_command": "",
+    "sensitivity": 20,
+    "cursor_filter": "lerp",
+    "dark_mode": False,
+}
+# 서버 settings 테이블에도 있는 항목 (cursor_filter 는 PC 마다 다를 수 있어 로컬에만 저장)
+SERVER_FIELDS = ("vgesture_command", "sensitivity", "dark_mode")
+
+
+class SettingsStore:
+    """설정의 메모리 스냅샷. 읽기는 항상 메모리에서 하고 쓰기는 모아서 나중에 처리
+
+    로컬 파일: 마지막 변경 후 write_delay 초가 지나면 한 번만 씀 (임시 파일에 쓴 뒤 교체)
+    서버: 로그인한 경우 바뀐 항목만 sync_delay 초 뒤 백그라운드에서 전송, 실패하면 나중에 다시 시도
+    """
+
+    def __init__(self, path="settings.json", write_delay=0.5, sync_delay=2.0, retry_delay=30.0, on_error=None):
+        self.path = path
+        self.write_delay = write_delay
+        self.sync_delay = sync_delay
+        self.retry_delay = retry_delay
+        self.on_error = on_error
+        # 서버에서 받은 값이 반영되면 바뀐 항목 dict 로 호출 (백그라운드 스레드에서 호출됨)
+        self.on_remote_change = None
+
+        self.user_id = None
+        self.api_url = None
+        self.api = None
+        self.etag = None
+        self.writes = 0
+        self.syncs = 0
+
+        self._values = dict(DEFAULTS)
+        self._values.update(self._read_local())
+        self._write_at = None
+        self._sync_at = None
+        self._pull = False
+        self._dirty_remote = set()
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="settings-store", daemon=True)
+        self._thread.start()
+
+    def get(self, key):
+        return self._values[key]
+
+    def snapshot(self):
+        with self._cond:
+            return dict(self._values)
+
+    def update(self, **fields):
+        """바뀐 항목만 반영하고 저장을 예약. 바뀐 항목 dict 를 반환"""
+        with self._cond:
+            changed = {k: v for k, v in fields.items() if self._values.get(k) != v}
+            if not changed:
+                return changed
+            self._values.update(changed)
+            self._schedule(changed)
+            return changed
+
+    def reset(self):
+        """모든 항목을 기본값으로 (서버에도 기본값을 전송)"""
+        return self.update(**DEFAULTS)
+
+    def attach_remote(self, user_id, api_url):
+        """로그인한 사용자의 서버 설정을 백그라운드에서 받아오고 이후 변경은 서버에도 동기화"""
+        with self._cond:
+            self.user_id = user_id
+            self.api_url = api_url
+            self._pull = True
+            self._cond.notify()
+
+    def flush(self, timeout=2.0):
+        """예약된 로컬 저장과 서버 동기화를 바로 실행하고 끝날 때까지 기다림"""
+        with self._cond:
+            now = time.monotonic()
+            if self._write_at is not None:
+                self._write_at = now
+            if self._dirty_remote:
+                self._sync_at = now
+            self._cond.notify()
+            self._cond.wait_for(lambda: self._write_at is None and (not self._dirty_remote or self.api_url is None), timeout)
+
+    def close(self):
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=1.0)
+
+    def _schedule(self, changed):
+        now = time.monotonic()
+        self._write_at = now + self.write_delay
+        remote = [k for k in changed if k in SERVER_FIELDS]
+        if remote:
+            self._dirty_remote.update(remote)
+            self._sync_at = now + self.sync_delay
+        self._cond.notify()
+
+    def _next_deadline(self):
+        deadlines = [t for t in (self._write_at, self._sync_at if self.api_url else None) if t is not None]
+        return min(deadlines) if deadlines else None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if self._pull:
+                        break
+                    deadline = self._next_deadline()
+                    now = time.monotonic()
+                    if deadline is not None and deadline <= now:
+                        break
+                    self._cond.wait(None if deadline is None else deadline - now)
+                if self._closed:
+                    return
+                now = time.monotonic()
+                pull, self._pull = self._pull, False
+                write = self._write_at is not None and self._write_at <= now
+                if write:
+                    self._write_at = None
+                    values = dict(self._values)
+                fields = {}
+                if self.api_url and self._sync_at is not None and self._sync_at <= now:
+                    fields = {k: self._values[k] for k in self._dirty_remote}
+                    self._dirty_remote.clear()
+                    self._sync_at = None
+
+            if write:
+                self._write_local(values)
+            if pull:
+                self._pull_remote()
+            if fields:
+                self._push_remote(fields)
+            with self._cond:
+                self._cond.notify_all()
+
+    def _client(self):
+        if self.api is None or self.api.base_url != self.api_url.rstrip("/"):
+            from api_client import ApiClient
+            self.api = ApiClient(self.api_url)
+        return self.api
+
+    def _pull_remote(self):
+        from api_client import ApiError
+        try:
+            remote, self.etag = self._client().get_settings(self.user_id, self.etag)
+        except ApiError as e:
+            self._error(e)
+            return
+        if remote is None:
+            return
+        with self._cond:
+            # 아직 서버에 보내지 않은 로컬 변경은 유지
+            incoming = {k: remote[k] for k in SERVER_FIELDS if k in remote and k not in self._dirty_remote}
+            if "dark_mode" in incoming:
+                incoming["dark_mode"] = bool(incoming["dark_mode"])
+            changed = {k: v for k, v in incoming.items() if self._values.get(k) != v}
+            if changed:
+                self._values.update(changed)
+                self._write_at = time.monotonic() + self.write_delay
+        if changed and self.on_remote_change is not None:
+            self.on_remote_change(changed)
+
+    def _push_remote(self, fields):
+        from api_client import ApiError
+        payload = dict(fields)
+        if "dark_mode" in payload:
+            payload["dark_mode"] = int(payload["dark_mode"])
+        try:
+            self._client().save_settings(self.user_id, payload)
+            self.syncs += 1
+        except ApiError as e:
+            self._error(e)
+            with self._cond:
+                # 그 사이 다시 바뀐 항목은 이미 예약돼 있으므로 나머지만 되돌려 둠
+                self._dirty_remote.update(fields)
+                self._sync_at = time.monotonic() + self.retry_delay
+
+    def _read_local(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return {k: v for k, v in json.load(f).items() if k in DEFAULTS}
+        except (OSError, ValueError) as e:
+            self._error(e)
+            return {}
+
+    def _write_local(self, values):
+        # 쓰는 도중 종료돼도 기존 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(values, f, indent=4)
+            os.replace(tmp_path, self.path)
+            self.writes += 1
+        except OSError as e:
+            self._error(e)
+
+    def _error(self, e):
+        if self.on_error is not None:
+            self.on_error(e)
+        else:
+            print("설정 저장 중 에러:", e)
@@ -1,12 +1,17 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 import sqlite3
 import os
 import hashlib
 import traceback
+from storage import Storage, BASE_DIR, DB_PATH
+from settings_cache import SettingsCache
 
 app = Flask(__name__)
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR, 'users.db')
+storage = Storage(DB_PATH)
+settings_cache = SettingsCache(
+    int(os.environ.get('SETTINGS_CACHE_SIZE', 1024)),
+    check_interval=float(os.environ.get('SETTINGS_VERSION_CHECK_MS', 500)) / 1000.0,
+)
 
 # --- 비밀번호 해시 처리 ---
 def hash_password(password):
@@ -15,7 +20,8 @@ def hash_password(password):
 # --- DB 자동 초기화 ---
 def init_db():
     db_exists = os.path.exists(DB_PATH)
-    conn = sqlite3.connect(DB_PATH)
+    # 초기화는 스레드 캐시에 남지 않는 별도 연결로 (gunicorn fork 전에 실행될 수 있음)
+    conn = storage.connect()
     cur = conn.cursor()
 
     # users 테이블 생성
@@ -41,12 +47,17 @@ def init_db():
         );
     """)
 
-    # 기존 settings 테이블에 컬럼이 없을 경우 대비해서 background_color 추가
-    try:
-        cur.execute("ALTER TABLE settings ADD COLUMN background_color TEXT DEFAULT '#ffffff'")
-    except sqlite3.OperationalError as e:
-        if "duplicate column name" not in str(e):
-            raise
+    # 설정 버전: 설정을 바꾸는 트랜잭션마다 1 씩 올림 (다른 워커의 설정 캐시 무효화용)
+    cur.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+    cur.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('settings_version', 0)")
+
+    # 기존 settings 테이블에 컬럼이 없을 경우 대비해서 background_color / calibration 추가
+    for column in ("background_color TEXT DEFAULT '#ffffff'", "calibration TEXT"):
+        try:
+            cur.execute(f"ALTER TABLE settings ADD COLUMN {column}")
+        except sqlite3.OperationalError as e:
+            if "duplicate column name" not in str(e):
+                raise
 
     conn.commit()
     conn.close()
@@ -56,11 +67,91 @@ def init_db():
     else:
         print("ℹ️ Database already exists, initialization ensured.")
 
+# --- 설정 기본값 (새 행을 만들 때 요청에 없는 항목) ---
+SETTINGS_DEFAULTS = {
+    "vgesture_command": "",
+    "sensitivity": 20,
+    "dark_mode": 0,
+    "background_color": "#ffffff",
+    "calibration": None,
+}
+SETTINGS_COLUMNS = tuple(SETTINGS_DEFAULTS)
+
+def settings_upsert_sql(columns):
+    """한 문장 upsert: 행이 없으면 기본값으로 만들고, 있으면 columns 항목만 갱신"""
+    updates = ", ".join(f"{column} = excluded.{column}" for column in columns)
+    conflict = f"DO UPDATE SET {updates}" if columns else "DO NOTHING"
+    return f"""
+        INSERT INTO settings (user_id, {", ".join(SETTINGS_COLUMNS)})
+        VALUES (?, {", ".join("?" for _ in SETTINGS_COLUMNS)})
+        ON CONFLICT(user_id) {conflict}
+    """
+
+# 항목별 저장 형식 (calibration 은 JSON 문자열 또는 null)
+SETTINGS_TYPES = {
+    "vgesture_command": str,
+    "sensitivity": int,
+    "dark_mode": int,
+    "background_color": str,
+    "calibration": str,
+}
+# 정수 항목의 허용 범위 (감도는 UI 슬라이더 범위, 다크 모드는 0 / 1)
+SETTINGS_RANGES = {
+    "sensitivity": (10, 50),
+    "dark_mode": (0, 1),
+}
+
+def clean_settings(data):
+    """요청의 설정 항목을 검사해서 저장할 값으로 변환. 형식이 맞지 않으면 ValueError"""
+    if not isinstance(data, dict):
+        raise ValueError("설정은 객체여야 합니다")
+    values = {}
+    for column in SETTINGS_COLUMNS:
+        if column not in data:
+            continue
+        value = data[column]
+        if SETTINGS_TYPES[column] is int:
+            if not isinstance(value, (bool, int, str)):
+                raise ValueError(f"{column} 는 정수여야 합니다")
+            try:
+                value = int(value)
+            except ValueError:
+                raise ValueError(f"{column} 는 정수여야 합니다: {value!r}") from None
+            low, high = SETTINGS_RANGES[column]
+            if not low <= value <= high:
+                raise ValueError(f"{column} 는 {low} ~ {high} 사이여야 합니다: {value}")
+        elif not (isinstance(value, str) or (value is None and column == "calibration")):
+            raise ValueError(f"{column} 는 문자열이어야 합니다")
+        values[column] = value
+    return values
+
+def settings_values(user_id, data):
+    values = {**SETTINGS_DEFAULTS, **{k: v for k, v in data.items() if k in SETTINGS_DEFAULTS}}
+    values["dark_mode"] = int(values["dark_mode"])
+    return (user_id,) + tuple(values[column] for column in SETTINGS_COLUMNS)
+
+SETTINGS_VERSION_SQL = "SELECT value FROM meta WHERE key = 'settings_version'"
+BUMP_SETTINGS_VERSION_SQL = "UPDATE meta SET value = value + 1 WHERE key = 'settings_version'"
+
+def bump_settings_version(conn):
+    """쓰기 트랜잭션 안에서 설정 버전을 올리고 새 버전을 반환"""
+    conn.execute(BUMP_SETTINGS_VERSION_SQL)
+    return conn.execute(SETTINGS_VERSION_SQL).fetchone()[0]
+
+USER_INSERT_SQL = """
+    INSERT INTO users (id, name, phone, email, password)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO NOTHING
+"""
+
 # --- DB 연결 함수 ---
 def get_db():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    # 풀에서 빌린 연결. 요청이 끝나면 release_db 에서 풀에 돌려줌
+    return storage.connection()
+
+@app.teardown_appcontext
+def release_db(exception):
+    storage.release()
 
 # --- 루트 경로 (상태 확인용) --
 @app.route('/')
@@ -75,7 +166,6 @@ def login():
     cur = conn.cursor()
     cur.execute("SELECT id, password FROM users WHERE id=?", (data['username'],))
     user = cur.fetchone()
-    conn.close()
 
     # 서버에서 평문 비밀번호 해시 처리 후 비교
     if user and user["password"] == hash_password(data["password"]):
@@ -86,58 +176,73 @@ def login():
 @app.route('/api/register', methods=['POST'])
 def register():
     data = request.json
+    conn = get_db()
     try:
-        conn = get_db()
         cur = conn.cursor()
 
-        cur.execute("SELECT id FROM users WHERE id=?", (data['id'],))
-        if cur.fetchone():
-            return jsonify({"status": "fail", "message": "이미 존재하는 ID입니다."}), 400
-
-        # 비밀번호 해시 처리 후 저장
-        cur.execute("""
-            INSERT INTO users (id, name, phone, email, password)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
+        # 비밀번호 해시 처리 후 저장. 이미 있는 ID 면 아무것도 쓰지 않음
+        cur.execute(USER_INSERT_SQL, (
             data['id'],
             data['name'],
             data['phone'],
             data['email'],
             hash_password(data['password'])
         ))
+        if cur.rowcount == 0:
+            conn.rollback()
+            return jsonify({"status": "fail", "message": "이미 존재하는 ID입니다."}), 400
 
         # 기본 설정 저장
-        cur.execute("""
-            INSERT INTO settings (user_id, vgesture_command, sensitivity, dark_mode, background_color)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            data['id'], "", 20, 0, '#ffffff'
-        ))
+        cur.execute(settings_upsert_sql(()), settings_values(data['id'], {}))
+        version = bump_settings_version(conn)
 
         conn.commit()
-        conn.close()
+        settings_cache.invalidate(data['id'], version)
         return jsonify({"status": "success"})
     except Exception as e:
+        # 연결을 재사용하므로 실패한 트랜잭션이 다음 요청에 남지 않게 되돌림
+        conn.rollback()
         print(traceback.format_exc())
         return jsonify({"status": "fail", "message": str(e)}), 500
 
 # --- 설정 조회 API ---
 @app.route('/api/settings/<user_id>', methods=['GET'])
 def get_settings(user_id):
-    conn = get_db()
-    cur = conn.cursor()
-    cur.execute("""
-        SELECT user_id, vgesture_command, sensitivity, dark_mode, background_color
-        FROM settings WHERE user_id = ?
-    """, (user_id,))
-    row = cur.fetchone()
-    conn.close()
+    """캐시에 있으면 DB 를 건드리지 않고 응답 (If-None-Match 가 맞으면 304)
+
+    같은 워커의 저장은 바로 캐시에서 지워지고, 다른 워커(gunicorn 프로세스)의 저장은
+    SETTINGS_VERSION_CHECK_MS (기본 500ms) 마다 DB 설정 버전으로 확인하므로 그만큼 늦게 보일 수 있음
+    """
+    if settings_cache.sync_due():
+        # 다른 워커가 설정을 바꿨으면 이 워커의 캐시는 믿을 수 없으므로 비움
+        settings_cache.sync(get_db().execute(SETTINGS_VERSION_SQL).fetchone()[0])
+
+    entry = settings_cache.get(user_id)
+    if entry is None:
+        # 조회하는 동안 저장이 끝나면 읽은 본문이 오래됐을 수 있으므로 번호가 그대로일 때만 캐시에 넣음
+        generation = settings_cache.generation
+        cur = get_db().cursor()
+        cur.execute("""
+            SELECT user_id, vgesture_command, sensitivity, dark_mode, background_color, calibration
+            FROM settings WHERE user_id = ?
+        """, (user_id,))
+        row = cur.fetchone()
+
+        if not row:
+            return jsonify({"status": "fail", "message": "설정 정보 없음"}), 404
+        keys = ['user_id', 'vgesture_command', 'sensitivity', 'dark_mode', 'background_color', 'calibration']
+        body = app.json.dumps({"status": "success", "settings": dict(zip(keys, row))})
+        entry = settings_cache.put(user_id, body, generation)
 
-    if row:
-        keys = ['user_id', 'vgesture_command', 'sensitivity', 'dark_mode', 'background_color']
-        return jsonify({"status": "success", "settings": dict(zip(keys, row))})
+    body, etag = entry
+    # 클라이언트가 가진 버전과 같으면 본문 없이 304 (W/"..." 약한 검증자도 같은 것으로 봄)
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
     else:
-        return jsonify({"status": "fail", "message": "설정 정보 없음"}), 404
+        response = Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 # --- 설정 저장 API ---
 @app.route('/api/settings/<user_id>', methods=['POST'])
@@ -149,52 +254,93 @@ def save_settings(user_id):
         return jsonify({"status": "fail", "message": "설정 데이터 없음"}), 400
 
     try:
-        conn = get_db()
-        cur = conn.cursor()
-
-        cur.execute("SELECT * FROM settings WHERE user_id = ?", (user_id,))
-        exists = cur.fetchone()
-        print("settings 존재 여부:", exists is not None)
-
-        if exists:
-            cur.execute("""
-                UPDATE settings
-                SET vgesture_command = ?, sensitivity = ?, dark_mode = ?, background_color = ?
-                WHERE user_id = ?
-            """, (
-                data.get("vgesture_command", ""),
-                data.get("sensitivity", 20),
-                int(data.get("dark_mode", False)),
-                data.get("background_color", "#ffffff"),
-                user_id
-            ))
-        else:
-            cur.execute("""
-                INSERT INTO settings (user_id, vgesture_command, sensitivity, dark_mode, background_color)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                user_id,
-                data.get("vgesture_command", ""),
-                data.get("sensitivity", 20),
-                int(data.get("dark_mode", False)),
-                data.get("background_color", "#ffffff")
-            ))
+        values = clean_settings(data)
+    except ValueError as e:
+        return jsonify({"status": "fail", "message": f"잘못된 항목: {e}"}), 400
 
+    conn = get_db()
+    try:
+        # 요청에 없는 항목은 기존 값을 유지 (캘리브레이션만 따로 저장하는 경우 등)
+        conn.execute(settings_upsert_sql(tuple(values)), settings_values(user_id, values))
+        version = bump_settings_version(conn)
         conn.commit()
-        conn.close()
+        settings_cache.invalidate(user_id, version)
         print("설정 저장 완료")
         return jsonify({"status": "success", "message": "설정 저장 완료"})
 
     except Exception as e:
+        conn.rollback()
         print("설정 저장 중 에러:", e)
         return jsonify({"status": "fail", "message": str(e)}), 500
 
 
+# --- 일괄 등록 API (실습실 PC 등 여러 사용자 / 설정을 한 번에) ---
+# PROVISION_TOKEN 환경 변수가 설정된 경우에만 사용 가능, 요청 헤더 X-Provision-Token 으로 인증
+@app.route('/api/provision', methods=['POST'])
+def provision():
+    token = os.environ.get('PROVISION_TOKEN')
+    if not token or request.headers.get('X-Provision-Token') != token:
+        return jsonify({"status": "fail", "message": "권한 없음"}), 403
+
+    data = request.get_json(silent=True) or {}
+    users = data.get("users", []) if isinstance(data, dict) else None
+    settings = data.get("settings", []) if isinstance(data, dict) else None
+    try:
+        if not isinstance(users, list) or not isinstance(settings, list):
+            raise ValueError("users / settings 는 배열이어야 합니다")
+        # DB 에 쓰기 전에 모든 항목을 먼저 검사 (하나라도 잘못되면 400)
+        user_rows = []
+        for u in users:
+            if not isinstance(u, dict):
+                raise ValueError("사용자 항목은 객체여야 합니다")
+            row = (u['id'], u.get('name', ''), u.get('phone', ''), u.get('email', ''), u['password'])
+            if not all(isinstance(value, str) for value in row) or not u['id']:
+                raise ValueError(f"사용자 항목은 문자열이어야 합니다: {u['id']!r}")
+            user_rows.append(row[:4] + (hash_password(row[4]),))
+        # 설정은 포함된 항목 조합별로 묶어서 같은 upsert 문을 executemany 로 실행
+        groups = {}
+        for row in user_rows:
+            groups.setdefault((), []).append(settings_values(row[0], {}))
+        for item in settings:
+            values = clean_settings(item)
+            user_id = item['user_id']
+            if not isinstance(user_id, str) or not user_id:
+                raise ValueError(f"user_id 는 문자열이어야 합니다: {user_id!r}")
+            groups.setdefault(tuple(values), []).append(settings_values(user_id, values))
+    except KeyError as e:
+        return jsonify({"status": "fail", "message": f"필수 항목 없음: {e}"}), 400
+    except ValueError as e:
+        return jsonify({"status": "fail", "message": f"잘못된 항목: {e}"}), 400
+
+    conn = get_db()
+    try:
+        # 전체를 한 트랜잭션으로: 중간에 실패하면 아무것도 저장되지 않음
+        before = conn.total_changes
+        conn.executemany(USER_INSERT_SQL, user_rows)
+        created = conn.total_changes - before
+        for columns, rows in groups.items():
+            conn.executemany(settings_upsert_sql(columns), rows)
+        bump_settings_version(conn)
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        print(traceback.format_exc())
+        return jsonify({"status": "fail", "message": str(e)}), 500
+
+    settings_cache.invalidate()
+    return jsonify({
+        "status": "success",
+        "created_users": created,
+        "existing_users": len(user_rows) - created,
+        "settings": len(settings),
+    })
+
 # --- 서버 시작 ---
+# 개발용 서버. 배포에서는 gunicorn 으로 wsgi.py 를 실행 (render.yaml 참고)
 if __name__ == '__main__':
     init_db()
     port = int(os.environ.get('PORT', 8080))
-    app.run(host='0.0.0.0', port=port, debug=True)
+    app.run(host='0.0.0.0', port=port, debug=os.environ.get('FLASK_DEBUG') == '1', threaded=True)
 
 print("BASE_DIR:", BASE_DIR)
 print("Working Dir:", os.getcwd())
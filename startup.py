@@ -0,0 +1,155 @@
+import sys
+import threading
+import time
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+def report(status, detail=""):
+    """런처(login.py)가 읽는 준비 상태 한 줄을 표준 출력으로 보냄"""
+    try:
+        print(f"{status} {detail}".rstrip(), flush=True)
+    except (OSError, ValueError):
+        # 런처가 먼저 종료돼서 파이프가 닫힌 경우
+        pass
+
+
+class PipelineStartup(threading.Thread):
+    """무거운 import / 카메라 / 모델 초기화를 백그라운드에서 하고 준비되면 제스처 인식을 실행
+
+    UI 는 먼저 띄우고, 단계별 소요 시간은 timings 에 기록함
+    prewarm 이면 준비를 마친 뒤 begin() 이 호출될 때까지 기다림
+    """
+
+    def __init__(self, args, window, prewarm=False):
+        super().__init__(name="pipeline-startup", daemon=True)
+        self.args = args
+        self.window = window
+        self.user_id = args.user
+        self.gesture_control = None
+        self.exporter = None
+        self.timings = {}
+        self._begin = threading.Event()
+        self._stopped = threading.Event()
+        if not prewarm:
+            self._begin.set()
+
+    def begin(self, user_id=None):
+        if user_id:
+            self.user_id = user_id
+        self._begin.set()
+
+    def run(self):
+        try:
+            self.load()
+        except Exception as e:
+            report("FAILED", e)
+            self.window.update_log(f"초기화 실패: {e}")
+            return
+        report("READY", " ".join(f"{name}={seconds:.3f}" for name, seconds in self.timings.items()))
+        self.window.update_log(
+            "초기화 완료 (" + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.timings.items()) + ")"
+        )
+
+        while not self._begin.wait(0.1):
+            if self._stopped.is_set():
+                return
+        if self._stopped.is_set():
+            return
+
+        self.gesture_control.calibration_store.user_id = self.user_id
+        if self.exporter is not None:
+            self.exporter.start()
+        self.gesture_control.run()
+
+    def load(self):
+        args = self.args
+        start = time.perf_counter()
+        from gesture_control import GestureControl
+        from calibration import CalibrationStore
+        from gesture_rules import GestureRules
+        from injection import AsyncInjector, make_backend
+        from metrics import MetricsExporter
+        from parallel_inference import ParallelInference
+        from roi_inference import HandInference
+        from session_record import SessionRecorder
+        from frame_source import open_source
+        self._mark("import", start)
+
+        start = time.perf_counter()
+        window = self.window
+        actuator = AsyncInjector(make_backend(args.injection), on_error=lambda e: window.update_log(f"입력 주입 실패: {e}"))
+        gesture_rules = GestureRules.load(args.gestures)
+        if args.pose_model:
+            from gesture_model import GestureModel
+            gesture_rules.set_pose_model(GestureModel.load(args.pose_model))
+        if args.workers > 0:
+            # 카메라와 mediapipe 는 작업 프로세스에서만 열고 여기서는 결과만 받음
+            gesture_control = GestureControl(window, actuator=actuator, gesture_rules=gesture_rules, live=False)
+            gesture_control.parallel = ParallelInference(camera=args.camera, workers=args.workers)
+        else:
+            gesture_control = GestureControl(window, actuator=actuator, gesture_rules=gesture_rules, source=open_source(args.camera))
+            gesture_control.inference = HandInference(
+                gesture_control.hands,
+                roi=args.roi,
+                roi_size=args.roi_size,
+                budget_ms=args.inference_budget_ms,
+            )
+        gesture_control.predict_horizon = args.predict_ms / 1000.0
+        gesture_control.calibration_store = CalibrationStore(
+            user_id=self.user_id,
+            api_url=args.api_url,
+            on_error=lambda e: window.update_log(f"캘리브레이션 프로필 동기화 실패: {e}"),
+        )
+        gesture_control.recalibrate = args.recalibrate
+        if args.idle_after > 0 and args.workers == 0:
+            from idle_monitor import IdleMonitor
+            gesture_control.idle = IdleMonitor(args.idle_after, args.idle_fps)
+        if args.record:
+            gesture_control.recorder = SessionRecorder(args.record)
+        window.metrics = gesture_control.metrics
+        if args.metrics_out:
+            self.exporter = MetricsExporter(gesture_control.metrics, args.metrics_out, args.metrics_interval)
+        self.gesture_control = gesture_control
+        self._mark("init", start)
+
+        # 첫 추론은 그래프 초기화 때문에 느리므로 시작 단계에서 미리 한 번 실행
+        start = time.perf_counter()
+        gesture_control.warm_up()
+        self._mark("warmup", start)
+
+    def _mark(self, name, start):
+        self.timings[name] = time.perf_counter() - start
+
+    def stop(self):
+        self._stopped.set()
+        if self.gesture_control is not None:
+            self.gesture_control.stop()
+
+    def close(self):
+        """창이 닫힌 뒤 지표 기록과 녹화 파일을 마무리"""
+        if self.exporter is not None and self.exporter.is_alive():
+            self.exporter.stop()
+        if self.gesture_control is not None and self.gesture_control.recorder is not None:
+            self.gesture_control.recorder.close()
+
+
+class LauncherCommands(QObject):
+    """prewarm 모드에서 런처가 표준 입력으로 보내는 명령을 GUI 스레드 시그널로 전달
+
+    START <user_id> : 로그인 완료, 창을 띄우고 제스처 인식 시작
+    표준 입력이 닫히면 (런처 종료) closed
+    """
+
+    started = pyqtSignal(str)
+    closed = pyqtSignal()
+
+    def listen(self):
+        threading.Thread(target=self._read, name="launcher-commands", daemon=True).start()
+
+    def _read(self):
+        for line in sys.stdin:
+            command, _, value = line.strip().partition(" ")
+            if command == "START":
+                self.started.emit(value.strip())
+                return
+        self.closed.emit()
@@ -0,0 +1,93 @@
+import os
+import sqlite3
+import threading
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.environ.get("GESTURE_DB_PATH", os.path.join(BASE_DIR, 'users.db'))
+
+# 연결마다 한 번 적용하는 설정
+#   WAL: 읽기와 쓰기가 서로 막지 않음 (DB 파일에 저장되는 설정)
+#   synchronous=NORMAL: WAL 에서는 커밋마다 fsync 하지 않아도 DB 가 깨지지 않음
+#   busy_timeout: 다른 워커가 쓰는 중이면 바로 실패하지 않고 기다림
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-8000",
+)
+
+
+class Storage:
+    """크기가 정해진 SQLite 연결 풀
+
+    요청을 처리하는 스레드는 connection() 으로 풀에서 연결을 빌리고, 요청이 끝나면 release() 로 돌려줌
+    요청마다 연결을 새로 열지 않으므로 같은 SQL 문은 연결의 statement 캐시에서 재사용됨
+    개발 서버(threaded=True)는 요청마다 스레드를 새로 만들므로 연결을 스레드에 묶어 두면 계속 늘어남
+    gunicorn 워커는 fork 된 뒤 처음 요청을 받을 때 각자 연결을 엶
+    """
+
+    def __init__(self, path=DB_PATH, cached_statements=256, pool_size=8):
+        self.path = path
+        self.cached_statements = cached_statements
+        self.pool_size = pool_size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._idle = []
+        self._pid = os.getpid()
+
+    def connect(self):
+        """설정을 적용한 새 연결 (풀에 넣지 않음)
+
+        풀의 연결은 한 번에 한 스레드만 쓰지만 요청마다 다른 스레드가 빌려 가므로 check_same_thread 를 끔
+        """
+        conn = sqlite3.connect(
+            self.path, timeout=5.0, cached_statements=self.cached_statements, check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def connection(self):
+        """현재 스레드가 빌린 연결 (없으면 풀에서 빌리고, 풀이 비었으면 새로 엶)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = self._checkout()
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _checkout(self):
+        with self._lock:
+            if self._pid != os.getpid():
+                # fork 전에 부모가 연 연결은 자식에서 쓰면 안 됨 (닫지도 않고 버림)
+                self._idle = []
+                self._pid = os.getpid()
+            if self._idle:
+                return self._idle.pop()
+        return self.connect()
+
+    def release(self):
+        """현재 스레드가 빌린 연결을 풀에 돌려줌 (요청이 끝날 때 호출). 풀이 가득 차 있으면 닫음"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        self._local.conn = None
+        if getattr(self._local, "pid", None) != os.getpid():
+            return
+        if conn.in_transaction:
+            # 끝나지 않은 트랜잭션이 다음에 빌리는 요청에 남지 않게 되돌림
+            conn.rollback()
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close_all(self):
+        """풀에 남은 연결을 모두 닫음 (빌려 간 연결은 release() 때 닫히지 않고 풀로 돌아옴)"""
+        with self._lock:
+            connections, self._idle = self._idle, []
+        for conn in connections:
+            conn.close()
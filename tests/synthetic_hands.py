@@ -0,0 +1,53 @@
+import numpy as np
+from session_record import RECORD_DTYPE
+
+# 손가락 뿌리(MCP) 번호별 손목 기준 가로 위치
+_FINGER_OFFSETS = {1: -0.06, 5: -0.03, 9: 0.0, 13: 0.03, 17: 0.06}
+
+
+def hand(pose, cx=0.5, cy=0.6, s=1.0, rng=None):
+    """포즈 이름으로 (21, 3) 합성 랜드마크를 만듦 (open, fist, gun, pinky, v)"""
+    lm = np.zeros((21, 3), np.float32)
+    lm[0] = (cx, cy, 0)
+    for base, dx in _FINGER_OFFSETS.items():
+        for k in range(4):
+            lm[base + k] = (cx + dx * s, cy - 0.08 * s - 0.03 * k * s, 0)
+
+    def curl(base):
+        # 손가락 끝을 PIP 보다 아래로 내려서 접힌 손가락으로 만듦
+        lm[base + 2, 1] = cy - 0.08 * s
+        lm[base + 3, 1] = lm[base + 1, 1] + 0.01
+
+    if pose == "fist":
+        for base in (5, 9, 13, 17):
+            curl(base)
+    elif pose == "gun":
+        curl(13)
+        curl(17)
+        lm[12, 0] = lm[8, 0] + 0.01
+    elif pose == "pinky":
+        for base in (5, 9, 13):
+            curl(base)
+    elif pose == "v":
+        lm[8, 0] -= 0.05
+        lm[12, 0] += 0.05
+        lm[4, :2] = lm[5, :2] + 0.01
+    if rng is not None:
+        lm[:, :2] += rng.normal(0, 0.001, (21, 2))
+    return lm
+
+
+def session(segments, fps=30.0, t0=1000.0, seed=0):
+    """(포즈, 프레임 수) 목록을 녹화 파일과 같은 레코드 배열로 만듦 (포즈가 None 이면 손 없음)"""
+    rng = np.random.default_rng(seed)
+    total = sum(n for _, n in segments)
+    records = np.zeros(total, dtype=RECORD_DTYPE)
+    i = 0
+    for pose, n in segments:
+        for _ in range(n):
+            records[i]["t"] = t0 + i / fps
+            if pose is not None:
+                records[i]["valid"] = 1
+                records[i]["landmarks"] = hand(pose, rng=rng)
+            i += 1
+    return records
@@ -0,0 +1,46 @@
+import pytest
+from calibration import PROFILE_VERSION, is_valid, measure_profile
+from gesture_rules import GestureRules
+from synthetic_hands import hand
+
+
+def test_profile_stores_thresholds_at_measured_scale():
+    profile = measure_profile([hand("open", s=1.5)] * 5, {"click": 0.25})
+    assert profile["version"] == PROFILE_VERSION
+    assert profile["hand_scale"] == pytest.approx(0.12, abs=1e-6)
+    assert profile["thresholds"]["click"] == pytest.approx(0.25 * 0.12, abs=1e-6)
+    assert is_valid(profile)
+
+
+@pytest.mark.parametrize("profile", [None, {}, {"version": 99, "hand_scale": 0.1}, {"version": 2, "hand_scale": 0}])
+def test_invalid_profiles(profile):
+    assert not is_valid(profile)
+
+
+def test_absolute_click_threshold_before_calibration():
+    rules = GestureRules.load()
+    rules.set_calibration(None)
+    assert rules.threshold_scale(hand("open")) is None
+    assert rules.click_threshold(hand("open", s=2.0)) == rules.mouse["click_threshold"]
+
+
+def test_click_threshold_follows_current_hand_size():
+    rules = GestureRules.load()
+    rules.set_calibration(measure_profile([hand("open")] * 5, rules.scale_thresholds))
+    near = rules.click_threshold(hand("open", s=2.0))
+    far = rules.click_threshold(hand("open", s=1.0))
+    assert near == pytest.approx(2 * far, rel=1e-5)
+    assert far == pytest.approx(rules.scale_thresholds["click"] * 0.08, rel=1e-5)
+
+
+def test_profile_thresholds_become_fractions():
+    rules = GestureRules.load()
+    rules.set_calibration({"version": 2, "hand_scale": 0.1, "thresholds": {"click": 0.03}})
+    assert rules.fractions["click"] == pytest.approx(0.3)
+    assert rules.click_threshold(hand("open", s=1.0)) == pytest.approx(0.3 * 0.08, rel=1e-5)
+
+
+def test_old_profile_uses_configured_fractions():
+    rules = GestureRules.load()
+    rules.set_calibration({"version": 1, "hand_scale": 0.1})
+    assert rules.fractions == rules.scale_thresholds
@@ -0,0 +1,69 @@
+import pytest
+from cursor_filter import OneEuroFilter, KalmanFilter, LerpFilter, make_filter
+
+FILTER_CLASSES = [OneEuroFilter, KalmanFilter]
+
+
+def feed(f, points, fps=30.0):
+    out = None
+    for i, (x, y) in enumerate(points):
+        out = f.update(x, y, i / fps)
+    return out
+
+
+@pytest.mark.parametrize("cls", FILTER_CLASSES)
+def test_first_sample_passes_through(cls):
+    assert cls().update(100.0, 200.0, 0.0) == (100.0, 200.0)
+
+
+@pytest.mark.parametrize("cls", FILTER_CLASSES)
+def test_constant_input_stays_put(cls):
+    x, y = feed(cls(), [(500.0, 300.0)] * 60)
+    assert x == pytest.approx(500.0, abs=1e-6)
+    assert y == pytest.approx(300.0, abs=1e-6)
+
+
+@pytest.mark.parametrize("cls", FILTER_CLASSES)
+def test_step_is_smoothed_then_converges(cls):
+    f = cls()
+    feed(f, [(0.0, 0.0)] * 10)
+    first_x, _ = f.update(100.0, 0.0, 10 / 30.0)
+    assert 0.0 < first_x < 100.0
+    for i in range(11, 200):
+        x, _ = f.update(100.0, 0.0, i / 30.0)
+    assert x == pytest.approx(100.0, abs=0.5)
+
+
+@pytest.mark.parametrize("cls", FILTER_CLASSES)
+def test_non_increasing_timestamp_does_not_move(cls):
+    f = cls()
+    feed(f, [(0.0, 0.0)] * 5)
+    before = f.update(0.0, 0.0, 4 / 30.0)
+    assert f.update(50.0, 50.0, 4 / 30.0) == before
+    assert f.update(50.0, 50.0, 1 / 30.0) == before
+
+
+@pytest.mark.parametrize("cls", FILTER_CLASSES)
+def test_horizon_predicts_ahead_of_motion(cls):
+    ramp = [(10.0 * i, 0.0) for i in range(60)]
+    plain_x, _ = feed(cls(), ramp)
+    ahead_x, _ = feed(cls(horizon=0.05), ramp)
+    assert ahead_x > plain_x
+
+
+def test_higher_sensitivity_follows_faster():
+    # 계단 직후 첫 출력이 목표에 얼마나 가까이 가는지 비교
+    points = [(0.0, 0.0)] * 5 + [(100.0, 0.0)]
+    for cls in FILTER_CLASSES:
+        slow_x, _ = feed(cls(sensitivity=0.1), points)
+        fast_x, _ = feed(cls(sensitivity=0.5), points)
+        assert fast_x > slow_x
+
+
+def test_make_filter():
+    f = make_filter("kalman", sensitivity=0.3, horizon=0.02)
+    assert isinstance(f, KalmanFilter)
+    assert f.horizon == 0.02
+    assert isinstance(make_filter("lerp"), LerpFilter)
+    with pytest.raises(ValueError):
+        make_filter("median")
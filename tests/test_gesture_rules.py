@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from gesture_rules import GestureRules
+from synthetic_hands import hand
+
+
+def rules(*specs, **config):
+    return GestureRules({"rules": list(specs), **config})
+
+
+def spec(name, when, **fields):
+    return {"name": name, "when": when, "action": {"type": "key", "key": name}, **fields}
+
+
+def fired(gesture_rules, landmarks, now, mode=None, flags=None):
+    return [rule.name for rule in gesture_rules.evaluate(landmarks, now, mode, flags)]
+
+
+@pytest.mark.parametrize("config, message", [
+    ({"rules": [spec("a", [["near", 4, 8, 0.1]])]}, "판정 종류"),
+    ({"rules": [spec("a", "thumbs_up")]}, "포즈나 flags"),
+    ({"rules": [spec("a", [])]}, "조건"),
+])
+def test_compile_errors(config, message):
+    with pytest.raises(ValueError, match=message):
+        GestureRules(config)
+
+
+def test_named_pose_expands_to_predicates():
+    gesture_rules = rules(
+        spec("point", "index_up"),
+        poses={"index_up": [["above", 8, 6], ["below", 20, 18]]},
+    )
+    assert gesture_rules.num_predicates == 2
+    assert fired(gesture_rules, hand("gun"), 0.0) == ["point"]
+    assert fired(gesture_rules, hand("open"), 1.0) == []
+
+
+def test_shared_predicates_are_compiled_once():
+    gesture_rules = rules(
+        spec("a", [["above", 8, 6]]),
+        spec("b", [["above", 8, 6], ["dist_gt", 4, 8, 0.3]]),
+    )
+    assert gesture_rules.num_predicates == 2
+
+
+def test_first_matching_rule_in_group_wins():
+    gesture_rules = rules(
+        spec("first", "fist", group="g"),
+        spec("second", "fist", group="g"),
+        spec("other_group", "fist", group="h"),
+    )
+    assert fired(gesture_rules, hand("fist"), 0.0) == ["first", "other_group"]
+
+
+def test_hold_requires_continuous_pose():
+    gesture_rules = rules(spec("held", "fist", hold=1.0))
+    assert fired(gesture_rules, hand("fist"), 0.0) == []
+    assert fired(gesture_rules, hand("fist"), 0.5) == []
+    assert fired(gesture_rules, hand("open"), 0.8) == []
+    assert fired(gesture_rules, hand("fist"), 1.2) == []
+    assert fired(gesture_rules, hand("fist"), 2.2) == ["held"]
+
+
+def test_cooldown_limits_repeats():
+    gesture_rules = rules(spec("tap", "fist", cooldown=0.5))
+    times = np.arange(0.0, 1.2, 0.1)
+    hits = [t for t in times if fired(gesture_rules, hand("fist"), t)]
+    assert hits == pytest.approx([0.0, 0.5, 1.0])
+
+
+def test_modes_restrict_rules():
+    gesture_rules = rules(spec("tap", "fist", modes=["gesture"]))
+    assert fired(gesture_rules, hand("fist"), 0.0, mode=None) == []
+    assert fired(gesture_rules, hand("fist"), 0.1, mode="mouse") == []
+    assert fired(gesture_rules, hand("fist"), 0.2, mode="gesture") == ["tap"]
+
+
+def test_flags_are_rule_conditions():
+    gesture_rules = rules(spec("next", "swipe_right"), flags=["swipe_right"])
+    assert fired(gesture_rules, hand("open"), 0.0) == []
+    assert fired(gesture_rules, hand("open"), 0.1, flags={"swipe_right": True}) == ["next"]
+
+
+def test_batch_match_equals_single_frames():
+    gesture_rules = GestureRules.load()
+    batch = np.stack([hand(pose) for pose in ("open", "fist", "gun", "pinky", "v")])
+    expected = np.stack([gesture_rules.match(lm) for lm in batch])
+    assert np.array_equal(gesture_rules.match(batch), expected)
+
+
+@pytest.mark.parametrize("pose, mode, expected", [
+    ("gun", None, "mouse_mode"),
+    ("open", None, "gesture_mode"),
+    ("fist", "gesture", "volume_up"),
+    ("pinky", "gesture", "volume_down"),
+    ("v", "gesture", "v_command"),
+])
+def test_default_rules_map_poses(pose, mode, expected):
+    gesture_rules = GestureRules.load()
+    names = [rule.name for rule, ok in zip(gesture_rules.rules, gesture_rules.match(hand(pose))) if ok]
+    assert expected in names
+    fired(gesture_rules, hand(pose), 0.0, mode)
+    assert expected in fired(gesture_rules, hand(pose), 2.5, mode)
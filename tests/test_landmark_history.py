@@ -0,0 +1,104 @@
+import math
+import numpy as np
+import pytest
+from landmark_history import LandmarkHistory, MotionDetector
+from synthetic_hands import hand
+
+FPS = 30.0
+
+
+def recomputed_path(history, points):
+    """창에 남은 프레임으로 경로 길이를 처음부터 다시 계산"""
+    window = points[-history.count:]
+    return sum(math.dist(a, b) for a, b in zip(window, window[1:]))
+
+
+def run(detector, frames, t0=0.0):
+    return [detector.update(t0 + i / FPS, lm) for i, lm in enumerate(frames)]
+
+
+def tip_shifted(dx, dy=0.0):
+    lm = hand("open")
+    lm[8, 0] += dx
+    lm[8, 1] += dy
+    return lm
+
+
+def test_incremental_path_matches_recomputed():
+    rng = np.random.default_rng(1)
+    history = LandmarkHistory(size=5, max_gap=1.0)
+    points = []
+    for i in range(20):
+        cx, cy = rng.uniform(0.3, 0.7, 2)
+        lm = hand("open", cx=cx, cy=cy)
+        history.push(i / FPS, lm)
+        points.append(tuple(float(v) for v in lm[9, :2]))
+        assert len(history) == min(i + 1, 5)
+        assert history.path_length == pytest.approx(recomputed_path(history, points), abs=1e-6)
+    dx, dy = history.displacement()
+    assert dx == pytest.approx(points[-1][0] - points[-5][0], abs=1e-6)
+    assert history.duration() == pytest.approx(4 / FPS)
+
+
+def test_gap_clears_history():
+    history = LandmarkHistory(max_gap=0.25)
+    history.push(0.0, hand("open"))
+    history.push(0.1, hand("open", cx=0.6))
+    history.push(0.5, hand("open", cx=0.7))
+    assert len(history) == 1
+    assert history.path_length == 0.0
+
+
+def test_bent_counts_curled_index_frames():
+    history = LandmarkHistory(size=3)
+    history.push(0.0, hand("open"))
+    history.push(0.1, hand("fist"))
+    assert history.bent == 1
+    for t in (0.2, 0.3, 0.4):
+        history.push(t, hand("open"))
+    assert history.bent == 0
+
+
+@pytest.mark.parametrize("start, end, flag", [(0.3, 0.65, "swipe_right"), (0.65, 0.3, "swipe_left")])
+def test_fast_horizontal_move_is_swipe(start, end, flag):
+    detector = MotionDetector()
+    frames = [hand("open", cx=x) for x in np.linspace(start, end, 8)]
+    flags = run(detector, frames)
+    assert not any(f["flick"] for f in flags)
+    # 판정 뒤에는 기록을 비워서 같은 움직임을 다시 잡지 않음
+    fired = [i for i, f in enumerate(flags) if f[flag]]
+    assert len(fired) == 1
+
+
+def test_slow_move_is_not_swipe():
+    detector = MotionDetector()
+    frames = [hand("open", cx=x) for x in np.linspace(0.3, 0.65, 60)]
+    assert not any(f["swipe_right"] for f in run(detector, frames))
+
+
+def test_vertical_move_is_not_swipe():
+    detector = MotionDetector()
+    frames = [hand("open", cy=y) for y in np.linspace(0.3, 0.8, 8)]
+    flags = run(detector, frames)
+    assert not any(f["swipe_left"] or f["swipe_right"] for f in flags)
+
+
+def test_sideways_index_flick():
+    detector = MotionDetector()
+    frames = [hand("open")] * 3 + [tip_shifted(0.03 * k) for k in range(1, 5)]
+    flags = run(detector, frames)
+    assert any(f["flick"] for f in flags)
+
+
+def test_curling_index_is_not_flick():
+    detector = MotionDetector()
+    frames = [hand("open")] * 3 + [tip_shifted(0.0, 0.03 * k) for k in range(1, 5)]
+    flags = run(detector, frames)
+    assert not any(f["flick"] for f in flags)
+    assert detector.history.bent > 0
+
+
+def test_still_hand_sets_no_flags():
+    detector = MotionDetector()
+    flags = run(detector, [hand("open")] * 20)
+    assert not any(any(f.values()) for f in flags)
@@ -0,0 +1,58 @@
+import threading
+from pipeline import LatestSlot, Stage
+
+
+def test_get_returns_latest_and_drops_older():
+    dropped = []
+    slot = LatestSlot(on_drop=dropped.append)
+    slot.put(1)
+    slot.put(2)
+    slot.put(3)
+    assert slot.get(timeout=0.1) == 3
+    assert dropped == [1, 2]
+    assert slot.dropped == 2
+
+
+def test_get_times_out_when_empty():
+    assert LatestSlot().get(timeout=0.01) is None
+
+
+def test_close_wakes_waiting_get():
+    slot = LatestSlot()
+    result = []
+    thread = threading.Thread(target=lambda: result.append(slot.get(timeout=5.0)))
+    thread.start()
+    slot.close()
+    thread.join(timeout=1.0)
+    assert result == [None]
+    assert slot.closed
+
+
+def test_wait_taken_blocks_until_consumed():
+    slot = LatestSlot()
+    slot.put("frame")
+    assert not slot.wait_taken(timeout=0.01)
+    threading.Timer(0.05, slot.get).start()
+    assert slot.wait_taken(timeout=1.0)
+
+
+def test_stage_processes_until_source_closes():
+    slot = LatestSlot()
+    seen = []
+    stage = Stage("test", seen.append, slot)
+    stage.start()
+    slot.put("a")
+    slot.wait_taken(timeout=1.0)
+    slot.close()
+    stage.join(timeout=1.0)
+    assert seen == ["a"]
+    assert not stage.is_alive()
+    assert stage.stop_event.is_set()
+
+
+def test_producer_stage_stops_when_work_returns_false():
+    items = iter([True, True, False])
+    stage = Stage("producer", lambda: next(items))
+    stage.start()
+    stage.join(timeout=1.0)
+    assert not stage.is_alive()
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+from pipeline import LatestSlot
+from preprocess import BufferPool, Preprocessor, release
+
+
+class FakeCapture:
+    """cap.read(dst) 처럼 넘겨받은 버퍼에 기록하는 카메라 대역"""
+
+    def __init__(self, shape=(4, 6, 3)):
+        self.shape = shape
+        self.count = 0
+        self.fresh_arrays = 0
+
+    def read(self, image=None):
+        if image is None or image.shape != self.shape:
+            image = np.empty(self.shape, dtype=np.uint8)
+            self.fresh_arrays += 1
+        image[...] = 0
+        image[:, 0] = (self.count % 256, 0, 255)  # 왼쪽 열: BGR
+        self.count += 1
+        return True, image
+
+
+def test_release_returns_buffer_to_pool():
+    pool = BufferPool((2, 2, 3), size=2)
+    buffer = pool.acquire()
+    assert len(pool.free) == 1
+    buffer.release()
+    assert len(pool.free) == 2
+    assert pool.acquire() is buffer
+
+
+def test_retained_buffer_waits_for_last_release():
+    pool = BufferPool((2, 2, 3), size=1)
+    buffer = pool.acquire().retain()
+    buffer.release()
+    assert pool.free == []
+    buffer.release()
+    assert pool.free == [buffer]
+
+
+def test_double_release_raises():
+    pool = BufferPool((2, 2, 3), size=1)
+    buffer = pool.acquire()
+    buffer.release()
+    with pytest.raises(RuntimeError):
+        buffer.release()
+
+
+def test_empty_pool_grows_once():
+    pool = BufferPool((2, 2, 3), size=1)
+    held = [pool.acquire(), pool.acquire()]
+    assert pool.allocations == 2
+    for buffer in held:
+        buffer.release()
+    again = [pool.acquire(), pool.acquire()]
+    assert pool.allocations == 2
+    assert {id(b) for b in again} == {id(b) for b in held}
+
+
+def test_wrap_copies_into_pool_buffer():
+    pool = BufferPool((2, 2, 3), size=1)
+    image = np.arange(12, dtype=np.uint8).reshape(2, 2, 3)
+    buffer = pool.wrap(image)
+    assert np.array_equal(buffer.image, image)
+    assert buffer.image is not image
+
+
+def test_dropped_slot_items_release_their_buffers():
+    pool = BufferPool((2, 2, 3), size=3)
+    slot = LatestSlot(on_drop=release)
+    for i in range(3):
+        slot.put((i, pool.acquire()))
+    assert len(pool.free) == 2
+    _, latest = slot.get(timeout=0.1)
+    latest.release()
+    assert len(pool.free) == 3
+
+
+def test_preprocessor_reuses_buffers():
+    cap = FakeCapture()
+    pre = Preprocessor(pool_size=2)
+    for _ in range(10):
+        ok, buffer = pre.read(cap)
+        assert ok
+        buffer.release()
+    assert pre.reallocations == 1
+    assert pre.pool.allocations == 2
+    assert cap.fresh_arrays == 1
+
+
+def test_preprocessor_flips_and_converts_to_rgb():
+    pre = Preprocessor()
+    _, buffer = pre.read(FakeCapture())
+    # 좌우 반전으로 BGR (0, 0, 255) 였던 왼쪽 열이 오른쪽 열의 RGB (255, 0, 0) 가 됨
+    assert buffer.image[0, -1].tolist() == [255, 0, 0]
+    assert buffer.image[0, 0].tolist() == [0, 0, 0]
+
+
+def test_resolution_change_reallocates():
+    cap = FakeCapture()
+    pre = Preprocessor()
+    pre.read(cap)[1].release()
+    cap.shape = (8, 10, 3)
+    _, buffer = pre.read(cap)
+    assert buffer.image.shape == (8, 10, 3)
+    assert pre.reallocations == 2
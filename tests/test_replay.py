@@ -0,0 +1,58 @@
+from replay import ReplayDriver, ReplayUI
+from synthetic_hands import session
+
+
+def run(segments, **ui_options):
+    driver = ReplayDriver(session(segments), ui=ReplayUI(**ui_options))
+    stats = driver.run()
+    return driver, stats
+
+
+def presses(driver):
+    return [call[1] for call in driver.actuator.calls if call[0] == "press"]
+
+
+def test_gun_held_switches_to_mouse_mode():
+    driver, stats = run([("gun", 75)])
+    assert stats["processed"] == 75
+    assert driver.gesture_control.mode == "mouse"
+
+
+def test_short_gun_does_not_switch_mode():
+    driver, _ = run([("gun", 30)])
+    assert driver.gesture_control.mode is None
+
+
+def test_open_palm_switches_to_gesture_mode():
+    driver, _ = run([("open", 75)])
+    assert driver.gesture_control.mode == "gesture"
+    assert driver.ui.mode_text
+
+
+def test_fist_in_gesture_mode_presses_volume_up():
+    driver, _ = run([("open", 75), ("fist", 10)])
+    assert presses(driver) == ["volumeup"]
+
+
+def test_gestures_are_ignored_before_gesture_mode():
+    driver, _ = run([("fist", 30)])
+    assert presses(driver) == []
+
+
+def test_v_launches_configured_command():
+    driver, _ = run([("open", 75), ("v", 10)], vgesture_command="notepad")
+    assert ("launch", "notepad") in driver.actuator.calls
+
+
+def test_frames_without_hand_are_skipped():
+    _, stats = run([(None, 5), ("open", 5)])
+    assert stats["frames"] == 10
+    assert stats["hand_frames"] == 5
+
+
+def test_replay_is_deterministic():
+    segments = [("gun", 75), (None, 5), ("open", 75), ("fist", 30), ("pinky", 20), ("gun", 75)]
+    first, _ = run(segments)
+    second, _ = run(segments)
+    assert first.actuator.calls == second.actuator.calls
+    assert first.ui.logs == second.ui.logs
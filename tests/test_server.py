@@ -0,0 +1,121 @@
+import pytest
+import sever
+from settings_cache import SettingsCache
+from storage import Storage
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    storage = Storage(str(tmp_path / "users.db"))
+    monkeypatch.setattr(sever, "storage", storage)
+    monkeypatch.setattr(sever, "settings_cache", SettingsCache(check_interval=60.0))
+    sever.init_db()
+    client = sever.app.test_client()
+    response = client.post("/api/register", json={
+        "id": "user", "name": "이름", "phone": "010", "email": "a@b.c", "password": "pw",
+    })
+    assert response.status_code == 200
+    yield client
+    storage.close_all()
+
+
+@pytest.fixture
+def db_calls(monkeypatch):
+    calls = []
+    get_db = sever.get_db
+
+    def counting_get_db():
+        calls.append(1)
+        return get_db()
+
+    monkeypatch.setattr(sever, "get_db", counting_get_db)
+    return calls
+
+
+def test_get_settings_returns_defaults_with_etag(client):
+    response = client.get("/api/settings/user")
+    assert response.status_code == 200
+    assert response.get_json()["settings"]["user_id"] == "user"
+    assert response.headers["ETag"]
+
+
+def test_unknown_user_is_404(client):
+    assert client.get("/api/settings/nobody").status_code == 404
+
+
+def test_matching_etag_is_304(client):
+    etag = client.get("/api/settings/user").headers["ETag"]
+    response = client.get("/api/settings/user", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+    weak = client.get("/api/settings/user", headers={"If-None-Match": "W/" + etag})
+    assert weak.status_code == 304
+
+
+def test_cache_hit_and_304_skip_database(client, db_calls):
+    etag = client.get("/api/settings/user").headers["ETag"]
+    first = len(db_calls)
+    for _ in range(5):
+        assert client.get("/api/settings/user").status_code == 200
+        assert client.get("/api/settings/user", headers={"If-None-Match": etag}).status_code == 304
+    assert len(db_calls) == first
+
+
+def test_save_invalidates_cached_settings(client):
+    etag = client.get("/api/settings/user").headers["ETag"]
+    response = client.post("/api/settings/user", json={"sensitivity": 30})
+    assert response.status_code == 200
+    response = client.get("/api/settings/user", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.get_json()["settings"]["sensitivity"] == 30
+
+
+@pytest.mark.parametrize("data", [
+    {"sensitivity": 10 ** 30},
+    {"sensitivity": 9},
+    {"sensitivity": 51},
+    {"sensitivity": "빠르게"},
+    {"sensitivity": 1.5},
+    {"dark_mode": 2},
+    {"vgesture_command": 3},
+    ["sensitivity", 20],
+])
+def test_invalid_settings_are_400(client, data):
+    response = client.post("/api/settings/user", json=data)
+    assert response.status_code == 400
+    assert response.get_json()["status"] == "fail"
+
+
+def test_partial_save_keeps_other_settings(client):
+    client.post("/api/settings/user", json={"vgesture_command": "notepad", "sensitivity": 40})
+    client.post("/api/settings/user", json={"dark_mode": True})
+    settings = client.get("/api/settings/user").get_json()["settings"]
+    assert settings["vgesture_command"] == "notepad"
+    assert settings["sensitivity"] == 40
+    assert settings["dark_mode"] == 1
+
+
+def test_provision_requires_token(client, monkeypatch):
+    monkeypatch.delenv("PROVISION_TOKEN", raising=False)
+    assert client.post("/api/provision", json={}).status_code == 403
+    monkeypatch.setenv("PROVISION_TOKEN", "secret")
+    assert client.post("/api/provision", json={}, headers={"X-Provision-Token": "wrong"}).status_code == 403
+
+
+def test_provision_validates_everything_before_writing(client, monkeypatch):
+    monkeypatch.setenv("PROVISION_TOKEN", "secret")
+    headers = {"X-Provision-Token": "secret"}
+    response = client.post("/api/provision", headers=headers, json={
+        "users": [{"id": "lab1", "password": "pw"}],
+        "settings": [{"user_id": "lab1", "sensitivity": 10 ** 30}],
+    })
+    assert response.status_code == 400
+    assert client.get("/api/settings/lab1").status_code == 404
+
+    response = client.post("/api/provision", headers=headers, json={
+        "users": [{"id": "lab1", "password": "pw"}, {"id": "user", "password": "pw"}],
+        "settings": [{"user_id": "lab1", "sensitivity": 35}],
+    })
+    assert response.get_json()["created_users"] == 1
+    assert response.get_json()["existing_users"] == 1
+    assert client.get("/api/settings/lab1").get_json()["settings"]["sensitivity"] == 35
@@ -0,0 +1,94 @@
+from settings_cache import SettingsCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_counts_hits_and_misses():
+    cache = SettingsCache()
+    assert cache.get("a") is None
+    body, etag = cache.put("a", '{"x": 1}')
+    assert cache.get("a") == (body, etag)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_etag_follows_body():
+    cache = SettingsCache()
+    _, first = cache.put("a", '{"x": 1}')
+    _, same = cache.put("b", '{"x": 1}')
+    _, changed = cache.put("a", '{"x": 2}')
+    assert first == same
+    assert first != changed
+
+
+def test_least_recently_used_is_evicted():
+    cache = SettingsCache(maxsize=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")
+    cache.put("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_invalidate_one_user_or_all():
+    cache = SettingsCache()
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    cache.invalidate()
+    assert cache.get("b") is None
+
+
+def test_put_with_stale_generation_is_not_cached():
+    cache = SettingsCache()
+    generation = cache.generation
+    cache.invalidate("a")
+    entry = cache.put("a", "old", generation)
+    assert entry[0] == "old"
+    assert cache.get("a") is None
+    cache.put("a", "new", cache.generation)
+    assert cache.get("a")[0] == "new"
+
+
+def test_sync_clears_only_when_version_changes():
+    cache = SettingsCache()
+    cache.sync(1)
+    cache.put("a", "1")
+    cache.sync(1)
+    assert cache.get("a") is not None
+    cache.sync(2)
+    assert cache.get("a") is None
+
+
+def test_own_save_does_not_clear_on_next_sync():
+    cache = SettingsCache()
+    cache.sync(1)
+    cache.put("b", "2")
+    cache.invalidate("a", version=2)
+    cache.sync(2)
+    assert cache.get("b") is not None
+    # 다른 워커가 그 사이에 저장했으면 (버전이 둘 이상 올라감) 전체 삭제
+    cache.invalidate("a", version=4)
+    cache.sync(4)
+    assert cache.get("b") is None
+
+
+def test_sync_due_once_per_interval():
+    clock = FakeClock()
+    cache = SettingsCache(check_interval=0.5, clock=clock)
+    assert cache.sync_due()
+    assert not cache.sync_due()
+    clock.now = 0.4
+    assert not cache.sync_due()
+    clock.now = 0.5
+    assert cache.sync_due()
+    assert not cache.sync_due()
@@ -1,23 +1,38 @@
-import json
-import os
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QTabWidget, QFormLayout,
-    QLineEdit, QPushButton, QTextEdit, QStatusBar, QLabel,
-    QSlider, QHBoxLayout
+    QLineEdit, QPushButton, QPlainTextEdit, QStatusBar, QLabel,
+    QSlider, QHBoxLayout, QComboBox
 )
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QPixmap, QImage
+from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal
+from preview_presenter import PreviewPresenter, MAX_PREVIEW_SIZE
+from settings_store import SettingsStore
+from log_model import LogModel
 
 class GestureControlUI(QWidget):
-    def __init__(self):
+    # 설정 저장소의 백그라운드 스레드에서 받은 서버 설정을 GUI 스레드로 넘김
+    remote_settings_changed = pyqtSignal(dict)
+    # 제스처 스레드의 모드 전환을 GUI 스레드에서 라벨에 반영
+    mode_changed = pyqtSignal(str)
+
+    def __init__(self, log_model=None):
         super().__init__()
         self.setWindowTitle("PC Gesture Control")
         self.setGeometry(100, 100, 800, 700)  # 크기 키움
         self.settings_path = "settings.json"
         self.dark_mode = False
+        # 로그는 링 버퍼에 쌓고 타이머로 모아서 그림 (어느 스레드에서나 update_log 호출 가능)
+        self.log_model = log_model or LogModel()
+        self.mode_text = None
+        # 설정은 메모리에서 읽고, 파일 / 서버 저장은 모아서 백그라운드에서 처리
+        self.settings = SettingsStore(self.settings_path, on_error=lambda e: self.update_log(f"설정 동기화 실패: {e}"))
+        self.settings.on_remote_change = self.remote_settings_changed.emit
+        self.remote_settings_changed.connect(self.apply_settings)
+        self.mode_changed.connect(self.show_mode, Qt.ConnectionType.QueuedConnection)
         self.init_ui()
         self.load_settings()
+        self.connect_settings()
         self.fps = 0
+        self.metrics = None
 
         self.fade_in()
 
@@ -47,7 +62,10 @@ class GestureControlUI(QWidget):
         self.camera_label = QLabel("카메라 화면 준비 중...")
         self.camera_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.camera_label.setStyleSheet("background-color: #000; border: 1px solid #ccc;")
+        self.camera_label.setMinimumSize(*MAX_PREVIEW_SIZE)
         main_layout.addWidget(self.camera_label)
+        # 제스처 스레드에서 넘어온 프레임은 presenter 가 GUI 스레드에서 그림
+        self.preview = PreviewPresenter(self.camera_label, self)
 
         self.tabs = QTabWidget()
         self.settings_tab = QWidget()
@@ -89,6 +107,12 @@ class GestureControlUI(QWidget):
 
         form_layout.addRow("마우스 이동 감도:", sensitivity_layout)
 
+        self.cursor_filter_combo = QComboBox()
+        self.cursor_filter_combo.addItem("기본 (Lerp)", "lerp")
+        self.cursor_filter_combo.addItem("One Euro", "one_euro")
+        self.cursor_filter_combo.addItem("칼만 (속도 예측)", "kalman")
+        form_layout.addRow("커서 필터:", self.cursor_filter_combo)
+
         self.toggle_theme_btn = QPushButton("다크모드 켜기")
         self.toggle_theme_btn.clicked.connect(self.toggle_theme)
         form_layout.addRow("테마 설정:", self.toggle_theme_btn)
@@ -105,61 +129,103 @@ class GestureControlUI(QWidget):
 
     def init_log_tab(self):
         layout = QVBoxLayout()
-        self.log_text_edit = QTextEdit()
+        self.log_text_edit = QPlainTextEdit()
         self.log_text_edit.setReadOnly(True)
+        # 오래된 줄은 자동으로 지워서 문서가 끝없이 커지지 않게 함
+        self.log_text_edit.setMaximumBlockCount(self.log_model.capacity)
         layout.addWidget(self.log_text_edit)
         self.log_tab.setLayout(layout)
 
+        self.log_timer = QTimer(self)
+        self.log_timer.timeout.connect(self.flush_log)
+        self.log_timer.start(100)
+
+    def connect_settings(self):
+        # 위젯 값이 바뀌면 저장소 스냅샷만 갱신 (슬라이더를 끄는 동안에도 파일은 마지막에 한 번만 씀)
+        self.sensitivity_slider.valueChanged.connect(lambda value: self.settings.update(sensitivity=value))
+        self.cursor_filter_combo.currentIndexChanged.connect(
+            lambda _: self.settings.update(cursor_filter=self.cursor_filter_combo.currentData())
+        )
+        self.vgesture_command_line.editingFinished.connect(
+            lambda: self.settings.update(vgesture_command=self.vgesture_command_line.text())
+        )
+
     def save_settings(self):
-        settings = {
-            "vgesture_command": self.vgesture_command_line.text(),
-            "sensitivity": self.sensitivity_slider.value(),
-            "dark_mode": self.dark_mode
-        }
-        with open(self.settings_path, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=4)
-
-        sensitivity_percent = int((self.sensitivity_slider.value() / 50) * 100)
+        self.settings.update(
+            vgesture_command=self.vgesture_command_line.text(),
+            sensitivity=self.sensitivity_slider.value(),
+            cursor_filter=self.get_cursor_filter(),
+            dark_mode=self.dark_mode,
+        )
+        # 파일 / 서버 저장은 저장소 스레드가 처리하므로 여기서 기다리지 않음
+        settings = self.settings.snapshot()
+
+        sensitivity_percent = int((settings["sensitivity"] / 50) * 100)
         self.update_log(f"설정 저장됨: V자 앱 명령 - {settings['vgesture_command']}, 감도 - {sensitivity_percent}%, 다크모드 - {settings['dark_mode']}")
 
     def load_settings(self):
-        if not os.path.exists(self.settings_path):
-            return
-
-        with open(self.settings_path, "r", encoding="utf-8") as f:
-            settings = json.load(f)
-
-        self.vgesture_command_line.setText(settings.get("vgesture_command", ""))
-        self.sensitivity_slider.setValue(settings.get("sensitivity", 20))
-
-        if settings.get("dark_mode", False):
-            self.apply_dark_theme()
-            self.dark_mode = True
-            self.toggle_theme_btn.setText("라이트모드 켜기")
+        self.apply_settings(self.settings.snapshot())
+
+    def apply_settings(self, settings):
+        """저장소의 값을 위젯에 반영 (주어진 항목만)"""
+        if "vgesture_command" in settings:
+            self.vgesture_command_line.setText(settings["vgesture_command"])
+        if "sensitivity" in settings:
+            self.sensitivity_slider.setValue(settings["sensitivity"])
+            self.update_sensitivity_label()
+        if "cursor_filter" in settings:
+            self.set_cursor_filter(settings["cursor_filter"])
+
+        if "dark_mode" in settings and settings["dark_mode"] != self.dark_mode:
+            if settings["dark_mode"]:
+                self.apply_dark_theme()
+                self.toggle_theme_btn.setText("라이트모드 켜기")
+            else:
+                self.apply_light_theme()
+                self.toggle_theme_btn.setText("다크모드 켜기")
+            self.dark_mode = settings["dark_mode"]
 
     def reset_all_settings(self):
         self.vgesture_command_line.clear()
         self.sensitivity_slider.setValue(20)
         self.update_sensitivity_label()
+        self.set_cursor_filter("lerp")
 
         if self.dark_mode:
             self.apply_light_theme()
             self.dark_mode = False
             self.toggle_theme_btn.setText("다크모드 켜기")
 
-        if os.path.exists(self.settings_path):
-            os.remove(self.settings_path)
+        self.settings.reset()
 
         self.update_log("🛠️ 모든 설정 초기화 완료")
 
-    def update_log(self, text):
-        self.log_text_edit.append(text)
+    def update_log(self, text, **fields):
+        self.log_model.append(text, mode=self.mode_text, **fields)
+
+    def flush_log(self):
+        """타이머마다 쌓인 로그를 한 번에 추가"""
+        entries = self.log_model.take_pending()
+        if entries:
+            self.log_text_edit.appendPlainText("\n".join(text for _, text, _ in entries))
 
     def update_status(self):
-        self.fps += 1
-        self.fps_label.setText(f"FPS: {self.fps}")
+        if self.metrics is None:
+            return
+        # 실제 파이프라인 FPS 와 캡처~동작 지연 백분위를 표시
+        self.fps_label.setText(self.metrics.status_text())
+        snap = self.metrics.snapshot()
+        self.fps_label.setToolTip("\n".join(
+            f"{stage}: p50 {values['p50_ms']:.1f}ms / p99 {values['p99_ms']:.1f}ms"
+            for stage, values in snap["stages"].items()
+        ))
 
     def update_mode(self, mode_text):
+        # 제스처 스레드에서 호출됨: 로그용 값만 바꾸고 라벨은 시그널로 GUI 스레드에서 갱신
+        self.mode_text = mode_text
+        self.mode_changed.emit(mode_text)
+
+    def show_mode(self, mode_text):
         self.mode_label.setText(f"모드: {mode_text}")
 
     def update_sensitivity_label(self):
@@ -173,18 +239,32 @@ class GestureControlUI(QWidget):
         self.update_log("감도 초기화 (40%) 완료")
 
     def get_sensitivity(self):
-        return self.sensitivity_slider.value() / 100.0
+        # 제스처 스레드에서 매 프레임 호출되므로 위젯 대신 저장소 스냅샷에서 읽음
+        return self.settings.get("sensitivity") / 100.0
+
+    def get_cursor_filter(self):
+        return self.settings.get("cursor_filter")
+
+    def get_setting(self, name):
+        """제스처 스레드에서 읽는 설정값 (위젯 대신 저장소 스냅샷)"""
+        return self.settings.snapshot().get(name, "")
+
+    def set_cursor_filter(self, name):
+        index = self.cursor_filter_combo.findData(name)
+        self.cursor_filter_combo.setCurrentIndex(max(index, 0))
 
     def toggle_theme(self):
         if not self.dark_mode:
             self.apply_dark_theme()
             self.dark_mode = True
             self.toggle_theme_btn.setText("라이트모드 켜기")
+            self.settings.update(dark_mode=True)
             self.update_log("🌙 다크모드 적용")
         else:
             self.apply_light_theme()
             self.dark_mode = False
             self.toggle_theme_btn.setText("다크모드 켜기")
+            self.settings.update(dark_mode=False)
             self.update_log("☀️ 라이트모드 복구")
 
     def apply_dark_theme(self):
@@ -195,7 +275,7 @@ class GestureControlUI(QWidget):
             QLineEdit { background-color: #444; color: #fff; border: 1px solid #666; }
             QSlider::groove:horizontal { background: #444; }
             QSlider::handle:horizontal { background: #bbb; border: 1px solid #999; width: 10px; margin: -2px 0; }
-            QTextEdit { background-color: #333; color: #ddd; }
+            QPlainTextEdit { background-color: #333; color: #ddd; }
             QTabWidget::pane { border: 1px solid #444; }
             QTabBar::tab { background: #333; color: #ccc; padding: 5px; }
             QTabBar::tab:selected { background: #555; color: white; }
@@ -209,7 +289,7 @@ class GestureControlUI(QWidget):
             QLineEdit { background-color: #ffffff; color: #000000; border: 1px solid #ccc; padding: 5px; }
             QSlider::groove:horizontal { background: #ddd; }
             QSlider::handle:horizontal { background: #4CAF50; border: 1px solid #4CAF50; width: 12px; margin: -2px 0; }
-            QTextEdit { background-color: #ffffff; color: #000; }
+            QPlainTextEdit { background-color: #ffffff; color: #000; }
             QTabWidget::pane { border: 1px solid #ccc; }
             QTabBar::tab { background: #e0e0e0; color: #333; padding: 5px; }
             QTabBar::tab:selected { background: #4CAF50; color: white; }
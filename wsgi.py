@@ -0,0 +1,4 @@
+# 배포용 진입점: gunicorn wsgi:app
+from sever import app, init_db
+
+init_db()